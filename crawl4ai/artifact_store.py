@@ -0,0 +1,257 @@
+"""Content-addressed storage for binary crawl artifacts: screenshots, PDFs and downloads."""
+
+import os
+import uuid
+import zlib
+import base64
+import asyncio
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+
+import aiofiles
+from pydantic import BaseModel
+
+CHUNK_SIZE = 1024 * 1024
+# Media types compressed by default. Images and archives are already compressed.
+COMPRESSED_MEDIA_TYPES = {"application/pdf", "text/html", "application/json"}
+
+
+def guess_image_type(data: bytes) -> str:
+    """Guess the media type of an encoded image from its magic bytes."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:2] == b"BM":
+        return "image/bmp"
+    return "image/png"
+
+
+class ArtifactHandle(BaseModel):
+    """
+    A lightweight reference to an artifact in an ArtifactStore. Only the metadata lives
+    in memory; the content is read from disk when asked for.
+
+    Attributes:
+        digest (str): SHA-256 of the uncompressed content.
+        media_type (str): MIME type of the content.
+        size (int): Size of the uncompressed content in bytes.
+        path (str): Location of the stored file.
+        compressed (bool): Whether the file is gzip-compressed.
+    """
+
+    digest: str
+    media_type: str = "application/octet-stream"
+    size: int = 0
+    path: str
+    compressed: bool = False
+
+    async def read(self) -> bytes:
+        """Load the whole content."""
+        async with aiofiles.open(self.path, "rb") as f:
+            data = await f.read()
+        if self.compressed:
+            data = await asyncio.to_thread(zlib.decompress, data, 31)
+        return data
+
+    async def read_base64(self) -> str:
+        """Load the content as a base64 string, as CrawlResult.screenshot holds it."""
+        data = await self.read()
+        return await asyncio.to_thread(lambda: base64.b64encode(data).decode("utf-8"))
+
+    async def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Stream the content without loading it at once."""
+        decompressor = zlib.decompressobj(31) if self.compressed else None
+        async with aiofiles.open(self.path, "rb") as f:
+            while True:
+                chunk = await f.read(chunk_size)
+                if not chunk:
+                    break
+                yield decompressor.decompress(chunk) if decompressor else chunk
+        if decompressor:
+            tail = decompressor.flush()
+            if tail:
+                yield tail
+
+
+class ArtifactStore:
+    """
+    Stores binary artifacts on disk under the SHA-256 of their content, so identical
+    screenshots or files are kept once. Writes are streamed chunk by chunk to a
+    temporary file, then moved into place atomically.
+
+    Attributes:
+        root (str): Directory holding the artifacts, sharded by the first two hex digits.
+        compressed_media_types (set): Media types gzip-compressed unless told otherwise.
+
+        Methods:
+            put(data, media_type, compress): Stores bytes or an async stream of bytes.
+            put_file(path, media_type, compress): Stores a file on disk, e.g. a download.
+            get(digest): Returns a handle for a stored artifact.
+    """
+
+    def __init__(self, root: Optional[str] = None, compressed_media_types=None):
+        self.root = root or os.path.join(
+            os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai", "artifacts"
+        )
+        self.compressed_media_types = (
+            COMPRESSED_MEDIA_TYPES
+            if compressed_media_types is None
+            else set(compressed_media_types)
+        )
+        # The directory is created on the first write, not when the module is imported
+        self._root_created = False
+
+    def _ensure_root(self):
+        if not self._root_created:
+            os.makedirs(self.root, exist_ok=True)
+            self._root_created = True
+
+    def _path(self, digest: str, compressed: bool) -> str:
+        return os.path.join(
+            self.root, digest[:2], digest + (".gz" if compressed else "")
+        )
+
+    async def put(
+        self,
+        data: Union[bytes, AsyncIterable[bytes]],
+        media_type: str = "application/octet-stream",
+        compress: Optional[bool] = None,
+    ) -> ArtifactHandle:
+        """
+        Store an artifact.
+
+        Args:
+            data (bytes or AsyncIterable[bytes]): The content, or a stream of chunks.
+            media_type (str): MIME type of the content.
+            compress (bool or None): Whether to gzip the stored file. None decides by
+                                     media type.
+
+        Returns:
+            ArtifactHandle: The handle of the stored artifact.
+        """
+        if compress is None:
+            compress = media_type in self.compressed_media_types
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # Hashing and compressing a buffer in memory is CPU work, keep it off the loop
+            return await asyncio.to_thread(
+                self._put_bytes, bytes(data), media_type, compress
+            )
+
+        hasher = hashlib.sha256()
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+        size = 0
+        self._ensure_root()
+        tmp_path = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in data:
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    await f.write(compressor.compress(chunk) if compressor else chunk)
+                if compressor:
+                    await f.write(compressor.flush())
+            return self._commit(tmp_path, hasher.hexdigest(), media_type, size, compress)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _put_bytes(self, data: bytes, media_type: str, compress: bool) -> ArtifactHandle:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest, compress)
+        if os.path.exists(path):
+            return ArtifactHandle(
+                digest=digest, media_type=media_type, size=len(data), path=path, compressed=compress
+            )
+
+        self._ensure_root()
+        tmp_path = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        try:
+            with open(tmp_path, "wb") as f:
+                if compress:
+                    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+                    f.write(compressor.compress(data))
+                    f.write(compressor.flush())
+                else:
+                    f.write(data)
+            return self._commit(tmp_path, digest, media_type, len(data), compress)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _commit(
+        self, tmp_path: str, digest: str, media_type: str, size: int, compress: bool
+    ) -> ArtifactHandle:
+        """Move a fully written temporary file to its content address."""
+        path = self._path(digest, compress)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        return ArtifactHandle(
+            digest=digest, media_type=media_type, size=size, path=path, compressed=compress
+        )
+
+    async def put_file(
+        self,
+        path: str,
+        media_type: Optional[str] = None,
+        compress: Optional[bool] = None,
+    ) -> ArtifactHandle:
+        """
+        Store a file from disk, streaming it in chunks.
+
+        Args:
+            path (str): Path of the file to store.
+            media_type (str or None): MIME type, guessed from the file name if None.
+            compress (bool or None): Whether to gzip the stored file. None decides by
+                                     media type.
+
+        Returns:
+            ArtifactHandle: The handle of the stored artifact.
+        """
+        if media_type is None:
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        async def chunks():
+            async with aiofiles.open(path, "rb") as f:
+                while True:
+                    chunk = await f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+
+        return await self.put(chunks(), media_type, compress)
+
+    def get(
+        self, digest: str, media_type: str = "application/octet-stream"
+    ) -> Optional[ArtifactHandle]:
+        """
+        Look up a stored artifact by digest.
+
+        Returns:
+            ArtifactHandle or None: The handle, or None if nothing is stored under digest.
+        """
+        for compressed in (False, True):
+            path = self._path(digest, compressed)
+            if os.path.exists(path):
+                size = os.path.getsize(path)
+                if compressed:
+                    # The gzip trailer ends with the uncompressed size modulo 2**32
+                    with open(path, "rb") as f:
+                        f.seek(-4, os.SEEK_END)
+                        size = int.from_bytes(f.read(4), "little")
+                return ArtifactHandle(
+                    digest=digest,
+                    media_type=media_type,
+                    size=size,
+                    path=path,
+                    compressed=compressed,
+                )
+        return None
+
+
+# Create a singleton instance
+artifact_store = ArtifactStore()
@@ -0,0 +1,355 @@
+"""Shared on-disk cache of static subresources, served to browser contexts through routes."""
+
+import os
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiofiles
+
+from .config import ASSET_CACHE_MAX_SIZE, ASSET_CACHE_VARY_SIZE
+
+# Resource types served from the cache. Documents are always fetched, and media is
+# left alone because it is loaded with range requests.
+CACHEABLE_RESOURCE_TYPES = {"stylesheet", "script", "font", "image"}
+# Response headers that describe the transfer rather than the content. Bodies are
+# stored decoded, so they must not be replayed.
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+# Upper bound of the heuristic freshness of responses without explicit expiry
+MAX_HEURISTIC_TTL = 86400
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into a dict of lower-case directives."""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Dict[str, str], now: Optional[float] = None) -> float:
+    """
+    Compute how many seconds a response may be served from a shared cache.
+
+    Follows the rules of a shared HTTP cache: s-maxage, then max-age, then Expires, then a
+    heuristic of 10% of the time since Last-Modified. The Age header is deducted.
+
+    Args:
+        headers (Dict[str, str]): The response headers, with lower-case names.
+        now (float): The current time, defaults to time.time().
+
+    Returns:
+        float: The remaining freshness in seconds, 0 or less if the response is stale.
+    """
+    now = time.time() if now is None else now
+    directives = parse_cache_control(headers.get("cache-control"))
+    date = _parse_date(headers.get("date")) or now
+
+    lifetime = None
+    for directive in ("s-maxage", "max-age"):
+        if directives.get(directive):
+            try:
+                lifetime = int(directives[directive])
+                break
+            except ValueError:
+                pass
+    if lifetime is None and "expires" in headers:
+        expires = _parse_date(headers["expires"])
+        lifetime = expires - date if expires else 0
+    if lifetime is None:
+        last_modified = _parse_date(headers.get("last-modified"))
+        lifetime = min((date - last_modified) / 10, MAX_HEURISTIC_TTL) if last_modified else 0
+
+    try:
+        age = int(headers.get("age", 0))
+    except ValueError:
+        age = 0
+    return lifetime - age
+
+
+class AssetCache:
+    """
+    An HTTP cache for static subresources (stylesheets, scripts, fonts, images) shared by
+    every browser context and persisted on disk across runs.
+
+    Each browser context starts with an empty HTTP cache, so site-wide bundles are
+    otherwise downloaded again for every context. ContextRouteHandler passes cacheable
+    requests to the cache, which answers from disk while a stored response is fresh, and
+    otherwise fetches, serves and stores the response.
+
+    Entries are keyed by URL and the values of the request headers named by the
+    response's Vary header. Only GET requests without credentials and successful
+    responses that Cache-Control allows a shared cache to store are kept. Stale entries
+    are not revalidated, they are fetched again.
+
+    Attributes:
+        root (str): Directory holding the entries, sharded by the first two hex digits.
+        max_size (int): Maximum size of the stored bodies in bytes. Least recently used
+                        entries are dropped beyond it.
+        stats (dict): Counts of hits, misses and stored responses.
+
+        Methods:
+            handle(route): Serves a Playwright route from the cache, or fetches and stores it.
+            lookup(url, request_headers): Returns the stored response for a request.
+            store(url, request_headers, status, headers, body): Stores a response.
+            prune(): Drops expired entries and trims the cache to max_size.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_size: int = ASSET_CACHE_MAX_SIZE):
+        self.root = root or os.path.join(
+            os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai", "asset_cache"
+        )
+        self.max_size = max_size
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+        # Vary header names by URL, as last stored, in LRU order. The .vary files on disk
+        # are the source of truth, this only saves reading them again.
+        self._vary: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._size: Optional[int] = None
+        self._pruning: Optional[asyncio.Task] = None
+        os.makedirs(self.root, exist_ok=True)
+
+    @staticmethod
+    def is_cacheable_request(request) -> bool:
+        """Whether a Playwright request may be served from the cache."""
+        return request.method == "GET" and request.resource_type in CACHEABLE_RESOURCE_TYPES
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.root, key[:2], key + suffix)
+
+    def _variant_key(self, url: str, vary: List[str], request_headers: Dict[str, str]) -> str:
+        values = "\n".join(f"{name}:{request_headers.get(name, '')}" for name in vary)
+        return self._hash(f"{url}\n{values}")
+
+    def _remember_vary(self, url: str, vary: List[str]):
+        self._vary[url] = vary
+        self._vary.move_to_end(url)
+        while len(self._vary) > ASSET_CACHE_VARY_SIZE:
+            self._vary.popitem(last=False)
+
+    async def _read_vary(self, url: str) -> Optional[List[str]]:
+        vary = self._vary.get(url)
+        if vary is not None:
+            self._vary.move_to_end(url)
+            return vary
+        try:
+            async with aiofiles.open(
+                self._path(self._hash(url), ".vary"), "r", encoding="utf-8"
+            ) as f:
+                vary = json.loads(await f.read())
+        except (OSError, ValueError):
+            return None
+        self._remember_vary(url, vary)
+        return vary
+
+    async def lookup(
+        self, url: str, request_headers: Dict[str, str]
+    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        Find a fresh stored response for a request.
+
+        Args:
+            url (str): The request URL.
+            request_headers (Dict[str, str]): The request headers, with lower-case names.
+
+        Returns:
+            Tuple[int, Dict[str, str], bytes] or None: Status, headers and body, or None.
+        """
+        vary = await self._read_vary(url)
+        if vary is None:
+            return None
+        key = self._variant_key(url, vary, request_headers)
+        try:
+            async with aiofiles.open(self._path(key, ".json"), "r", encoding="utf-8") as f:
+                meta = json.loads(await f.read())
+            if meta["expires"] <= time.time():
+                return None
+            async with aiofiles.open(self._path(key, ".body"), "rb") as f:
+                body = await f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        # The modification time of the body tracks recency for pruning
+        try:
+            await asyncio.to_thread(os.utime, self._path(key, ".body"))
+        except OSError:
+            pass
+        return meta["status"], meta["headers"], body
+
+    async def store(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> bool:
+        """
+        Store a response if HTTP caching rules allow a shared cache to.
+
+        Args:
+            url (str): The request URL.
+            request_headers (Dict[str, str]): The request headers, with lower-case names.
+            status (int): The response status.
+            headers (Dict[str, str]): The response headers, with lower-case names.
+            body (bytes): The decoded response body.
+
+        Returns:
+            bool: Whether the response was stored.
+        """
+        if status != 200 or "authorization" in request_headers or "set-cookie" in headers:
+            return False
+        directives = parse_cache_control(headers.get("cache-control"))
+        if directives.keys() & {"no-store", "no-cache", "private"}:
+            return False
+        vary = sorted(
+            {v.strip().lower() for v in headers.get("vary", "").split(",") if v.strip()}
+        )
+        if "*" in vary:
+            return False
+        ttl = freshness_lifetime(headers)
+        if ttl <= 0 or len(body) > self.max_size:
+            return False
+
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k not in HOP_BY_HOP_HEADERS
+            },
+            "expires": time.time() + ttl,
+        }
+        key = self._variant_key(url, vary, request_headers)
+        await asyncio.to_thread(self._write, url, key, vary, meta, body)
+        self._remember_vary(url, vary)
+        self.stats["stored"] += 1
+
+        if self._size is not None:
+            self._size += len(body)
+        if (self._size is None or self._size > self.max_size) and not self._pruning:
+            self._pruning = asyncio.create_task(self.prune())
+        return True
+
+    def _write_atomic(self, path: str, data: bytes):
+        tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _write(self, url: str, key: str, vary: List[str], meta: dict, body: bytes):
+        url_key = self._hash(url)
+        for path in (self._path(key, ""), self._path(url_key, "")):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # The body goes first, so a reader never finds metadata without its body
+        self._write_atomic(self._path(key, ".body"), body)
+        self._write_atomic(self._path(key, ".json"), json.dumps(meta).encode("utf-8"))
+        self._write_atomic(self._path(url_key, ".vary"), json.dumps(vary).encode("utf-8"))
+
+    async def prune(self):
+        """Drop expired entries, then the least recently used ones beyond max_size."""
+        try:
+            self._size = await asyncio.to_thread(self._prune)
+        finally:
+            self._pruning = None
+
+    def _prune(self) -> int:
+        now = time.time()
+        entries = []
+        for meta_path in Path(self.root).glob("*/*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    expires = json.load(f)["expires"]
+                stat = body_path.stat()
+            except (OSError, ValueError, KeyError):
+                continue
+            if expires <= now:
+                self._remove(meta_path, body_path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, meta_path, body_path))
+
+        size = sum(entry[1] for entry in entries)
+        entries.sort(key=lambda entry: entry[0])
+        # Trim to 90% so that the next writes do not prune again right away
+        for _, entry_size, meta_path, body_path in entries:
+            if size <= self.max_size * 0.9:
+                break
+            self._remove(meta_path, body_path)
+            size -= entry_size
+        return size
+
+    @staticmethod
+    def _remove(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def handle(self, route):
+        """
+        Serve a Playwright route from the cache, or fetch it, serve it and store it.
+
+        Args:
+            route (Route): The Playwright route of a cacheable request
+        """
+        request = route.request
+        request_headers = await request.all_headers()
+        if "authorization" in request_headers:
+            await route.fallback()
+            return
+
+        cached = await self.lookup(request.url, request_headers)
+        if cached:
+            self.stats["hits"] += 1
+            status, headers, body = cached
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = await route.fetch()
+        except Exception:
+            # Let the browser load it and report the error itself
+            await route.fallback()
+            return
+        await route.fulfill(response=response)
+
+        try:
+            body = await response.body()
+            await self.store(
+                request.url,
+                request_headers,
+                response.status,
+                {name.lower(): value for name, value in response.headers.items()},
+                body,
+            )
+        except Exception:
+            pass
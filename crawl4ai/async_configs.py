@@ -3,6 +3,7 @@ from .config import (
     IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
     SCREENSHOT_HEIGHT_TRESHOLD,
     PAGE_TIMEOUT,
+    IFRAME_TIMEOUT,
     IMAGE_SCORE_THRESHOLD,
     SOCIAL_MEDIA_DOMAINS,
 )
@@ -15,6 +16,24 @@ from .content_filter_strategy import RelevantContentFilter, BM25ContentFilter, L
 from .content_scraping_strategy import ContentScrapingStrategy, WebScrapingStrategy
 from typing import Optional, Union, List
 from .cache_context import CacheMode
+import hashlib
+import json
+
+
+# Fields of CrawlerRunConfig that change how a browser context is created or set up.
+# Configs that agree on all of them share one browser context.
+CONTEXT_SIGNATURE_FIELDS = (
+    "proxy_config",
+    "override_navigator",
+    "simulate_user",
+    "magic",
+    "user_agent",
+    "user_agent_mode",
+    "user_agent_generator_config",
+    "block_resources",
+    "block_third_party",
+    "block_domains",
+)
 
 
 class BrowserConfig:
@@ -74,6 +93,39 @@ class BrowserConfig:
         light_mode (bool): Disables certain background features for performance gains. Default: False.
         extra_args (list): Additional command-line arguments passed to the browser.
                            Default: [].
+        page_pool_size (int): Number of idle pages kept per context for reuse across non-session crawls.
+                              0 disables pooling and opens a fresh page per crawl. Page routes are removed
+                              between crawls, but hooks that register page.on() handlers must remove them.
+                              Default: 0.
+        page_max_uses (int): Number of crawls a pooled page serves before it is closed and replaced.
+                             Default: 50.
+        browser_pool_size (int): Number of browser instances to run side by side. Pages are assigned to the
+                                 least loaded instance. Ignored for managed browsers. Default: 1.
+        max_pages_per_browser (int): Recycle a pooled browser after it has served this many pages.
+                                     0 means no limit. Default: 0.
+        max_browser_memory_mb (int): Recycle a pooled browser once its processes use more resident memory
+                                     than this (Chromium only). 0 means no limit. Default: 0.
+        max_contexts (int): Maximum number of browser contexts cached per browser, one per distinct crawler
+                            config. Least recently used idle contexts are closed first. 0 means no limit.
+                            Default: 10.
+        context_ttl (int): Seconds an unused cached context is kept open before it is closed. 0 keeps idle
+                           contexts until evicted. Default: 300.
+        session_ttl (int): Seconds a session (session_id) is kept after its last use before its page is
+                           closed. 0 keeps sessions until they are killed. Default: 1800.
+        max_sessions (int): Maximum number of open sessions per browser. Opening one more closes the least
+                            recently used session that is not in use; if every session is in use, it
+                            waits for one to be released. 0 means no limit. Default: 0.
+        crash_retries (int): Number of times a crawl is retried on a fresh page when the browser or the
+                             page's renderer crashes during it. Default: 1.
+        max_crashes (int): Number of browser crashes within crash_window after which crashed browsers are
+                           no longer relaunched, failing crawls instead, until they age out of the window.
+                           0 means no limit. Default: 3.
+        crash_window (int): Length in seconds of the window max_crashes counts crashes in. Default: 300.
+        blocklist_paths (list): Paths of local hosts files or EasyList-style filter lists. Requests matching
+                                them (ads, trackers) are aborted in every context. Default: None.
+        asset_cache (bool): Serve static subresources (stylesheets, scripts, fonts, images) to every context
+                            from a shared on-disk HTTP cache that persists across runs. Default: False.
+        asset_cache_dir (str or None): Directory of the asset cache. Default: None (~/.crawl4ai/asset_cache).
     """
 
     def __init__(
@@ -112,6 +164,21 @@ class BrowserConfig:
         extra_args: list = None,
         debugging_port: int = 9222,
         host: str = "localhost",
+        page_pool_size: int = 0,
+        page_max_uses: int = 50,
+        browser_pool_size: int = 1,
+        max_pages_per_browser: int = 0,
+        max_browser_memory_mb: int = 0,
+        max_contexts: int = 10,
+        context_ttl: int = 300,
+        session_ttl: int = 1800,
+        max_sessions: int = 0,
+        crash_retries: int = 1,
+        max_crashes: int = 3,
+        crash_window: int = 300,
+        blocklist_paths: List[str] = None,
+        asset_cache: bool = False,
+        asset_cache_dir: str = None,
     ):
         self.browser_type = browser_type
         self.headless = headless
@@ -144,6 +211,21 @@ class BrowserConfig:
         self.sleep_on_close = sleep_on_close
         self.verbose = verbose
         self.debugging_port = debugging_port
+        self.page_pool_size = page_pool_size
+        self.page_max_uses = page_max_uses
+        self.browser_pool_size = browser_pool_size
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_browser_memory_mb = max_browser_memory_mb
+        self.max_contexts = max_contexts
+        self.context_ttl = context_ttl
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.crash_retries = crash_retries
+        self.max_crashes = max_crashes
+        self.crash_window = crash_window
+        self.blocklist_paths = blocklist_paths or []
+        self.asset_cache = asset_cache
+        self.asset_cache_dir = asset_cache_dir
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -192,6 +274,21 @@ class BrowserConfig:
             text_mode=kwargs.get("text_mode", False),
             light_mode=kwargs.get("light_mode", False),
             extra_args=kwargs.get("extra_args", []),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_max_uses=kwargs.get("page_max_uses", 50),
+            browser_pool_size=kwargs.get("browser_pool_size", 1),
+            max_pages_per_browser=kwargs.get("max_pages_per_browser", 0),
+            max_browser_memory_mb=kwargs.get("max_browser_memory_mb", 0),
+            max_contexts=kwargs.get("max_contexts", 10),
+            context_ttl=kwargs.get("context_ttl", 300),
+            session_ttl=kwargs.get("session_ttl", 1800),
+            max_sessions=kwargs.get("max_sessions", 0),
+            crash_retries=kwargs.get("crash_retries", 1),
+            max_crashes=kwargs.get("max_crashes", 3),
+            crash_window=kwargs.get("crash_window", 300),
+            blocklist_paths=kwargs.get("blocklist_paths"),
+            asset_cache=kwargs.get("asset_cache", False),
+            asset_cache_dir=kwargs.get("asset_cache_dir"),
         )
 
     def to_dict(self):
@@ -224,6 +321,21 @@ class BrowserConfig:
             "sleep_on_close": self.sleep_on_close,
             "verbose": self.verbose,
             "debugging_port": self.debugging_port,
+            "page_pool_size": self.page_pool_size,
+            "page_max_uses": self.page_max_uses,
+            "browser_pool_size": self.browser_pool_size,
+            "max_pages_per_browser": self.max_pages_per_browser,
+            "max_browser_memory_mb": self.max_browser_memory_mb,
+            "max_contexts": self.max_contexts,
+            "context_ttl": self.context_ttl,
+            "session_ttl": self.session_ttl,
+            "max_sessions": self.max_sessions,
+            "crash_retries": self.crash_retries,
+            "max_crashes": self.max_crashes,
+            "crash_window": self.crash_window,
+            "blocklist_paths": self.blocklist_paths,
+            "asset_cache": self.asset_cache,
+            "asset_cache_dir": self.asset_cache_dir,
         }
 
     def clone(self, **kwargs):
@@ -305,12 +417,17 @@ class CrawlerRunConfig:
                           Default: "domcontentloaded".
         page_timeout (int): Timeout in ms for page operations like navigation.
                             Default: 60000 (60 seconds).
-        wait_for (str or None): A CSS selector or JS condition to wait for before extracting content.
-                                Default: None.
+        wait_for (str or None): A CSS selector or JS condition to wait for before extracting content, or
+                                "quiescent" to wait until the DOM and network have been idle for
+                                quiescence_idle_time seconds. Default: None.
+        quiescence_idle_time (float): Seconds without DOM mutations or in-flight requests after which a page
+                                      is quiescent, used when wait_for="quiescent". Default: 0.5.
+        quiescence_timeout (float): Hard cap in seconds on waiting for quiescence. Default: 10.0.
         wait_for_images (bool): If True, wait for images to load before extracting content.
                                 Default: False.
-        delay_before_return_html (float): Delay in seconds before retrieving final HTML.
-                                          Default: 0.1.
+        delay_before_return_html (float): Delay in seconds before retrieving final HTML. None waits
+                                          DELAY_BEFORE_RETURN_HTML (0.1), or not at all with
+                                          wait_for="quiescent". Default: None.
         mean_delay (float): Mean base delay between requests when calling arun_many.
                             Default: 0.1.
         max_range (float): Max random additional delay range for requests in arun_many.
@@ -327,10 +444,24 @@ class CrawlerRunConfig:
                                        Default: True.
         scan_full_page (bool): If True, scroll through the entire page to load all content.
                                Default: False.
-        scroll_delay (float): Delay in seconds between scroll steps if scan_full_page is True.
-                              Default: 0.2.
+        scroll_delay (float): If scan_full_page is True, how long in seconds to wait at the bottom of the page
+                              for infinite scroll content to load. Default: 0.2.
+        max_scroll_steps (int): Maximum number of viewport-height scrolls during scan_full_page, bounding
+                                infinite scroll pages. 0 means no limit (the scan is still capped by page_timeout).
+                                Default: 0.
+        harvest_schema (dict): A JsonCssExtractionStrategy schema of the items of an infinite or virtualized
+                               feed. Computed fields are not supported.
+                               If set, the page is scrolled like scan_full_page and the items are extracted in
+                               the page after every scroll step, so rows recycled by virtualized lists are not
+                               missed. Deduplicated items are sent back in batches (see the on_items_harvested
+                               hook) and become the extracted_content, and the page HTML is not serialized.
+                               Such results are neither read from nor written to the cache. Default: None.
+        max_harvested_items (int): Stop scrolling once this many items were harvested. 0 means no limit.
+                                   Default: 0.
         process_iframes (bool): If True, attempts to process and inline iframe content.
                                 Default: False.
+        iframe_timeout (int): Time in milliseconds all iframes of a page share to finish loading
+                              when process_iframes is True. Default: IFRAME_TIMEOUT (10000).
         remove_overlay_elements (bool): If True, remove overlays/popups before extracting HTML.
                                         Default: False.
         simulate_user (bool): If True, simulate user interactions (mouse moves, clicks) for anti-bot measures.
@@ -341,6 +472,39 @@ class CrawlerRunConfig:
                       Default: False.
         adjust_viewport_to_content (bool): If True, adjust viewport according to the page content dimensions.
                                            Default: False.
+        capture_mode (str): How the final HTML is captured. "content" serializes the DOM with page.content();
+                            "snapshot" captures the main document and all same-process frames in one CDP
+                            DOMSnapshot call (Chromium only, falls back to "content" elsewhere); "pruned"
+                            applies excluded_tags, excluded_selector, css_selector, remove_forms and the removal
+                            of scripts, styles and base64 images to a copy of the DOM in the page and serializes
+                            that, so the HTML handed to Python (and result.html) is much smaller. Pruned
+                            results are not written to the cache. Default: "content".
+        exclude_hidden_elements (bool): With capture_mode="snapshot", drop elements that are not rendered
+                                       (e.g. display: none) before the HTML reaches Python. Default: False.
+        output_mode (str): "full" runs the whole pipeline: cleaned HTML, media, links and markdown. "text" builds
+                           block-structured markdown (headings, paragraphs, lists, tables) in the page from the
+                           rendered, visible nodes under css_selector, and skips HTML serialization, scraping and
+                           markdown generation. The result then only holds markdown and extracted content,
+                           and is neither read from nor written to the cache. Default: "full".
+        direct_fetch_non_html (bool): If True, web URLs are first requested without the browser. Responses that are
+                                      not HTML (JSON, XML and RSS/Atom feeds, CSV, plain text, PDF) are downloaded
+                                      and processed directly: the markdown holds their text, and the JSON document,
+                                      feed entries or CSV rows become the extracted_content. The type is probed
+                                      with a HEAD request (GET if the server rejects HEAD), so HTML pages are not
+                                      downloaded twice. The probe still costs one extra round trip per page, so
+                                      URLs ending in .html, .php and the like are not probed, and neither are
+                                      pages under a host and directory where a probe already found HTML, unless
+                                      their extension is one of a non-HTML type (.json, .pdf, ...). Not used with sessions, proxies, screenshots, PDF export, cookies,
+                                      storage_state or a managed/persistent browser, whose state the request would
+                                      miss. PDF text extraction needs pypdf. Default: False.
+
+        # Resource Blocking Parameters
+        block_resources (list of str or None): Resource types to abort, e.g. ["image", "font", "media", "stylesheet"].
+                                               Matching file extensions are blocked too. Default: None.
+        block_third_party (bool): If True, abort subresource requests outside the crawled page's base domain.
+                                  Default: False.
+        block_domains (list of str or None): Domains (and their subdomains) whose requests are aborted.
+                                             Default: None.
 
         # Media Handling Parameters
         screenshot (bool): Whether to take a screenshot after crawling.
@@ -349,6 +513,15 @@ class CrawlerRunConfig:
                                              Default: None.
         screenshot_height_threshold (int): Threshold for page height to decide screenshot strategy.
                                            Default: SCREENSHOT_HEIGHT_TRESHOLD (from config, e.g. 20000).
+        screenshot_format (str): Screenshot image format, "png", "jpeg" or "webp". Default: "png".
+        screenshot_quality (int): Quality from 0 to 100 for "jpeg" and "webp" screenshots. Default: 80.
+        screenshot_max_dimension (int): Downscale screenshots so neither side exceeds this many pixels.
+                                        0 means no limit. Default: 0.
+        screenshot_dir (str or None): If set, screenshots are written to this directory and returned as
+                                      CrawlResult.screenshot_path instead of a base64 string. Default: None.
+        store_artifacts (bool): If True, screenshots, PDFs and downloads are written to the binary artifact store
+                                and returned as lazy ArtifactHandle objects (screenshot_artifact, pdf_artifact,
+                                downloaded_artifacts) instead of in-memory data. Default: False.
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -373,6 +546,9 @@ class CrawlerRunConfig:
                         Default: True.
         log_console (bool): If True, log console messages from the page.
                             Default: False.
+        capture_network_timing (bool): If True, record the timing and size of every request of the page and
+                                       the duration of each crawl phase, summarized in CrawlResult.network_timing.
+                                       Default: False.
 
         # Streaming Parameters
         stream (bool): If True, enables streaming of crawled URLs as they are processed when used with arun_many.
@@ -421,8 +597,10 @@ class CrawlerRunConfig:
         wait_until: str = "domcontentloaded",
         page_timeout: int = PAGE_TIMEOUT,
         wait_for: str = None,
+        quiescence_idle_time: float = 0.5,
+        quiescence_timeout: float = 10.0,
         wait_for_images: bool = False,
-        delay_before_return_html: float = 0.1,
+        delay_before_return_html: float = None,
         mean_delay: float = 0.1,
         max_range: float = 0.3,
         semaphore_count: int = 5,
@@ -432,16 +610,33 @@ class CrawlerRunConfig:
         ignore_body_visibility: bool = True,
         scan_full_page: bool = False,
         scroll_delay: float = 0.2,
+        max_scroll_steps: int = 0,
+        harvest_schema: dict = None,
+        max_harvested_items: int = 0,
         process_iframes: bool = False,
+        iframe_timeout: int = IFRAME_TIMEOUT,
         remove_overlay_elements: bool = False,
         simulate_user: bool = False,
         override_navigator: bool = False,
         magic: bool = False,
         adjust_viewport_to_content: bool = False,
+        capture_mode: str = "content",
+        exclude_hidden_elements: bool = False,
+        output_mode: str = "full",
+        direct_fetch_non_html: bool = False,
+        # Resource Blocking Parameters
+        block_resources: list = None,
+        block_third_party: bool = False,
+        block_domains: list = None,
         # Media Handling Parameters
         screenshot: bool = False,
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 80,
+        screenshot_max_dimension: int = 0,
+        screenshot_dir: str = None,
+        store_artifacts: bool = False,
         pdf: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
         image_score_threshold: int = IMAGE_SCORE_THRESHOLD,
@@ -454,6 +649,7 @@ class CrawlerRunConfig:
         # Debugging and Logging Parameters
         verbose: bool = True,
         log_console: bool = False,
+        capture_network_timing: bool = False,
         # Streaming Parameters
         stream: bool = False,
         url: str = None,
@@ -497,6 +693,8 @@ class CrawlerRunConfig:
         self.wait_until = wait_until
         self.page_timeout = page_timeout
         self.wait_for = wait_for
+        self.quiescence_idle_time = quiescence_idle_time
+        self.quiescence_timeout = quiescence_timeout
         self.wait_for_images = wait_for_images
         self.delay_before_return_html = delay_before_return_html
         self.mean_delay = mean_delay
@@ -509,17 +707,35 @@ class CrawlerRunConfig:
         self.ignore_body_visibility = ignore_body_visibility
         self.scan_full_page = scan_full_page
         self.scroll_delay = scroll_delay
+        self.max_scroll_steps = max_scroll_steps
+        self.harvest_schema = harvest_schema
+        self.max_harvested_items = max_harvested_items
         self.process_iframes = process_iframes
+        self.iframe_timeout = iframe_timeout
         self.remove_overlay_elements = remove_overlay_elements
         self.simulate_user = simulate_user
         self.override_navigator = override_navigator
         self.magic = magic
         self.adjust_viewport_to_content = adjust_viewport_to_content
+        self.capture_mode = capture_mode
+        self.exclude_hidden_elements = exclude_hidden_elements
+        self.output_mode = output_mode
+        self.direct_fetch_non_html = direct_fetch_non_html
+
+        # Resource Blocking Parameters
+        self.block_resources = block_resources or []
+        self.block_third_party = block_third_party
+        self.block_domains = block_domains or []
 
         # Media Handling Parameters
         self.screenshot = screenshot
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_max_dimension = screenshot_max_dimension
+        self.screenshot_dir = screenshot_dir
+        self.store_artifacts = store_artifacts
         self.pdf = pdf
         self.image_description_min_word_threshold = image_description_min_word_threshold
         self.image_score_threshold = image_score_threshold
@@ -536,6 +752,7 @@ class CrawlerRunConfig:
         # Debugging and Logging Parameters
         self.verbose = verbose
         self.log_console = log_console
+        self.capture_network_timing = capture_network_timing
 
         # Streaming Parameters
         self.stream = stream
@@ -566,6 +783,30 @@ class CrawlerRunConfig:
         if self.chunking_strategy is None:
             self.chunking_strategy = RegexChunking()
 
+    def __setattr__(self, name, value):
+        # Assigning a context-affecting field invalidates the memoized signature
+        if name in CONTEXT_SIGNATURE_FIELDS:
+            self.__dict__.pop("_context_signature", None)
+        super().__setattr__(name, value)
+
+    def context_signature(self) -> str:
+        """
+        Returns a stable hash of the fields in CONTEXT_SIGNATURE_FIELDS, identifying the
+        browser context this config needs. It is computed once and memoized; assigning
+        one of those fields recomputes it, but mutating a field in place (e.g. editing
+        the proxy_config dict) does not.
+
+        Returns:
+            str: The hex digest of the context-affecting fields
+        """
+        signature = self.__dict__.get("_context_signature")
+        if signature is None:
+            fields = {name: getattr(self, name) for name in CONTEXT_SIGNATURE_FIELDS}
+            signature_json = json.dumps(fields, sort_keys=True, default=str)
+            signature = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
+            self.__dict__["_context_signature"] = signature
+        return signature
+
     @staticmethod
     def from_kwargs(kwargs: dict) -> "CrawlerRunConfig":
         return CrawlerRunConfig(
@@ -599,8 +840,10 @@ class CrawlerRunConfig:
             wait_until=kwargs.get("wait_until", "domcontentloaded"),
             page_timeout=kwargs.get("page_timeout", 60000),
             wait_for=kwargs.get("wait_for"),
+            quiescence_idle_time=kwargs.get("quiescence_idle_time", 0.5),
+            quiescence_timeout=kwargs.get("quiescence_timeout", 10.0),
             wait_for_images=kwargs.get("wait_for_images", False),
-            delay_before_return_html=kwargs.get("delay_before_return_html", 0.1),
+            delay_before_return_html=kwargs.get("delay_before_return_html"),
             mean_delay=kwargs.get("mean_delay", 0.1),
             max_range=kwargs.get("max_range", 0.3),
             semaphore_count=kwargs.get("semaphore_count", 5),
@@ -610,18 +853,35 @@ class CrawlerRunConfig:
             ignore_body_visibility=kwargs.get("ignore_body_visibility", True),
             scan_full_page=kwargs.get("scan_full_page", False),
             scroll_delay=kwargs.get("scroll_delay", 0.2),
+            max_scroll_steps=kwargs.get("max_scroll_steps", 0),
+            harvest_schema=kwargs.get("harvest_schema"),
+            max_harvested_items=kwargs.get("max_harvested_items", 0),
             process_iframes=kwargs.get("process_iframes", False),
+            iframe_timeout=kwargs.get("iframe_timeout", IFRAME_TIMEOUT),
             remove_overlay_elements=kwargs.get("remove_overlay_elements", False),
             simulate_user=kwargs.get("simulate_user", False),
             override_navigator=kwargs.get("override_navigator", False),
             magic=kwargs.get("magic", False),
             adjust_viewport_to_content=kwargs.get("adjust_viewport_to_content", False),
+            capture_mode=kwargs.get("capture_mode", "content"),
+            exclude_hidden_elements=kwargs.get("exclude_hidden_elements", False),
+            output_mode=kwargs.get("output_mode", "full"),
+            direct_fetch_non_html=kwargs.get("direct_fetch_non_html", False),
+            # Resource Blocking Parameters
+            block_resources=kwargs.get("block_resources", []),
+            block_third_party=kwargs.get("block_third_party", False),
+            block_domains=kwargs.get("block_domains", []),
             # Media Handling Parameters
             screenshot=kwargs.get("screenshot", False),
             screenshot_wait_for=kwargs.get("screenshot_wait_for"),
             screenshot_height_threshold=kwargs.get(
                 "screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD
             ),
+            screenshot_format=kwargs.get("screenshot_format", "png"),
+            screenshot_quality=kwargs.get("screenshot_quality", 80),
+            screenshot_max_dimension=kwargs.get("screenshot_max_dimension", 0),
+            screenshot_dir=kwargs.get("screenshot_dir"),
+            store_artifacts=kwargs.get("store_artifacts", False),
             pdf=kwargs.get("pdf", False),
             image_description_min_word_threshold=kwargs.get(
                 "image_description_min_word_threshold",
@@ -641,6 +901,7 @@ class CrawlerRunConfig:
             # Debugging and Logging Parameters
             verbose=kwargs.get("verbose", True),
             log_console=kwargs.get("log_console", False),
+            capture_network_timing=kwargs.get("capture_network_timing", False),
             # Streaming Parameters
             stream=kwargs.get("stream", False),
             url=kwargs.get("url"),
@@ -679,6 +940,8 @@ class CrawlerRunConfig:
             "wait_until": self.wait_until,
             "page_timeout": self.page_timeout,
             "wait_for": self.wait_for,
+            "quiescence_idle_time": self.quiescence_idle_time,
+            "quiescence_timeout": self.quiescence_timeout,
             "wait_for_images": self.wait_for_images,
             "delay_before_return_html": self.delay_before_return_html,
             "mean_delay": self.mean_delay,
@@ -689,15 +952,31 @@ class CrawlerRunConfig:
             "ignore_body_visibility": self.ignore_body_visibility,
             "scan_full_page": self.scan_full_page,
             "scroll_delay": self.scroll_delay,
+            "max_scroll_steps": self.max_scroll_steps,
+            "harvest_schema": self.harvest_schema,
+            "max_harvested_items": self.max_harvested_items,
             "process_iframes": self.process_iframes,
+            "iframe_timeout": self.iframe_timeout,
             "remove_overlay_elements": self.remove_overlay_elements,
             "simulate_user": self.simulate_user,
             "override_navigator": self.override_navigator,
             "magic": self.magic,
             "adjust_viewport_to_content": self.adjust_viewport_to_content,
+            "capture_mode": self.capture_mode,
+            "exclude_hidden_elements": self.exclude_hidden_elements,
+            "output_mode": self.output_mode,
+            "direct_fetch_non_html": self.direct_fetch_non_html,
+            "block_resources": self.block_resources,
+            "block_third_party": self.block_third_party,
+            "block_domains": self.block_domains,
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_max_dimension": self.screenshot_max_dimension,
+            "screenshot_dir": self.screenshot_dir,
+            "store_artifacts": self.store_artifacts,
             "pdf": self.pdf,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
             "image_score_threshold": self.image_score_threshold,
@@ -708,6 +987,7 @@ class CrawlerRunConfig:
             "exclude_domains": self.exclude_domains,
             "verbose": self.verbose,
             "log_console": self.log_console,
+            "capture_network_timing": self.capture_network_timing,
             "stream": self.stream,
             "url": self.url,
             "check_robots_txt": self.check_robots_txt,
@@ -1,8 +1,12 @@
 import asyncio
 import base64
+import heapq
+import math
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List, Optional, Union
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import AsyncGenerator, Callable, Dict, Any, List, Optional, Union
 import os
 import sys
 import shutil
@@ -10,19 +14,58 @@ import tempfile
 import subprocess
 from playwright.async_api import Page, Error, BrowserContext
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+try:
+    from playwright.async_api import TargetClosedError
+except ImportError:  # not exported by every Playwright release
+    TargetClosedError = None
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import hashlib
 import uuid
+import weakref
+import httpx
+from urllib.parse import urlsplit
 from .js_snippet import load_js_script
 from .models import AsyncCrawlResponse
 from .user_agent_generator import UserAgentGenerator
-from .config import SCREENSHOT_HEIGHT_TRESHOLD, DOWNLOAD_PAGE_TIMEOUT
+from .config import (
+    SCREENSHOT_HEIGHT_TRESHOLD,
+    DOWNLOAD_PAGE_TIMEOUT,
+    DELAY_BEFORE_RETURN_HTML,
+    BROWSER_MEMORY_CHECK_INTERVAL,
+    LONG_POLL_REQUEST_THRESHOLD,
+    NETWORK_TIMING_TOP_REQUESTS,
+    HARVEST_BATCH_STEPS,
+    DIRECT_FETCH_MAX_SIZE,
+    DIRECT_FETCH_PREFIX_CACHE_SIZE,
+    PAGE_TIMEOUT,
+    IFRAME_TIMEOUT,
+)
 from .async_configs import BrowserConfig, CrawlerRunConfig
+from .extraction_strategy import ExtractionStrategy
 from .async_logger import AsyncLogger
+from .blocklist import Blocklist
+from .asset_cache import AssetCache
+from .content_processors import (
+    GENERIC_MEDIA_TYPES,
+    sniff_kind,
+    is_html_path,
+    is_non_html_path,
+    is_pdf_supported,
+    path_prefix,
+    process_content,
+)
 from playwright_stealth import StealthConfig
 from .ssl_certificate import SSLCertificate
-from .utils import get_home_folder, get_chromium_path
+from .artifact_store import artifact_store
+from .utils import (
+    get_home_folder,
+    get_chromium_path,
+    get_base_domain,
+    dom_snapshot_to_html,
+    merge_iframe_contents,
+    IFRAME_MARKER_ATTRIBUTE,
+)
 from .user_agent_generator import ValidUAGenerator, OnlineUAGenerator
 
 stealth_config = StealthConfig(
@@ -62,6 +105,28 @@ BROWSER_DISABLE_OPTIONS = [
     "--use-mock-keychain",
 ]
 
+# File extensions requested by each blockable resource type. Used to also catch
+# resources fetched through XHR/fetch, whose resource type does not reveal them.
+RESOURCE_TYPE_EXTENSIONS = {
+    "image": {"jpg", "jpeg", "png", "gif", "webp", "svg", "ico", "bmp", "tiff", "psd", "avif"},
+    "font": {"woff", "woff2", "ttf", "otf", "eot"},
+    "media": {
+        "mp4", "webm", "ogg", "avi", "mov", "wmv", "flv", "m4v",
+        "mp3", "wav", "aac", "m4a", "opus", "flac",
+    },
+    "stylesheet": {"css"},
+}
+
+# Extensions blocked in text_mode on top of images, fonts and media
+TEXT_MODE_BLOCKED_EXTENSIONS = {
+    # Documents
+    "pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx",
+    # Archives
+    "zip", "rar", "7z", "tar", "gz",
+    # Scripts and data
+    "xml", "swf", "wasm",
+}
+
 
 class ManagedBrowser:
     """
@@ -144,8 +209,9 @@ class ManagedBrowser:
         if self.cdp_url:
             return self.cdp_url
 
-        # Create temp dir if needed
-        if not self.user_data_dir:
+        # Create temp dir if needed. A restart after cleanup gets a fresh one.
+        self.shutting_down = False
+        if not self.user_data_dir or self.temp_dir:
             self.temp_dir = tempfile.mkdtemp(prefix="browser-profile-")
             self.user_data_dir = self.temp_dir
 
@@ -301,6 +367,704 @@ class ManagedBrowser:
                 )
 
 
+# What has been installed on each context by add_init_script_once and add_cookies_once.
+# Contexts are cached and shared across crawls, so installing per crawl would stack up
+# init scripts that then run once per earlier crawl on every new page.
+_context_installs: "weakref.WeakKeyDictionary[BrowserContext, set]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def add_init_script_once(context: BrowserContext, script_name: str):
+    """
+    Add a JS snippet from js_snippet as an init script of a context, unless it is already.
+
+    Args:
+        context (BrowserContext): The browser context
+        script_name (str): Name of the snippet, as passed to load_js_script
+    """
+    installed = _context_installs.setdefault(context, set())
+    key = ("script", script_name)
+    if key in installed:
+        return
+    # Claim it before awaiting, so concurrent crawls on the context do not add it twice
+    installed.add(key)
+    try:
+        await context.add_init_script(load_js_script(script_name))
+    except Exception:
+        installed.discard(key)
+        raise
+
+
+async def add_cookies_once(context: BrowserContext, cookies: List[dict]):
+    """
+    Add cookies to a context, skipping those that were already added with the same value.
+
+    Args:
+        context (BrowserContext): The browser context
+        cookies (List[dict]): Cookies in the format of BrowserContext.add_cookies
+    """
+    installed = _context_installs.setdefault(context, set())
+    new_cookies = []
+    for cookie in cookies:
+        key = (
+            "cookie",
+            cookie.get("name"),
+            cookie.get("value"),
+            cookie.get("url"),
+            cookie.get("domain"),
+            cookie.get("path"),
+        )
+        if key not in installed:
+            installed.add(key)
+            new_cookies.append((key, cookie))
+    if not new_cookies:
+        return
+    try:
+        await context.add_cookies([cookie for _, cookie in new_cookies])
+    except Exception:
+        installed.difference_update(key for key, _ in new_cookies)
+        raise
+
+
+def default_cookie(url: str) -> dict:
+    """The cookiesEnabled cookie, set for the whole origin of url."""
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}/" if parts.netloc else "https://crawl4ai.com/"
+    return {"name": "cookiesEnabled", "value": "true", "url": origin}
+
+
+async def load_blocklist(paths: List[str], logger=None) -> Blocklist:
+    """
+    Compile a blocklist from local files in a worker thread, so that large lists do not
+    block the event loop.
+
+    Args:
+        paths (List[str]): Paths of hosts files or filter lists
+        logger: Logger instance for recording events and errors
+
+    Returns:
+        Blocklist: The compiled blocklist
+    """
+    start = time.perf_counter()
+    blocklist = await asyncio.to_thread(Blocklist.from_files, paths)
+    if logger:
+        logger.info(
+            message="Loaded blocklist | Rules: {rules} | Exceptions: {exceptions} | Time: {timing}",
+            tag="BLOCK",
+            params={
+                "rules": blocklist.rule_count,
+                "exceptions": blocklist.exception_count,
+                "timing": f"{time.perf_counter() - start:.2f}s",
+            },
+        )
+    return blocklist
+
+
+class ContextRouteHandler:
+    """
+    The single route handler installed on a browser context.
+
+    Instead of one glob route per blocked extension, every request goes through one
+    handler that decides in constant time, by resource type, file extension, domain
+    and first/third-party origin, whether to abort it. Top-level navigations are
+    never blocked, so the page being crawled always loads whatever its type.
+    Static subresources that are let through are served from the shared asset
+    cache when one is set.
+
+    Attributes:
+        blocked_resource_types (set): Playwright resource types to abort, e.g. "image".
+        blocked_extensions (set): Lower-case file extensions to abort.
+        blocked_domains (set): Domains to abort, matching their subdomains too.
+        block_third_party (bool): Abort requests outside the page's base domain.
+        blocklist (Blocklist): Ad and tracker rules to abort requests with, or None.
+        asset_cache (AssetCache): Shared cache of static subresources, or None.
+        blocked_count (int): Number of requests aborted so far.
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types=None,
+        blocked_extensions=None,
+        blocked_domains=None,
+        block_third_party: bool = False,
+        blocklist: Optional[Blocklist] = None,
+        asset_cache: Optional[AssetCache] = None,
+    ):
+        self.blocked_resource_types = set(blocked_resource_types or ())
+        self.blocked_extensions = set(blocked_extensions or ())
+        for resource_type in self.blocked_resource_types:
+            self.blocked_extensions |= RESOURCE_TYPE_EXTENSIONS.get(resource_type, set())
+        self.blocked_domains = {d.lower().lstrip(".") for d in blocked_domains or ()}
+        self.block_third_party = block_third_party
+        self.blocklist = blocklist
+        self.asset_cache = asset_cache
+        self.blocked_count = 0
+        self._blocked_by_page: "weakref.WeakKeyDictionary[Page, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def from_configs(
+        cls,
+        browser_config: BrowserConfig,
+        crawlerRunConfig: CrawlerRunConfig = None,
+        blocklist: Optional[Blocklist] = None,
+        asset_cache: Optional[AssetCache] = None,
+    ) -> Optional["ContextRouteHandler"]:
+        """
+        Build the handler for a context from the browser and crawler configs.
+
+        Args:
+            browser_config (BrowserConfig): The browser configuration
+            crawlerRunConfig (CrawlerRunConfig): The crawler configuration of the context
+            blocklist (Blocklist): Compiled ad and tracker blocklist, if one is loaded
+            asset_cache (AssetCache): Shared cache of static subresources, if enabled
+
+        Returns:
+            ContextRouteHandler or None: None if nothing needs to be intercepted
+        """
+        resource_types = set()
+        extensions = set()
+        domains = []
+        block_third_party = False
+
+        if browser_config.text_mode:
+            resource_types |= {"image", "font", "media"}
+            extensions |= TEXT_MODE_BLOCKED_EXTENSIONS
+
+        if crawlerRunConfig:
+            resource_types |= set(crawlerRunConfig.block_resources or ())
+            domains = crawlerRunConfig.block_domains or []
+            block_third_party = crawlerRunConfig.block_third_party
+
+        if not (
+            resource_types or extensions or domains or block_third_party or blocklist or asset_cache
+        ):
+            return None
+        return cls(
+            resource_types, extensions, domains, block_third_party, blocklist, asset_cache
+        )
+
+    def _is_blocked_domain(self, host: str) -> bool:
+        # Check the host and each parent domain: a.b.example.com, b.example.com, ...
+        while host:
+            if host in self.blocked_domains:
+                return True
+            _, _, host = host.partition(".")
+        return False
+
+    def should_block(self, request) -> bool:
+        """
+        Decide whether a request is aborted.
+
+        Args:
+            request (Request): The Playwright request
+
+        Returns:
+            bool: True if the request should be aborted
+        """
+        try:
+            frame = request.frame
+            if request.is_navigation_request() and frame.parent_frame is None:
+                return False
+        except Exception:
+            # Service worker requests have no frame
+            frame = None
+
+        if request.resource_type in self.blocked_resource_types:
+            return True
+
+        parsed = urlsplit(request.url)
+        if self.blocked_extensions:
+            path = parsed.path
+            dot = path.rfind(".")
+            if dot > path.rfind("/") and path[dot + 1 :].lower() in self.blocked_extensions:
+                return True
+
+        host = (parsed.hostname or "").lower()
+        if self.blocked_domains and self._is_blocked_domain(host):
+            return True
+
+        if not (self.block_third_party or self.blocklist) or frame is None:
+            page_url = None
+            third_party = None
+        else:
+            page_url = frame.page.url
+            page_domain = get_base_domain(page_url)
+            third_party = bool(page_domain) and get_base_domain(request.url) != page_domain
+
+        if self.block_third_party and third_party:
+            return True
+
+        if self.blocklist and self.blocklist.should_block(
+            request.url, request.resource_type, third_party, page_url
+        ):
+            return True
+
+        return False
+
+    def pop_blocked_count(self, page: Page) -> int:
+        """Return the number of requests aborted for a page and reset its counter."""
+        return self._blocked_by_page.pop(page, 0)
+
+    async def handle(self, route):
+        """Abort the route if blocked, else serve it from the asset cache or let it through."""
+        request = route.request
+        if self.should_block(request):
+            self.blocked_count += 1
+            try:
+                page = request.frame.page
+                self._blocked_by_page[page] = self._blocked_by_page.get(page, 0) + 1
+            except Exception:
+                pass
+            await route.abort("blockedbyclient")
+        elif self.asset_cache and self.asset_cache.is_cacheable_request(request):
+            await self.asset_cache.handle(route)
+        else:
+            await route.fallback()
+
+
+# Screenshot formats and their PIL encoder names
+SCREENSHOT_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+
+
+def encode_screenshot(
+    segments: List[bytes],
+    image_format: str = "png",
+    quality: int = 80,
+    max_dimension: int = 0,
+) -> bytes:
+    """
+    Stitch captured screenshot segments vertically, downscale and encode the result.
+    A single segment already in the right format and size is returned untouched, so
+    the common case never decodes the image. Blocking, meant to run in a worker thread.
+
+    Args:
+        segments (List[bytes]): Encoded images, top to bottom
+        image_format (str): "png", "jpeg" or "webp"
+        quality (int): Quality from 0 to 100 for JPEG and WebP
+        max_dimension (int): Maximum width and height in pixels, 0 for no limit
+
+    Returns:
+        bytes: The encoded image
+    """
+    pil_format = SCREENSHOT_FORMATS[image_format]
+    images = [Image.open(BytesIO(segment)) for segment in segments]
+    width = max(img.width for img in images)
+    height = sum(img.height for img in images)
+    too_large = max_dimension and max(width, height) > max_dimension
+
+    if len(images) == 1 and images[0].format == pil_format and not too_large:
+        return segments[0]
+
+    if len(images) == 1:
+        image = images[0]
+    else:
+        image = Image.new("RGB", (width, height))
+        offset = 0
+        for img in images:
+            image.paste(img.convert("RGB"), (0, offset))
+            offset += img.height
+
+    if too_large:
+        image.thumbnail((max_dimension, max_dimension))
+
+    buffered = BytesIO()
+    if pil_format == "PNG":
+        image.save(buffered, format=pil_format)
+    else:
+        image.convert("RGB").save(buffered, format=pil_format, quality=quality)
+    return buffered.getvalue()
+
+
+class NetworkActivityTracker:
+    """
+    Tracks the in-flight requests of a page from Playwright's request events.
+
+    Requests that stay open longer than LONG_POLL_REQUEST_THRESHOLD seconds (long
+    polling, streaming) stop counting as activity, so they cannot keep a page busy
+    forever the way they can block "networkidle".
+    """
+
+    def __init__(self):
+        self._pending: Dict[Any, float] = {}
+        self._last_activity = time.monotonic()
+
+    @property
+    def listeners(self) -> list:
+        """(event, handler) pairs to register on the page."""
+        return [
+            ("request", self._on_request),
+            ("requestfinished", self._on_request_done),
+            ("requestfailed", self._on_request_done),
+        ]
+
+    def _on_request(self, request):
+        now = time.monotonic()
+        self._pending[request] = now
+        self._last_activity = now
+
+    def _on_request_done(self, request):
+        if self._pending.pop(request, None) is not None:
+            self._last_activity = time.monotonic()
+
+    def in_flight(self) -> int:
+        """Number of pending requests that are not long-lived."""
+        cutoff = time.monotonic() - LONG_POLL_REQUEST_THRESHOLD
+        return sum(1 for started in self._pending.values() if started > cutoff)
+
+    def idle_for(self) -> float:
+        """Seconds since the network went idle, 0 if requests are in flight."""
+        if self.in_flight():
+            return 0.0
+        return time.monotonic() - self._last_activity
+
+
+class NetworkTimingRecorder:
+    """
+    Records the requests of a page from Playwright's request events, and the time spent
+    in each phase of the crawl, to tell slow servers and scripts apart from slow waits.
+
+    Recording only keeps references to the requests. Timings and sizes are read from
+    Playwright when the crawl is summarized.
+
+    Methods:
+        mark(phase): Records the time since the previous mark as the duration of phase.
+        summarize(top_n): Aggregates the recorded requests and phases into a dict.
+    """
+
+    def __init__(self):
+        self._finished = []
+        self._failed = []
+        self._phases: Dict[str, float] = {}
+        self._last_mark = time.perf_counter()
+
+    @property
+    def listeners(self) -> list:
+        """(event, handler) pairs to register on the page."""
+        return [
+            ("requestfinished", self._finished.append),
+            ("requestfailed", self._failed.append),
+        ]
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self._phases[phase] = round((now - self._last_mark) * 1000, 1)
+        self._last_mark = now
+
+    @staticmethod
+    def _span(timing: dict, start: str, end: str) -> Optional[float]:
+        # Playwright reports -1 for phases that did not happen, e.g. reused connections
+        if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+            return None
+        return round(timing[end] - timing[start], 1)
+
+    async def summarize(self, top_n: int = NETWORK_TIMING_TOP_REQUESTS) -> Dict[str, Any]:
+        """
+        Aggregate the recorded requests.
+
+        Args:
+            top_n (int): Number of slowest and failed requests to list
+
+        Returns:
+            dict: Request, failure and blocked counts, bytes and requests by resource type,
+                  the slowest requests with their DNS, connect, TLS, TTFB and download times
+                  in milliseconds, and the duration of each crawl phase.
+        """
+        sizes = await asyncio.gather(
+            *(request.sizes() for request in self._finished), return_exceptions=True
+        )
+
+        requests = []
+        bytes_by_type: Dict[str, int] = {}
+        requests_by_type: Dict[str, int] = {}
+        first_start = min(
+            (r.timing.get("startTime", 0) for r in self._finished + self._failed),
+            default=0,
+        )
+        for request, size in zip(self._finished, sizes):
+            timing = request.timing
+            body_size = 0 if isinstance(size, BaseException) else size.get("responseBodySize", 0)
+            resource_type = request.resource_type
+            bytes_by_type[resource_type] = bytes_by_type.get(resource_type, 0) + body_size
+            requests_by_type[resource_type] = requests_by_type.get(resource_type, 0) + 1
+            requests.append(
+                {
+                    "url": request.url,
+                    "resource_type": resource_type,
+                    "start": round(timing.get("startTime", first_start) - first_start, 1),
+                    "dns": self._span(timing, "domainLookupStart", "domainLookupEnd"),
+                    "connect": self._span(timing, "connectStart", "connectEnd"),
+                    "tls": self._span(timing, "secureConnectionStart", "connectEnd"),
+                    "ttfb": self._span(timing, "requestStart", "responseStart"),
+                    "download": self._span(timing, "responseStart", "responseEnd"),
+                    "duration": round(timing["responseEnd"], 1)
+                    if timing.get("responseEnd", -1) >= 0
+                    else None,
+                    "bytes": body_size,
+                }
+            )
+        requests.sort(key=lambda r: r["duration"] or 0, reverse=True)
+
+        failures = [
+            {
+                "url": request.url,
+                "resource_type": request.resource_type,
+                "error": request.failure,
+            }
+            for request in self._failed
+        ]
+        return {
+            "requests": len(self._finished) + len(self._failed),
+            "failed": len(failures),
+            "blocked": sum(
+                1 for f in failures if "ERR_BLOCKED_BY_CLIENT" in (f["error"] or "")
+            ),
+            "total_bytes": sum(bytes_by_type.values()),
+            "bytes_by_type": bytes_by_type,
+            "requests_by_type": requests_by_type,
+            "slowest": requests[:top_n],
+            "failures": failures[:top_n],
+            "phases": dict(self._phases),
+        }
+
+
+class PagePool:
+    """
+    A bounded pool of reusable pages belonging to a single browser context.
+
+    Creating a page means spinning up a renderer, injecting the context's init
+    scripts and wiring the protocol channels. On high-volume crawls this cost is
+    paid for every URL, so released pages are reset and kept around for the next
+    crawl instead of being closed.
+
+    Attributes:
+        context (BrowserContext): The context the pooled pages belong to.
+        max_size (int): Maximum number of idle pages kept in the pool.
+        max_uses (int): Number of crawls a page may serve before it is recycled.
+        logger: Logger instance for recording events and errors.
+        stats (dict): Counters for pages reused (hits), created (misses) and recycled.
+
+        Methods:
+            acquire(): Returns an idle page from the pool, or a new one.
+            release(page): Resets a page and returns it to the pool, or closes it.
+            close(): Closes all idle pages.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_size: int = 5,
+        max_uses: int = 50,
+        viewport: Optional[Dict[str, int]] = None,
+        logger=None,
+        stats: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the PagePool.
+
+        Args:
+            context (BrowserContext): The context to create pages from.
+            max_size (int): Maximum number of idle pages kept in the pool. Default: 5.
+            max_uses (int): Number of crawls a page may serve before it is closed
+                            and replaced by a fresh one. Default: 50.
+            viewport (dict or None): Viewport size restored on released pages. Default: None.
+            logger: Logger instance for recording events and errors. Default: None.
+            stats (dict or None): Counters to update, e.g. shared by all pools of a
+                                  browser. Default: None, a dict of the pool's own.
+        """
+        self.context = context
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.viewport = viewport
+        self.logger = logger
+        self._idle: List[Page] = []
+        self._uses: Dict[Page, int] = {}
+        self._lock = asyncio.Lock()
+        self.stats = stats if stats is not None else {"hits": 0, "misses": 0, "recycled": 0}
+
+    async def acquire(self) -> Page:
+        """
+        Get a page from the pool, creating a new one if no idle page is available.
+
+        Returns:
+            Page: A blank page ready for navigation
+        """
+        async with self._lock:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    self.stats["hits"] += 1
+                    self._uses[page] = self._uses.get(page, 0) + 1
+                    return page
+                self._uses.pop(page, None)
+
+        page = await self.context.new_page()
+        self.stats["misses"] += 1
+        self._uses[page] = 1
+        return page
+
+    async def release(self, page: Page, reusable: bool = True):
+        """
+        Return a page to the pool.
+
+        The page is closed instead if it has reached max_uses, if the pool is full,
+        or if resetting it fails. Pages closed elsewhere are simply forgotten.
+
+        Args:
+            page (Page): The page to release
+            reusable (bool): False if the crawl left state on the page that a reset
+                             cannot undo (e.g. device metrics overrides). Default: True.
+        """
+        if page.is_closed():
+            self._uses.pop(page, None)
+            return
+
+        if not reusable:
+            await self._discard(page)
+            return
+
+        if self._uses.get(page, 0) >= self.max_uses:
+            self.stats["recycled"] += 1
+            await self._discard(page)
+            return
+
+        async with self._lock:
+            pool_full = len(self._idle) >= self.max_size
+        if pool_full or not await self._reset_page(page):
+            await self._discard(page)
+            return
+
+        async with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(page)
+                return
+        await self._discard(page)
+
+    async def _reset_page(self, page: Page) -> bool:
+        """
+        Bring a used page back to a neutral state.
+
+        How it works:
+        1. Clear the sessionStorage of the current document, since it is bound to the tab.
+        2. Navigate to about:blank, dropping the document, its timers and its listeners.
+        3. Remove page-level routes, e.g. added by an on_page_context_created hook, so they
+           do not pile up or apply to the next crawl.
+        4. Drop page-level extra HTTP headers and restore the pool viewport.
+
+        Playwright event handlers registered with page.on() cannot be enumerated and
+        stay attached: hooks registering them must remove them again, or pooling must
+        stay disabled.
+
+        Args:
+            page (Page): The page to reset
+
+        Returns:
+            bool: True if the page can be reused
+        """
+        try:
+            try:
+                await page.evaluate("() => { try { sessionStorage.clear(); } catch (e) {} }")
+            except Error:
+                pass
+            await page.goto("about:blank")
+            await page.unroute_all(behavior="ignoreErrors")
+            await page.set_extra_http_headers({})
+            if self.viewport and page.viewport_size != self.viewport:
+                await page.set_viewport_size(self.viewport)
+            return True
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(
+                    message="Failed to reset pooled page: {error}",
+                    tag="POOL",
+                    params={"error": str(e)},
+                )
+            return False
+
+    async def _discard(self, page: Page):
+        self._uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Close all idle pages in the pool."""
+        async with self._lock:
+            idle, self._idle = self._idle, []
+        for page in idle:
+            await self._discard(page)
+
+
+# The message Playwright raises TargetClosedError with, for releases not exporting the type
+TARGET_CLOSED_MESSAGE = "Target page, context or browser has been closed"
+
+
+class BrowserCrashError(RuntimeError):
+    """Raised when a crawl fails because its page crashed or its browser disconnected."""
+
+
+def is_browser_crash(error: Exception) -> bool:
+    """
+    Whether an error raised during a crawl comes from a crashed page or browser.
+
+    Only the error types are looked at, never the message: page scripts and user hooks
+    can raise errors whose text mentions anything.
+    """
+    while error is not None:
+        if isinstance(error, BrowserCrashError):
+            return True
+        if TargetClosedError is not None:
+            if isinstance(error, TargetClosedError):
+                return True
+        elif isinstance(error, Error) and str(error).startswith(TARGET_CLOSED_MESSAGE):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class CrashCircuitBreaker:
+    """
+    Counts browser crashes in a sliding time window. Once max_crashes crashes fall
+    within the window the breaker is open, and crashed browsers are not relaunched
+    until enough of them have aged out of it.
+
+    Attributes:
+        max_crashes (int): Crashes within the window that open the breaker, 0 for never.
+        window (float): Length of the window in seconds.
+        total (int): Number of crashes recorded so far.
+    """
+
+    def __init__(self, max_crashes: int, window: float):
+        self.max_crashes = max_crashes
+        self.window = window
+        self.total = 0
+        self._crashes = deque()
+
+    def _trim(self):
+        cutoff = time.time() - self.window
+        while self._crashes and self._crashes[0] < cutoff:
+            self._crashes.popleft()
+
+    def record(self):
+        """Record a crash that happened now."""
+        self.total += 1
+        self._crashes.append(time.time())
+        self._trim()
+
+    @property
+    def recent(self) -> int:
+        """Number of crashes within the window."""
+        self._trim()
+        return len(self._crashes)
+
+    @property
+    def is_open(self) -> bool:
+        return bool(self.max_crashes) and self.recent >= self.max_crashes
+
+
 class BrowserManager:
     """
     Manages the browser instance and context.
@@ -312,17 +1076,43 @@ class BrowserManager:
         default_context (BrowserContext): The default browser context
         managed_browser (ManagedBrowser): The managed browser instance
         playwright (Playwright): The Playwright instance
-        sessions (dict): Dictionary to store session information
+        sessions (OrderedDict): Open sessions as (context, page, last used), in LRU order
         session_ttl (int): Session timeout in seconds
+        max_sessions (int): Maximum number of open sessions, 0 for no limit. Sessions that are
+                            in use are never evicted to make room; get_page waits instead.
+        on_session_closed (Callable): Called with the session ID whenever a session is closed
+        crashed (bool): Whether the browser disconnected unexpectedly and awaits a relaunch
+        crash_breaker (CrashCircuitBreaker): Stops relaunching a browser that keeps crashing
+        page_pools (dict): Pools of reusable pages, keyed by browser context
+        page_pool_stats (dict): Counters for pooled page hits, misses and recycled pages,
+                                across all page pools
+        contexts_by_config (OrderedDict): Cached contexts keyed by config signature, in LRU order
+        context_stats (dict): Counters for context cache hits, creations, evictions and expirations
     """
 
-    def __init__(self, browser_config: BrowserConfig, logger=None):
+    def __init__(
+        self,
+        browser_config: BrowserConfig,
+        logger=None,
+        playwright=None,
+        blocklist=None,
+        asset_cache=None,
+        recover_crashes: bool = True,
+    ):
         """
         Initialize the BrowserManager with a browser configuration.
 
         Args:
             browser_config (BrowserConfig): Configuration object containing all browser settings
             logger: Logger instance for recording events and errors
+            playwright (Playwright): An already started Playwright instance to share. If None,
+                                     the manager starts and stops its own.
+            blocklist (Blocklist): An already compiled blocklist to share. If None, it is loaded
+                                   from browser_config.blocklist_paths on start.
+            asset_cache (AssetCache): An asset cache to share. If None, one is opened on start
+                                      when browser_config.asset_cache is set.
+            recover_crashes (bool): Relaunch the browser on the next get_page if it disconnects
+                                    unexpectedly. BrowserPool replaces crashed browsers itself.
         """
         self.config: BrowserConfig = browser_config
         self.logger = logger
@@ -331,15 +1121,53 @@ class BrowserManager:
         self.browser = None
         self.default_context = None
         self.managed_browser = None
-        self.playwright = None
+        self.playwright = playwright
+        self._owns_playwright = playwright is None
+        # Awaited with (browser, default_context) every time a browser is launched,
+        # including relaunches after a crash
+        self.on_browser_created: Optional[Callable[..., Any]] = None
+
+        # Crash recovery
+        self.recover_crashes = recover_crashes
+        self.crashed = False
+        self.crash_breaker = CrashCircuitBreaker(
+            browser_config.max_crashes, browser_config.crash_window
+        )
+        self._relaunch_lock = asyncio.Lock()
+        self._closing = False
+
+        # Session management. Expiry times go into a min-heap that a background task
+        # reaps; entries superseded by a later use are skipped when popped.
+        # The same task also closes cached contexts that outlive context_ttl.
+        self.sessions: "OrderedDict[str, tuple]" = OrderedDict()
+        self.session_ttl = browser_config.session_ttl
+        self.max_sessions = browser_config.max_sessions
+        self.on_session_closed: Optional[Callable[[str], None]] = None
+        self._session_expiry: List[tuple] = []
+        # Number of crawls currently using each session's page, see release_session
+        self._sessions_in_use: Dict[str, int] = {}
+        self._session_released = asyncio.Event()
+        self._reaper_wakeup = asyncio.Event()
+        self._reaper: Optional[asyncio.Task] = None
+
+        # Keep track of contexts by a "config signature," so each unique config reuses a single context.
+        # The cache is kept in LRU order and bounded by max_contexts / context_ttl; contexts are only
+        # closed once no page handed out from them is still in use.
+        self.contexts_by_config: "OrderedDict[str, BrowserContext]" = OrderedDict()
+        self._contexts_lock = asyncio.Lock() 
+        self._context_refs: Dict[str, int] = {}
+        self._context_last_used: Dict[str, float] = {}
+        self._page_signatures: Dict[Page, str] = {}
+        self.context_stats = {"hits": 0, "created": 0, "evicted": 0, "expired": 0}
 
-        # Session management
-        self.sessions = {}
-        self.session_ttl = 1800  # 30 minutes
+        # Pools of reusable pages per context, only used when page_pool_size > 0
+        self.page_pools: Dict[BrowserContext, PagePool] = {}
+        self.page_pool_stats = {"hits": 0, "misses": 0, "recycled": 0}
 
-        # Keep track of contexts by a "config signature," so each unique config reuses a single context
-        self.contexts_by_config = {}
-        self._contexts_lock = asyncio.Lock() 
+        # Route handlers applying resource blocking policies, per context
+        self.route_handlers: Dict[BrowserContext, ContextRouteHandler] = {}
+        self.blocklist: Optional[Blocklist] = blocklist
+        self.asset_cache: Optional[AssetCache] = asset_cache
 
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
@@ -360,6 +1188,7 @@ class BrowserManager:
         2. If not, initialize Playwright.
         3. If managed browser is used, start it and connect to the CDP endpoint.
         4. If managed browser is not used, launch the browser and set up the default context.
+        5. Call on_browser_created with the new browser, if set.
 
         Note: This method should be called in a separate task to avoid blocking the main event loop.
         """
@@ -368,6 +1197,12 @@ class BrowserManager:
 
             self.playwright = await async_playwright().start()
 
+        if self.blocklist is None and self.config.blocklist_paths:
+            self.blocklist = await load_blocklist(self.config.blocklist_paths, self.logger)
+
+        if self.asset_cache is None and self.config.asset_cache:
+            self.asset_cache = AssetCache(self.config.asset_cache_dir)
+
         if self.config.use_managed_browser:
             cdp_url = await self.managed_browser.start()
             self.browser = await self.playwright.chromium.connect_over_cdp(cdp_url)
@@ -403,6 +1238,71 @@ class BrowserManager:
 
             self.default_context = self.browser
 
+        if self.recover_crashes:
+            self.browser.on("disconnected", self._on_browser_disconnected)
+
+        if self.on_browser_created:
+            await self.on_browser_created(self.browser, self.default_context)
+
+    def _on_browser_disconnected(self, browser):
+        if self._closing or browser is not self.browser:
+            return
+        self.crashed = True
+        self.crash_breaker.record()
+        if self.logger:
+            self.logger.warning(
+                message="Browser disconnected unexpectedly | Crashes: {recent} in the last {window}s",
+                tag="BROWSER",
+                params={"recent": self.crash_breaker.recent, "window": self.crash_breaker.window},
+            )
+
+    async def _relaunch(self):
+        """
+        Replace a crashed browser by a new one.
+
+        Everything tied to the dead browser (sessions, cached contexts, page pools, route
+        handlers) is dropped, so contexts_by_config is rebuilt lazily by later get_page
+        calls. Raises RuntimeError while the crash circuit breaker is open.
+        """
+        async with self._relaunch_lock:
+            if not self.crashed:
+                return
+            if self.crash_breaker.is_open:
+                raise RuntimeError(
+                    f"Browser crashed {self.crash_breaker.recent} times in the last "
+                    f"{self.crash_breaker.window}s, not relaunching it"
+                )
+
+            # Pages of the dead browser are gone, only forget them
+            for session_id in list(self.sessions):
+                del self.sessions[session_id]
+                if self.on_session_closed:
+                    self.on_session_closed(session_id)
+            self._session_expiry.clear()
+            self.page_pools.clear()
+            self.route_handlers.clear()
+            self.contexts_by_config.clear()
+            self._context_refs.clear()
+            self._context_last_used.clear()
+            self._page_signatures.clear()
+
+            browser, self.browser = self.browser, None
+            try:
+                await browser.close()
+            except Exception:
+                pass
+            if self.managed_browser:
+                await self.managed_browser.cleanup()
+
+            await self.start()
+            self.crashed = False
+            if self.logger:
+                self.logger.info(
+                    message="Relaunched crashed browser | Total crashes: {total}",
+                    tag="BROWSER",
+                    params={"total": self.crash_breaker.total},
+                )
+
     def _build_browser_args(self) -> dict:
         """Build browser launch arguments from config."""
         args = [
@@ -511,7 +1411,7 @@ class BrowserManager:
             await context.set_extra_http_headers(self.config.headers)
 
         if self.config.cookies:
-            await context.add_cookies(self.config.cookies)
+            await add_cookies_once(context, self.config.cookies)
 
         if self.config.storage_state:
             await context.storage_state(path=None)
@@ -535,17 +1435,8 @@ class BrowserManager:
             await context.set_extra_http_headers(combined_headers)
 
         # Add default cookie
-        await context.add_cookies(
-            [
-                {
-                    "name": "cookiesEnabled",
-                    "value": "true",
-                    "url": crawlerRunConfig.url
-                    if crawlerRunConfig
-                    else "https://crawl4ai.com/",
-                }
-            ]
-        )
+        cookie_url = crawlerRunConfig.url if crawlerRunConfig and crawlerRunConfig.url else ""
+        await add_cookies_once(context, [default_cookie(cookie_url)])
 
         # Handle navigator overrides
         if crawlerRunConfig:
@@ -554,12 +1445,13 @@ class BrowserManager:
                 or crawlerRunConfig.simulate_user
                 or crawlerRunConfig.magic
             ):
-                await context.add_init_script(load_js_script("navigator_overrider"))        
+                await add_init_script_once(context, "navigator_overrider")
 
     async def create_browser_context(self, crawlerRunConfig: CrawlerRunConfig = None):
         """
         Creates and returns a new browser context with configured settings.
-        Applies text-only mode settings if text_mode is enabled in config.
+        Applies text-only mode settings if text_mode is enabled in config, and the
+        resource blocking policy of crawlerRunConfig if one is given.
 
         Returns:
             Context: Browser context object with the specified configurations
@@ -572,61 +1464,6 @@ class BrowserManager:
         }
         proxy_settings = {"server": self.config.proxy} if self.config.proxy else None
 
-        blocked_extensions = [
-            # Images
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "webp",
-            "svg",
-            "ico",
-            "bmp",
-            "tiff",
-            "psd",
-            # Fonts
-            "woff",
-            "woff2",
-            "ttf",
-            "otf",
-            "eot",
-            # Styles
-            # 'css', 'less', 'scss', 'sass',
-            # Media
-            "mp4",
-            "webm",
-            "ogg",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "m4v",
-            "mp3",
-            "wav",
-            "aac",
-            "m4a",
-            "opus",
-            "flac",
-            # Documents
-            "pdf",
-            "doc",
-            "docx",
-            "xls",
-            "xlsx",
-            "ppt",
-            "pptx",
-            # Archives
-            "zip",
-            "rar",
-            "7z",
-            "tar",
-            "gz",
-            # Scripts and data
-            "xml",
-            "swf",
-            "wasm",
-        ]
-
         # Common context settings
         context_settings = {
             "user_agent": user_agent,
@@ -663,44 +1500,36 @@ class BrowserManager:
         # Create and return the context with all settings
         context = await self.browser.new_context(**context_settings)
 
-        # Apply text mode settings if enabled
-        if self.config.text_mode:
-            # Create and apply route patterns for each extension
-            for ext in blocked_extensions:
-                await context.route(f"**/*.{ext}", lambda route: route.abort())
+        # Route every request through one handler that applies the blocking policy
+        route_handler = ContextRouteHandler.from_configs(
+            self.config, crawlerRunConfig, self.blocklist, self.asset_cache
+        )
+        if route_handler:
+            await context.route("**/*", route_handler.handle)
+            self.route_handlers[context] = route_handler
+        context.on("close", self._on_context_closed)
         return context
 
+    def _on_context_closed(self, context: BrowserContext):
+        """Forget a cached context that was closed behind the cache's back, e.g. by a crash."""
+        if self._closing:
+            return
+        for signature, cached in list(self.contexts_by_config.items()):
+            if cached is context:
+                del self.contexts_by_config[signature]
+                self._context_refs.pop(signature, None)
+                self._context_last_used.pop(signature, None)
+        self.route_handlers.pop(context, None)
+        self.page_pools.pop(context, None)
+
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
         """
-        Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
-        then returns a hash of the sorted JSON. This yields a stable signature
-        that identifies configurations requiring a unique browser context.
-        """
-        import json, hashlib
-
-        config_dict = crawlerRunConfig.__dict__.copy()
-        # Exclude items that do not affect browser-level setup.
-        # Expand or adjust as needed, e.g. chunking_strategy is purely for data extraction, not for browser config.
-        ephemeral_keys = [
-            "session_id",
-            "js_code",
-            "scraping_strategy",
-            "extraction_strategy",
-            "chunking_strategy",
-            "cache_mode",
-            "content_filter",
-            "semaphore_count",
-            "url"
-        ]
-        for key in ephemeral_keys:
-            if key in config_dict:
-                del config_dict[key]
-        # Convert to canonical JSON string
-        signature_json = json.dumps(config_dict, sort_keys=True, default=str)
-
-        # Hash the JSON so we get a compact, unique string
-        signature_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-        return signature_hash
+        Returns the signature identifying the browser context a crawler config needs.
+        Only the fields listed in CONTEXT_SIGNATURE_FIELDS take part, so configs that
+        differ in extraction, markdown, screenshot or timing options share a context.
+        The signature is memoized on the config object.
+        """
+        return crawlerRunConfig.context_signature()
 
     async def get_page(self, crawlerRunConfig: CrawlerRunConfig):
         """
@@ -712,19 +1541,35 @@ class BrowserManager:
         Returns:
             (page, context): The Page and its BrowserContext
         """
-        self._cleanup_expired_sessions()
+        if self.crashed:
+            await self._relaunch()
 
         # If a session_id is provided and we already have it, reuse that page + context
-        if crawlerRunConfig.session_id and crawlerRunConfig.session_id in self.sessions:
-            context, page, _ = self.sessions[crawlerRunConfig.session_id]
-            # Update last-used timestamp
-            self.sessions[crawlerRunConfig.session_id] = (context, page, time.time())
+        session_id = crawlerRunConfig.session_id
+        if session_id and session_id in self.sessions:
+            context, page, _ = self.sessions[session_id]
+            self._touch_session(session_id, context, page)
+            self._sessions_in_use[session_id] = self._sessions_in_use.get(session_id, 0) + 1
             return page, context
 
+        if session_id and self.max_sessions:
+            # Make room by closing the least recently used idle sessions. Sessions whose
+            # page is in use are skipped; if all of them are, wait for one to be released.
+            while len(self.sessions) >= self.max_sessions:
+                idle = next(
+                    (sid for sid in self.sessions if not self._sessions_in_use.get(sid)),
+                    None,
+                )
+                if idle is not None:
+                    await self.kill_session(idle)
+                    continue
+                self._session_released.clear()
+                await self._session_released.wait()
+
         # If using a managed browser, just grab the shared default_context
         if self.config.use_managed_browser:
             context = self.default_context
-            page = await context.new_page()
+            page = await self._new_page(context, crawlerRunConfig)
         else:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
@@ -732,76 +1577,806 @@ class BrowserManager:
             async with self._contexts_lock:
                 if config_signature in self.contexts_by_config:
                     context = self.contexts_by_config[config_signature]
+                    self.contexts_by_config.move_to_end(config_signature)
+                    self.context_stats["hits"] += 1
+                    evicted = self._pop_evictable_contexts()
                 else:
+                    evicted = self._pop_evictable_contexts(reserve=1)
                     # Create and setup a new context
                     context = await self.create_browser_context(crawlerRunConfig)
                     await self.setup_context(context, crawlerRunConfig)
                     self.contexts_by_config[config_signature] = context
+                    self.context_stats["created"] += 1
+                # Hold a reference so the context is not evicted while the page is in use
+                self._context_refs[config_signature] = (
+                    self._context_refs.get(config_signature, 0) + 1
+                )
+                self._context_last_used[config_signature] = time.time()
+
+            # Close evicted contexts outside the lock so a slow close does not stall other crawls
+            await self._close_contexts(evicted)
 
             # Create a new page from the chosen context
-            page = await context.new_page()
+            try:
+                page = await self._new_page(context, crawlerRunConfig)
+            except Exception:
+                self._release_context_ref(config_signature)
+                raise
+            self._page_signatures[page] = config_signature
 
         # If a session_id is specified, store this session so we can reuse later
-        if crawlerRunConfig.session_id:
-            self.sessions[crawlerRunConfig.session_id] = (context, page, time.time())
+        if session_id:
+            self._touch_session(session_id, context, page)
+            self._sessions_in_use[session_id] = self._sessions_in_use.get(session_id, 0) + 1
 
         return page, context
 
-    async def kill_session(self, session_id: str):
+    def release_session(self, session_id: str):
         """
-        Kill a browser session and clean up resources.
+        Mark a crawl on a session's page as finished. The session stays open for
+        later crawls, but can now be evicted to make room for new sessions.
 
         Args:
-            session_id (str): The session ID to kill.
+            session_id (str): The session ID whose page is no longer in use
         """
+        in_use = self._sessions_in_use.get(session_id, 0) - 1
+        if in_use > 0:
+            self._sessions_in_use[session_id] = in_use
+            return
+        self._sessions_in_use.pop(session_id, None)
         if session_id in self.sessions:
             context, page, _ = self.sessions[session_id]
-            await page.close()
-            if not self.config.use_managed_browser:
-                await context.close()
-            del self.sessions[session_id]
-
-    def _cleanup_expired_sessions(self):
-        """Clean up expired sessions based on TTL."""
-        current_time = time.time()
-        expired_sessions = [
-            sid
-            for sid, (_, _, last_used) in self.sessions.items()
-            if current_time - last_used > self.session_ttl
-        ]
-        for sid in expired_sessions:
-            asyncio.create_task(self.kill_session(sid))
+            self._touch_session(session_id, context, page)
+        self._session_released.set()
+
+    def _touch_session(self, session_id: str, context: BrowserContext, page: Page):
+        """Record a use of a session, moving it to the LRU end and pushing its new expiry."""
+        now = time.time()
+        self.sessions[session_id] = (context, page, now)
+        self.sessions.move_to_end(session_id)
+        if not self.session_ttl:
+            return
+
+        heapq.heappush(self._session_expiry, (now + self.session_ttl, session_id))
+        # Drop superseded entries once they outnumber the live ones
+        if len(self._session_expiry) > 2 * len(self.sessions) + 64:
+            self._session_expiry = [
+                (last_used + self.session_ttl, sid)
+                for sid, (_, _, last_used) in self.sessions.items()
+            ]
+            heapq.heapify(self._session_expiry)
 
-    async def close(self):
-        """Close all browser resources and clean up."""
-        if self.config.sleep_on_close:
-            await asyncio.sleep(0.5)
+        self._wake_reaper()
 
-        session_ids = list(self.sessions.keys())
-        for session_id in session_ids:
-            await self.kill_session(session_id)
+    def _wake_reaper(self):
+        """Start the background reaper, or wake it up so it recomputes its next deadline."""
+        if self._closing:
+            return
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+        else:
+            self._reaper_wakeup.set()
 
-        # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
-            try:
-                await ctx.close()
-            except Exception as e:
-                self.logger.error(
-                    message="Error closing context: {error}",
-                    tag="ERROR",
-                    params={"error": str(e)}
-                )
-        self.contexts_by_config.clear()
+    async def warmup(
+        self,
+        crawler_configs: Optional[List[CrawlerRunConfig]] = None,
+        pages_per_context: int = 1,
+    ):
+        """
+        Pre-create and set up the contexts for the given crawler configs and pre-open
+        pages in them, so the first crawls do not pay for context creation. Pre-opened
+        pages stay in the page pools when page_pool_size > 0; otherwise they are closed
+        again and only the contexts are kept.
 
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        Args:
+            crawler_configs (List[CrawlerRunConfig]): Configs the crawls will use. Defaults
+                                                      to a default CrawlerRunConfig.
+            pages_per_context (int): Number of pages to open in each context
+        """
+        for crawlerRunConfig in crawler_configs or [CrawlerRunConfig()]:
+            if crawlerRunConfig.session_id:
+                crawlerRunConfig = crawlerRunConfig.clone(session_id=None)
+            pages = await asyncio.gather(
+                *[
+                    self.get_page(crawlerRunConfig)
+                    for _ in range(max(1, pages_per_context))
+                ]
+            )
+            for page, context in pages:
+                await self.release_page(page, context)
 
-        if self.managed_browser:
+    async def _new_page(
+        self, context: BrowserContext, crawlerRunConfig: CrawlerRunConfig
+    ) -> Page:
+        """
+        Open a page in the given context, taking it from the context's page pool
+        when pooling is enabled. Session pages are never pooled, since they are
+        owned by their session until it is killed.
+        """
+        if self.config.page_pool_size <= 0 or crawlerRunConfig.session_id:
+            return await context.new_page()
+
+        pool = self.page_pools.get(context)
+        if pool is None:
+            pool = PagePool(
+                context,
+                max_size=self.config.page_pool_size,
+                max_uses=self.config.page_max_uses,
+                viewport={
+                    "width": self.config.viewport_width,
+                    "height": self.config.viewport_height,
+                },
+                logger=self.logger,
+                stats=self.page_pool_stats,
+            )
+            self.page_pools[context] = pool
+        return await pool.acquire()
+
+    async def release_page(
+        self, page: Page, context: BrowserContext, reusable: bool = True
+    ):
+        """
+        Hand a page back once a non-session crawl is done with it. The page goes
+        back to its context's pool if there is one, otherwise it is closed.
+
+        Args:
+            page (Page): The page to release
+            context (BrowserContext): The context the page belongs to
+            reusable (bool): Whether the page may be handed out again
+        """
+        pool = self.page_pools.get(context)
+        try:
+            if pool is not None:
+                await pool.release(page, reusable=reusable)
+            else:
+                await page.close()
+        finally:
+            self._release_context_ref(self._page_signatures.pop(page, None))
+
+    def pop_blocked_requests(self, page: Page, context: BrowserContext) -> Optional[int]:
+        """
+        Return the number of requests the context's route handler aborted for a page
+        since the last call, or None if the context does not block anything.
+        """
+        route_handler = self.route_handlers.get(context)
+        if route_handler is None:
+            return None
+        return route_handler.pop_blocked_count(page)
+
+    def _release_context_ref(self, config_signature: Optional[str]):
+        """Drop one reference to a cached context and mark it as recently used."""
+        if config_signature is None or config_signature not in self._context_refs:
+            return
+        self._context_refs[config_signature] = max(
+            0, self._context_refs[config_signature] - 1
+        )
+        self._context_last_used[config_signature] = time.time()
+        if self.config.context_ttl and self._context_refs[config_signature] == 0:
+            self._wake_reaper()
+
+    def _pop_evictable_contexts(self, reserve: int = 0) -> List[tuple]:
+        """
+        Remove idle cached contexts that have expired or no longer fit in the cache.
+
+        Contexts are visited from least to most recently used. A context is idle when
+        no page handed out from it is still in use; busy contexts are never evicted, so
+        the cache may temporarily exceed max_contexts under load.
+
+        Must be called with _contexts_lock held. The removed contexts are not closed
+        here; pass the result to _close_contexts once the lock has been released.
+
+        Args:
+            reserve (int): Number of slots to free up for contexts about to be created
+
+        Returns:
+            List[tuple]: (context, page pool) pairs that were removed from the cache
+        """
+        max_contexts = self.config.max_contexts
+        ttl = self.config.context_ttl
+        now = time.time()
+        evicted = []
+
+        for signature in list(self.contexts_by_config.keys()):
+            if self._context_refs.get(signature, 0) > 0:
+                continue
+            expired = ttl and now - self._context_last_used.get(signature, now) >= ttl
+            over_capacity = (
+                max_contexts and len(self.contexts_by_config) + reserve > max_contexts
+            )
+            if not expired and not over_capacity:
+                continue
+
+            self.context_stats["expired" if expired else "evicted"] += 1
+            context = self.contexts_by_config.pop(signature)
+            self._context_refs.pop(signature, None)
+            self._context_last_used.pop(signature, None)
+            self.route_handlers.pop(context, None)
+            evicted.append((context, self.page_pools.pop(context, None)))
+
+        return evicted
+
+    async def _close_contexts(self, evicted: List[tuple]):
+        """Close contexts returned by _pop_evictable_contexts along with their page pools."""
+        for context, pool in evicted:
+            try:
+                if pool is not None:
+                    await pool.close()
+                await context.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        message="Error closing context: {error}",
+                        tag="ERROR",
+                        params={"error": str(e)},
+                    )
+
+        if evicted and self.logger:
+            self.logger.debug(
+                message="Closed {count} idle context(s) | Cached: {cached} | Stats: {stats}",
+                tag="CONTEXT",
+                params={
+                    "count": len(evicted),
+                    "cached": len(self.contexts_by_config),
+                    "stats": self.context_stats,
+                },
+            )
+
+    def _next_context_expiry(self) -> Optional[float]:
+        """Return when the next idle cached context outlives context_ttl, if any."""
+        ttl = self.config.context_ttl
+        if not ttl:
+            return None
+        idle = [
+            self._context_last_used[signature] + ttl
+            for signature in self.contexts_by_config
+            if self._context_refs.get(signature, 0) == 0
+            and signature in self._context_last_used
+        ]
+        return min(idle, default=None)
+
+    async def kill_session(self, session_id: str):
+        """
+        Kill a browser session and clean up resources.
+
+        Args:
+            session_id (str): The session ID to kill.
+        """
+        if session_id in self.sessions:
+            context, page, _ = self.sessions.pop(session_id)
+            self._sessions_in_use.pop(session_id, None)
+            self._session_released.set()
+            try:
+                await page.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        message="Error closing session {session_id}: {error}",
+                        tag="ERROR",
+                        params={"session_id": session_id, "error": str(e)},
+                    )
+            # The context is shared through the context cache, which closes it once idle
+            self._release_context_ref(self._page_signatures.pop(page, None))
+            if self.on_session_closed:
+                self.on_session_closed(session_id)
+
+    async def _reap_idle(self):
+        """
+        Close sessions unused for session_ttl seconds and idle contexts older than context_ttl.
+
+        How it works:
+        1. Sleeps until the earliest session or context expiry, or until it is woken up
+           because a session was used or a context became idle.
+        2. Pops due session entries; an entry is stale if the session was used again or
+           closed since it was pushed, and is skipped.
+        3. Evicts expired contexts under _contexts_lock and closes them after releasing it.
+        4. Exits when there is nothing left to expire.
+        """
+        while True:
+            self._reaper_wakeup.clear()
+            now = time.time()
+            while self._session_expiry and self._session_expiry[0][0] <= now:
+                _, session_id = heapq.heappop(self._session_expiry)
+                session = self.sessions.get(session_id)
+                # Sessions in use get a new expiry once they are released
+                if (
+                    session
+                    and now - session[2] >= self.session_ttl
+                    and not self._sessions_in_use.get(session_id)
+                ):
+                    await self.kill_session(session_id)
+            if not self.sessions:
+                self._session_expiry.clear()
+
+            if self.config.context_ttl:
+                async with self._contexts_lock:
+                    evicted = self._pop_evictable_contexts()
+                await self._close_contexts(evicted)
+
+            deadlines = [self._session_expiry[0][0]] if self._session_expiry else []
+            next_context_expiry = self._next_context_expiry()
+            if next_context_expiry is not None:
+                deadlines.append(next_context_expiry)
+            if not deadlines:
+                break
+            try:
+                await asyncio.wait_for(
+                    self._reaper_wakeup.wait(),
+                    timeout=max(0, min(deadlines) - time.time()),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self):
+        """Close all browser resources and clean up."""
+        self._closing = True
+        if self.config.sleep_on_close:
+            await asyncio.sleep(0.5)
+
+        if self._reaper:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+
+        session_ids = list(self.sessions.keys())
+        for session_id in session_ids:
+            await self.kill_session(session_id)
+        self._session_expiry.clear()
+
+        for pool in self.page_pools.values():
+            await pool.close()
+        self.page_pools.clear()
+        self.route_handlers.clear()
+
+        # Now close all contexts we created. This reclaims memory from ephemeral contexts.
+        for ctx in self.contexts_by_config.values():
+            try:
+                await ctx.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        message="Error closing context: {error}",
+                        tag="ERROR",
+                        params={"error": str(e)}
+                    )
+        self.contexts_by_config.clear()
+        self._context_refs.clear()
+        self._context_last_used.clear()
+        self._page_signatures.clear()
+
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+
+        if self.managed_browser:
             await asyncio.sleep(0.5)
             await self.managed_browser.cleanup()
             self.managed_browser = None
 
+        if self.playwright:
+            if self._owns_playwright:
+                await self.playwright.stop()
+            self.playwright = None
+
+
+@dataclass
+class PooledBrowser:
+    """Bookkeeping for one browser instance managed by a BrowserPool."""
+
+    manager: BrowserManager
+    active_pages: int = 0
+    pages_served: int = 0
+    draining: bool = False
+    crashed: bool = False
+    recycling: bool = False
+    # The browser is gone and could not be replaced yet, the slot waits for a relaunch
+    placeholder: bool = False
+    memory_checked_at: float = 0.0
+
+
+class BrowserPool:
+    """
+    Runs several browser instances behind the BrowserManager interface.
+
+    Each instance is driven by its own BrowserManager. New pages go to the instance
+    with the fewest pages in flight. An instance is drained and replaced by a fresh
+    one once it has served max_pages_per_browser pages or its processes exceed
+    max_browser_memory_mb, and instances whose browser disconnects (crash, OOM kill)
+    are replaced the same way. If browsers crashed max_crashes times within
+    crash_window, or a replacement fails to launch, the slot stays in the pool as a
+    placeholder and get_page relaunches it once the crashes have aged out of the
+    window. Long-running crawlers therefore keep a steady memory footprint and
+    survive the loss of a single browser.
+
+    Attributes:
+        config (BrowserConfig): Configuration object containing all browser settings
+        logger: Logger instance for recording events and errors
+        playwright (Playwright): The Playwright instance shared by all browsers
+        members (List[PooledBrowser]): The browser instances in the pool
+        stats (dict): Counters for recycled and replaced browsers
+        crash_breaker (CrashCircuitBreaker): Stops replacing browsers that keep crashing
+
+        Methods:
+            start(): Launches all browser instances.
+            warmup(crawler_configs, pages_per_context): Warms up contexts and pages on every browser.
+            get_page(crawlerRunConfig): Returns a page from the least loaded browser.
+            release_page(page, context): Hands a page back and recycles drained browsers.
+            release_session(session_id): Marks a crawl on a session's page as finished.
+            kill_session(session_id): Kills a session on the browser that owns it.
+            close(): Closes all browser instances.
+    """
+
+    def __init__(self, browser_config: BrowserConfig, logger=None):
+        """
+        Initialize the BrowserPool with a browser configuration.
+
+        Args:
+            browser_config (BrowserConfig): Configuration object containing all browser settings
+            logger: Logger instance for recording events and errors
+        """
+        self.config = browser_config
+        self.logger = logger
+        self.size = max(1, browser_config.browser_pool_size)
+        self.playwright = None
+        self.members: List[PooledBrowser] = []
+        self._page_owner: Dict[Page, PooledBrowser] = {}
+        self._session_owner: Dict[str, PooledBrowser] = {}
+        self._condition = asyncio.Condition()
+        self._tasks = set()
+        self.blocklist: Optional[Blocklist] = None
+        self.asset_cache: Optional[AssetCache] = None
+        self.stats = {"recycled": 0, "replaced": 0}
+        # Passed on to the manager of every browser the pool launches, replacements included
+        self.on_browser_created: Optional[Callable[..., Any]] = None
+        self.crash_breaker = CrashCircuitBreaker(
+            browser_config.max_crashes, browser_config.crash_window
+        )
+
+    @property
+    def browser(self):
+        return self.members[0].manager.browser if self.members else None
+
+    @property
+    def default_context(self):
+        return self.members[0].manager.default_context if self.members else None
+
+    async def start(self):
+        """Start Playwright once and launch every browser instance in the pool."""
+        if self.playwright is None:
+            from playwright.async_api import async_playwright
+
+            self.playwright = await async_playwright().start()
+
+        if self.blocklist is None and self.config.blocklist_paths:
+            self.blocklist = await load_blocklist(self.config.blocklist_paths, self.logger)
+
+        if self.asset_cache is None and self.config.asset_cache:
+            self.asset_cache = AssetCache(self.config.asset_cache_dir)
+
+        if not self.members:
+            self.members = await asyncio.gather(
+                *[self._launch() for _ in range(self.size)]
+            )
+
+    async def _launch(self) -> PooledBrowser:
+        manager = BrowserManager(
+            browser_config=self.config,
+            logger=self.logger,
+            playwright=self.playwright,
+            blocklist=self.blocklist,
+            asset_cache=self.asset_cache,
+            recover_crashes=False,
+        )
+        manager.on_browser_created = self.on_browser_created
+        await manager.start()
+        member = PooledBrowser(manager=manager, memory_checked_at=time.time())
+        manager.on_session_closed = lambda session_id: self._on_session_closed(member, session_id)
+        manager.browser.on("disconnected", lambda _: self._on_disconnected(member))
+        return member
+
+    def _on_disconnected(self, member: PooledBrowser):
+        if member.recycling:
+            return
+        if self.logger:
+            self.logger.warning(
+                message="Browser disconnected, replacing it | In-flight pages: {active}",
+                tag="POOL",
+                params={"active": member.active_pages},
+            )
+        member.crashed = True
+        member.draining = True
+        self.crash_breaker.record()
+        self._maybe_recycle(member)
+
+    async def _acquire_member(self) -> PooledBrowser:
+        """
+        Pick the browser with the fewest pages in flight.
+
+        Draining browsers are only used when every live browser is draining (e.g.
+        because open sessions pin them); crashed browsers are never used, and if
+        all are crashed this waits for a replacement. Placeholder slots are
+        relaunched while the crash circuit breaker is closed. Raises RuntimeError if
+        no browser is left and none can be relaunched.
+        """
+        relaunched = False
+        async with self._condition:
+            while True:
+                if not self.members:
+                    raise RuntimeError("No browsers left in the pool")
+
+                placeholders = [m for m in self.members if m.placeholder and not m.recycling]
+                if placeholders and not relaunched and not self.crash_breaker.is_open:
+                    for member in placeholders:
+                        self._start_recycle(member)
+                    relaunched = True
+
+                alive = [m for m in self.members if not m.crashed and not m.recycling]
+                candidates = [m for m in alive if not m.draining] or alive
+                if candidates:
+                    member = min(candidates, key=lambda m: m.active_pages)
+                    member.active_pages += 1
+                    return member
+
+                if all(m.placeholder and not m.recycling for m in self.members):
+                    # Every browser is gone: either the breaker is open, or the
+                    # relaunch started by this call failed as well
+                    if self.crash_breaker.is_open:
+                        raise RuntimeError(
+                            f"Browsers crashed {self.crash_breaker.recent} times in the last "
+                            f"{self.crash_breaker.window}s, not relaunching them"
+                        )
+                    raise RuntimeError("No browsers left in the pool, relaunching them failed")
+                await self._condition.wait()
+
+    async def get_page(self, crawlerRunConfig: CrawlerRunConfig):
+        """
+        Get a page from the least loaded browser, or from the browser that owns
+        the session if crawlerRunConfig.session_id refers to an existing session.
+
+        Args:
+            crawlerRunConfig (CrawlerRunConfig): Configuration object containing all browser settings
+
+        Returns:
+            (page, context): The Page and its BrowserContext
+        """
+        session_id = crawlerRunConfig.session_id
+        owner = self._session_owner.get(session_id) if session_id else None
+        if owner is not None and not owner.crashed:
+            return await owner.manager.get_page(crawlerRunConfig)
+
+        member = await self._acquire_member()
+        try:
+            page, context = await member.manager.get_page(crawlerRunConfig)
+        except Exception:
+            await self._page_done(member)
+            raise
+
+        member.pages_served += 1
+        if session_id:
+            # Sessions are tracked by the manager, not as in-flight pages
+            self._session_owner[session_id] = member
+            await self._page_done(member)
+        else:
+            self._page_owner[page] = member
+        return page, context
+
+    async def release_page(
+        self, page: Page, context: BrowserContext, reusable: bool = True
+    ):
+        """
+        Hand a page back to the browser it came from.
+
+        Args:
+            page (Page): The page to release
+            context (BrowserContext): The context the page belongs to
+            reusable (bool): Whether the page may be handed out again
+        """
+        member = self._page_owner.pop(page, None)
+        if member is None:
+            await page.close()
+            return
+        try:
+            if member.crashed:
+                await page.close()
+            else:
+                await member.manager.release_page(page, context, reusable=reusable)
+        except Exception:
+            pass
+        finally:
+            await self._page_done(member)
+
+    async def warmup(
+        self,
+        crawler_configs: Optional[List[CrawlerRunConfig]] = None,
+        pages_per_context: int = 1,
+    ):
+        """Warm up the contexts and pages of every browser in the pool."""
+        await asyncio.gather(
+            *[
+                member.manager.warmup(crawler_configs, pages_per_context)
+                for member in self.members
+                if not member.crashed
+            ]
+        )
+
+    def pop_blocked_requests(self, page: Page, context: BrowserContext) -> Optional[int]:
+        """Return the number of requests blocked for a page on the browser owning its context."""
+        for member in self.members:
+            if context in member.manager.route_handlers:
+                return member.manager.pop_blocked_requests(page, context)
+        return None
+
+    def release_session(self, session_id: str):
+        """
+        Mark a crawl on a session's page as finished, on the browser that owns it.
+
+        Args:
+            session_id (str): The session ID whose page is no longer in use
+        """
+        member = self._session_owner.get(session_id)
+        if member is not None:
+            member.manager.release_session(session_id)
+
+    async def kill_session(self, session_id: str):
+        """
+        Kill a browser session on the browser that owns it.
+
+        Args:
+            session_id (str): The session ID to kill.
+        """
+        member = self._session_owner.pop(session_id, None)
+        if member is None:
+            return
+        await member.manager.kill_session(session_id)
+        self._maybe_recycle(member)
+
+    def _on_session_closed(self, member: PooledBrowser, session_id: str):
+        # Sessions also close on their own once expired or evicted by the browser
+        if self._session_owner.get(session_id) is member:
+            del self._session_owner[session_id]
+        self._maybe_recycle(member)
+
+    async def _page_done(self, member: PooledBrowser):
+        member.active_pages -= 1
+        await self._check_limits(member)
+        self._maybe_recycle(member)
+        async with self._condition:
+            self._condition.notify_all()
+
+    async def _check_limits(self, member: PooledBrowser):
+        """Mark a browser as draining once it exceeds its page or memory budget."""
+        if member.draining:
+            return
+
+        if (
+            self.config.max_pages_per_browser
+            and member.pages_served >= self.config.max_pages_per_browser
+        ):
+            member.draining = True
+            return
+
+        now = time.time()
+        if (
+            self.config.max_browser_memory_mb
+            and now - member.memory_checked_at >= BROWSER_MEMORY_CHECK_INTERVAL
+        ):
+            member.memory_checked_at = now
+            memory_mb = await self._browser_memory_mb(member)
+            if memory_mb > self.config.max_browser_memory_mb:
+                if self.logger:
+                    self.logger.info(
+                        message="Browser uses {memory:.0f}MB, recycling it",
+                        tag="POOL",
+                        params={"memory": memory_mb},
+                    )
+                member.draining = True
+
+    async def _browser_memory_mb(self, member: PooledBrowser) -> float:
+        """
+        Resident memory of all processes of a browser, in megabytes.
+
+        The process ids come from the browser itself over CDP, so this only works
+        for Chromium; other browsers report 0.
+        """
+        try:
+            import psutil
+
+            cdp = await member.manager.browser.new_browser_cdp_session()
+            try:
+                info = await cdp.send("SystemInfo.getProcessInfo")
+            finally:
+                await cdp.detach()
+
+            rss = 0
+            for process in info.get("processInfo", []):
+                try:
+                    rss += psutil.Process(process["id"]).memory_info().rss
+                except psutil.Error:
+                    pass
+            return rss / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    def _maybe_recycle(self, member: PooledBrowser):
+        if (
+            member.draining
+            and not member.recycling
+            and member.active_pages <= 0
+            and not member.placeholder
+            and (member.crashed or not member.manager.sessions)
+        ):
+            self._start_recycle(member)
+
+    def _start_recycle(self, member: PooledBrowser):
+        member.recycling = True
+        task = asyncio.create_task(self._recycle(member))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _recycle(self, member: PooledBrowser):
+        """
+        Replace a drained or crashed browser, or a placeholder slot, with a freshly
+        launched one. If no browser can be launched, the slot becomes a placeholder.
+        """
+        replacement = None
+        attempts = 3
+        if member.crashed and self.crash_breaker.is_open:
+            # Browsers keep crashing, leave the slot empty until the crashes age out
+            attempts = 0
+            if self.logger:
+                self.logger.error(
+                    message="Browsers crashed {recent} times in the last {window}s, relaunching this one once they age out",
+                    tag="POOL",
+                    params={"recent": self.crash_breaker.recent, "window": self.crash_breaker.window},
+                )
+        for attempt in range(attempts):
+            try:
+                replacement = await self._launch()
+                break
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(
+                        message="Failed to launch replacement browser (attempt {attempt}): {error}",
+                        tag="POOL",
+                        params={"attempt": attempt + 1, "error": str(e)},
+                    )
+                await asyncio.sleep(attempt + 1)
+
+        if replacement is not None:
+            self.members[self.members.index(member)] = replacement
+            self.stats["replaced" if member.crashed else "recycled"] += 1
+        for session_id, owner in list(self._session_owner.items()):
+            if owner is member:
+                del self._session_owner[session_id]
+
+        if not member.placeholder:
+            try:
+                await member.manager.close()
+            except Exception:
+                pass
+        if replacement is None:
+            # Keep the slot rather than handing out pages from a dead browser,
+            # _acquire_member relaunches it later
+            member.crashed = True
+            member.placeholder = True
+            member.recycling = False
+
+        async with self._condition:
+            self._condition.notify_all()
+
+    async def close(self):
+        """Close all browser instances and the shared Playwright instance."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        for member in self.members:
+            member.recycling = True
+            if not member.placeholder:
+                await member.manager.close()
+        self.members = []
+        self._page_owner.clear()
+        self._session_owner.clear()
+
         if self.playwright:
             await self.playwright.stop()
             self.playwright = None
@@ -838,6 +2413,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 Close the browser and clean up resources.
             start(self):
                 Start the browser and initialize the browser manager.
+            warmup(self, crawler_configs=None, pages_per_context=1):
+                Pre-create contexts and pre-open pages for the given crawler configs.
             close(self):
                 Close the browser and clean up resources.
             kill_session(self, session_id):
@@ -866,6 +2443,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Initialize session management
         self._downloaded_files = []
 
+        # Host and directory prefixes whose pages were probed as HTML by direct_fetch_non_html,
+        # in LRU order. Later pages under them skip the probe.
+        self._html_prefixes: "OrderedDict[tuple, None]" = OrderedDict()
+
         # Initialize hooks system
         self.hooks = {
             "on_browser_created": None,
@@ -876,12 +2457,24 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             "after_goto": None,
             "before_return_html": None,
             "before_retrieve_html": None,
+            "on_items_harvested": None,
         }
 
-        # Initialize browser manager with config
-        self.browser_manager = BrowserManager(
-            browser_config=self.browser_config, logger=self.logger
-        )
+        # Initialize browser manager with config. Several browsers are only pooled
+        # for locally launched browsers, a managed browser is a single CDP endpoint.
+        if (
+            self.browser_config.browser_pool_size > 1
+            and not self.browser_config.use_managed_browser
+        ):
+            self.browser_manager = BrowserPool(
+                browser_config=self.browser_config, logger=self.logger
+            )
+        else:
+            self.browser_manager = BrowserManager(
+                browser_config=self.browser_config, logger=self.logger
+            )
+        # Pooled, recycled and relaunched browsers get the hook as well
+        self.browser_manager.on_browser_created = self._on_browser_created
 
     async def __aenter__(self):
         await self.start()
@@ -895,11 +2488,23 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         Start the browser and initialize the browser manager.
         """
         await self.browser_manager.start()
-        await self.execute_hook(
-            "on_browser_created",
-            self.browser_manager.browser,
-            context=self.browser_manager.default_context,
-        )
+
+    async def _on_browser_created(self, browser, context):
+        await self.execute_hook("on_browser_created", browser, context=context)
+
+    async def warmup(
+        self,
+        crawler_configs: Optional[List[CrawlerRunConfig]] = None,
+        pages_per_context: int = 1,
+    ):
+        """
+        Pre-create contexts and pre-open pages for the given crawler configs.
+
+        Args:
+            crawler_configs (List[CrawlerRunConfig]): Configs the crawls will use
+            pages_per_context (int): Number of pages to open in each context
+        """
+        await self.browser_manager.warmup(crawler_configs, pages_per_context)
 
     async def close(self):
         """
@@ -927,14 +2532,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
     def set_hook(self, hook_type: str, hook: Callable):
         """
         Set a hook function for a specific hook type. Following are list of hook types:
-        - on_browser_created: Called when a new browser instance is created.
-        - on_page_context_created: Called when a new page context is created.
+        - on_browser_created: Called when a new browser instance is created, for every browser of a pool and
+          for browsers launched to replace recycled or crashed ones.
+        - on_page_context_created: Called when a new page context is created. With BrowserConfig.page_pool_size > 0
+          the page is reused by later crawls: routes added with page.route() are removed when the page is
+          released, but handlers added with page.on() must be removed by the hooks themselves.
         - on_user_agent_updated: Called when the user agent is updated.
         - on_execution_started: Called when the execution starts.
         - before_goto: Called before a goto operation.
         - after_goto: Called after a goto operation.
         - before_return_html: Called before returning HTML content.
         - before_retrieve_html: Called before retrieving HTML content.
+        - on_items_harvested: Called with each batch of new items harvested while scrolling (harvest_schema).
 
         All hooks except on_browser_created accepts a context and a page as arguments and **kwargs. However, on_browser_created accepts a browser and a context as arguments and **kwargs.
 
@@ -1058,6 +2667,45 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                 "or explicitly prefixed with 'js:' or 'css:'."
                             )
 
+    async def wait_for_quiescence(
+        self,
+        page: Page,
+        network: Optional[NetworkActivityTracker] = None,
+        idle_time: float = 0.5,
+        timeout: float = 10.0,
+    ) -> bool:
+        """
+        Wait until neither the DOM nor the network has changed for idle_time seconds.
+
+        How it works:
+        1. A MutationObserver injected into the page records the time of the last DOM change.
+        2. The NetworkActivityTracker reports how long no request has been in flight.
+        3. Instead of polling at a fixed rate, each check sleeps exactly as long as the
+           page still has to stay quiet, so a quiet page costs one or two round trips.
+
+        Args:
+            page (Page): The Playwright page object
+            network (NetworkActivityTracker): Tracker registered on the page before navigation.
+                                              If None, only the DOM is watched.
+            idle_time (float): Seconds the page must stay quiet
+            timeout (float): Hard cap in seconds on the whole wait
+
+        Returns:
+            bool: True if the page became quiescent, False if the cap was reached first
+        """
+        quiescence_js = load_js_script("dom_quiescence")
+        deadline = time.monotonic() + timeout
+        while True:
+            quiet_for = await page.evaluate(quiescence_js)
+            if network is not None:
+                quiet_for = min(quiet_for, network.idle_for())
+            if quiet_for >= idle_time:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(idle_time - quiet_for, remaining))
+
     async def csp_compliant_wait(
         self, page: Page, user_wait_function: str, timeout: float = 30000
     ):
@@ -1104,69 +2752,199 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # For timeout or other cases, just return False
             return False
 
-    async def process_iframes(self, page):
+    async def process_iframes(self, page, timeout: int = IFRAME_TIMEOUT) -> Dict[int, str]:
         """
-        Process iframes on a page. This function will extract the content of each iframe and replace it with a div containing the extracted content.
+        Capture the content of the iframes on a page, including frames nested in frames.
+
+        How it works:
+        1. Walks the frame tree and marks each iframe element with its index, so it can be
+           found in the serialized HTML later.
+        2. Waits for every frame to load and reads its body concurrently. All frames share
+           one deadline, and a frame that is still loading when it passes is read as is.
+        3. Returns the content as data. merge_iframe_contents then replaces each marked
+           iframe in the page HTML by a div holding the frame's body.
 
         Args:
-            page: Playwright page object
+            page (Page): The Playwright page object
+            timeout (int): Time in milliseconds to wait for all frames to load
 
         Returns:
-            Playwright page object
+            Dict[int, str]: The body HTML of each captured frame, by iframe index
         """
-        # Find all iframes
-        iframes = await page.query_selector_all("iframe")
+        frames = []
+        pending = list(page.main_frame.child_frames)
+        while pending:
+            frame = pending.pop(0)
+            frames.append(frame)
+            pending.extend(frame.child_frames)
+        if not frames:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000
+
+        async def mark(index, frame):
+            element = await frame.frame_element()
+            await element.evaluate(
+                "(element, [name, index]) => element.setAttribute(name, index)",
+                [IFRAME_MARKER_ATTRIBUTE, str(index)],
+            )
 
-        for i, iframe in enumerate(iframes):
+        async def capture(frame):
+            # A timeout of 0 disables the Playwright timeout, so wait at least 1 ms
+            remaining = max(deadline - loop.time(), 0.001)
             try:
-                # Add a unique identifier to the iframe
-                await iframe.evaluate(f'(element) => element.id = "iframe-{i}"')
-
-                # Get the frame associated with this iframe
-                frame = await iframe.content_frame()
-
-                if frame:
-                    # Wait for the frame to load
-                    await frame.wait_for_load_state(
-                        "load", timeout=30000
-                    )  # 30 seconds timeout
+                await frame.wait_for_load_state("load", timeout=remaining * 1000)
+            except PlaywrightTimeoutError:
+                pass
+            return await frame.evaluate("() => document.body ? document.body.innerHTML : ''")
+
+        # Parents must be marked before any frame body is read, or nested markers are lost
+        marked = await asyncio.gather(
+            *(mark(index, frame) for index, frame in enumerate(frames)),
+            return_exceptions=True,
+        )
+        indices = [index for index, result in enumerate(marked) if result is None]
+        if len(indices) < len(frames):
+            self.logger.warning(
+                message="Could not access {count} of {total} iframes",
+                tag="SCRAPE",
+                params={"count": len(frames) - len(indices), "total": len(frames)},
+            )
 
-                    # Extract the content of the iframe's body
-                    iframe_content = await frame.evaluate(
-                        "() => document.body.innerHTML"
-                    )
+        async def capture_before_deadline(frame):
+            # Reading the body of a hung frame must not outlive the deadline either
+            return await asyncio.wait_for(
+                capture(frame), timeout=max(deadline - loop.time(), 0) + 1
+            )
 
-                    # Generate a unique class name for this iframe
-                    class_name = f"extracted-iframe-content-{i}"
+        results = await asyncio.gather(
+            *(capture_before_deadline(frames[index]) for index in indices),
+            return_exceptions=True,
+        )
 
-                    # Replace the iframe with a div containing the extracted content
-                    _iframe = iframe_content.replace("`", "\\`")
-                    await page.evaluate(
-                        f"""
-                        () => {{
-                            const iframe = document.getElementById('iframe-{i}');
-                            const div = document.createElement('div');
-                            div.innerHTML = `{_iframe}`;
-                            div.className = '{class_name}';
-                            iframe.replaceWith(div);
-                        }}
-                    """
-                    )
-                else:
-                    self.logger.warning(
-                        message="Could not access content frame for iframe {index}",
-                        tag="SCRAPE",
-                        params={"index": i},
-                    )
-            except Exception as e:
+        frame_contents = {}
+        for index, result in zip(indices, results):
+            if isinstance(result, BaseException):
                 self.logger.error(
                     message="Error processing iframe {index}: {error}",
                     tag="ERROR",
-                    params={"index": i, "error": str(e)},
+                    params={"index": index, "error": str(result) or type(result).__name__},
                 )
+            else:
+                frame_contents[index] = result
+        return frame_contents
 
-        # Return the page object
-        return page
+    async def capture_text(self, page: Page, config: CrawlerRunConfig) -> Optional[str]:
+        """
+        Build block-structured markdown text from the rendered page in a single evaluate.
+
+        Hidden nodes are skipped and block boundaries follow the computed display, so the
+        text matches what a reader sees. Headings, paragraphs, lists, tables, code blocks
+        and quotes keep their structure; links, media and citations are left out.
+
+        Args:
+            page (Page): The Playwright page object
+            config (CrawlerRunConfig): The crawler configuration holding css_selector and
+                                       the exclusions
+
+        Returns:
+            str or None: The markdown text, or None if the walk failed and the HTML has to
+                         be captured instead.
+        """
+        try:
+            return await page.evaluate(
+                load_js_script("text_blocks"),
+                {
+                    "rootSelector": config.css_selector,
+                    "excludedTags": config.excluded_tags,
+                    "excludedSelector": config.excluded_selector,
+                },
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="Text capture failed, falling back to HTML: {error}",
+                tag="SCRAPE",
+                params={"error": str(e)},
+            )
+            return None
+
+    async def capture_pruned_html(
+        self, page: Page, config: CrawlerRunConfig
+    ) -> Optional[str]:
+        """
+        Serialize a pruned copy of the DOM, built in the page with a single evaluate.
+
+        The scraping strategy drops scripts, styles, excluded tags and selectors, and
+        everything outside css_selector anyway. Dropping them in the page first means
+        that much less HTML is serialized, transferred and parsed.
+
+        Args:
+            page (Page): The Playwright page object
+            config (CrawlerRunConfig): The crawler configuration holding the exclusions
+
+        Returns:
+            str or None: The pruned HTML, or None if pruning failed (e.g. a selector the
+                         browser does not support).
+        """
+        try:
+            return await page.evaluate(
+                load_js_script("prune_dom"),
+                {
+                    "excludedTags": config.excluded_tags,
+                    "excludedSelector": config.excluded_selector,
+                    "cssSelector": config.css_selector,
+                    "removeForms": config.remove_forms,
+                },
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="Pruning the DOM failed, falling back to page content: {error}",
+                tag="SCRAPE",
+                params={"error": str(e)},
+            )
+            return None
+
+    async def capture_dom_snapshot(
+        self, page: Page, exclude_hidden: bool = False, inline_iframes: bool = True
+    ) -> Optional[str]:
+        """
+        Capture the HTML of a page and its same-process frames with a single CDP
+        DOMSnapshot.captureSnapshot call instead of serializing through page.content().
+
+        Args:
+            page (Page): The Playwright page object
+            exclude_hidden (bool): Drop elements that are not rendered
+            inline_iframes (bool): Inline the content of captured iframes
+
+        Returns:
+            str or None: The captured HTML, or None if CDP is not available (non-Chromium
+                         browsers) or the snapshot failed.
+        """
+        try:
+            cdp = await page.context.new_cdp_session(page)
+        except Exception:
+            return None
+
+        try:
+            snapshot = await cdp.send(
+                "DOMSnapshot.captureSnapshot", {"computedStyles": []}
+            )
+            return await asyncio.to_thread(
+                dom_snapshot_to_html, snapshot, exclude_hidden, inline_iframes
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="DOM snapshot failed, falling back to page content: {error}",
+                tag="SCRAPE",
+                params={"error": str(e)},
+            )
+            return None
+        finally:
+            try:
+                await cdp.detach()
+            except Exception:
+                pass
 
     async def create_session(self, **kwargs) -> str:
         """
@@ -1212,7 +2990,28 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         screenshot_data = None
 
         if url.startswith(("http://", "https://")):
-            return await self._crawl_web(url, config)
+            if config.direct_fetch_non_html:
+                response = await self._fetch_non_html(url, config)
+                if response:
+                    return response
+
+            # A crash of the page or browser is retried on a fresh page, the browser
+            # manager relaunches the browser if needed
+            retries = self.browser_config.crash_retries
+            for attempt in range(retries + 1):
+                try:
+                    return await self._crawl_web(url, config)
+                except Exception as e:
+                    if attempt >= retries or not is_browser_crash(e):
+                        raise
+                    self.logger.warning(
+                        message="Browser crashed while crawling {url}, retrying ({attempt}/{retries})",
+                        tag="BROWSER",
+                        params={"url": url, "attempt": attempt + 1, "retries": retries},
+                    )
+                    if config.session_id:
+                        # The session's page died with it
+                        await self.browser_manager.kill_session(config.session_id)
 
         elif url.startswith("file://"):
             # Process local file
@@ -1249,6 +3048,330 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 "URL must start with 'http://', 'https://', 'file://', or 'raw:'"
             )
 
+    async def paginate(
+        self,
+        url: str,
+        config: CrawlerRunConfig,
+        next_action: str,
+        item_selector: Optional[str] = None,
+        container_selector: Optional[str] = None,
+        max_pages: int = 10,
+        stop_condition: Optional[str] = None,
+        state_timeout: int = 10000,
+    ) -> AsyncGenerator[AsyncCrawlResponse, None]:
+        """
+        Crawl the states of a paginated listing on one live page.
+
+        How it works:
+        1. Loads the URL once, as a regular crawl in a session (config.session_id, or a
+           temporary one that is killed afterwards).
+        2. Captures the container, and the items in it that were not seen before.
+        3. Runs next_action in the page (a click or a JS snippet that calls
+           history.pushState, fetches the next page, ...) and waits until the
+           container's content changes, without navigating.
+        4. With wait_for="quiescent", waits for the page to become quiescent after each
+           action, so rows streamed in after the first change are captured too.
+        5. Repeats until max_pages states were captured, next_action finds nothing to
+           do, no new items appear, or stop_condition evaluates to true. A missing
+           container, a first state without items, or a container that does not change
+           after next_action ends the pagination with a response whose error_message
+           is set.
+
+        Args:
+            url (str): The URL of the first page of the listing
+            config (CrawlerRunConfig): Configuration of the first crawl
+            next_action (str): CSS selector of the "next" control to click, or JS code to
+                               run, prefixed with "js:". JS returning false means there is
+                               no next page.
+            item_selector (str): CSS selector of the items, relative to the container.
+                                 Items are deduplicated across states by their HTML.
+            container_selector (str): CSS selector of the element holding the items.
+                                      Default: the body.
+            max_pages (int): Maximum number of states to capture, the first one included
+            stop_condition (str): JS expression evaluated before each next_action, stops
+                                  the pagination when it is truthy
+            state_timeout (int): Time in milliseconds to wait for the container to change
+
+        Yields:
+            AsyncCrawlResponse: One response per state. Its html only holds the container,
+                                or the new items if item_selector is given.
+        """
+        owns_session = not config.session_id
+        session_id = config.session_id or f"paginate-{uuid.uuid4().hex}"
+        config = config.clone(session_id=session_id)
+        seen_items = set()
+        page = None
+        network_tracker = None
+
+        def state_html(state) -> Optional[str]:
+            if state is None:
+                return None
+            if item_selector is None:
+                return state["html"]
+            new_items = []
+            for item in state["items"]:
+                key = hashlib.sha256(item.encode("utf-8")).digest()
+                if key not in seen_items:
+                    seen_items.add(key)
+                    new_items.append(item)
+            return "".join(new_items)
+
+        def state_response(html: str, error_message: Optional[str] = None):
+            return AsyncCrawlResponse(
+                html=f"<html><body>{html}</body></html>",
+                response_headers=first.response_headers,
+                status_code=first.status_code,
+                redirected_url=page.url,
+                error_message=error_message,
+            )
+
+        try:
+            first = await self.crawl(url, config=config)
+            page, _ = await self.browser_manager.get_page(config)
+            state_js = load_js_script("pagination_state")
+            if config.wait_for == "quiescent":
+                network_tracker = NetworkActivityTracker()
+                for event, handler in network_tracker.listeners:
+                    page.on(event, handler)
+
+            html = state_html(
+                await page.evaluate(state_js, [container_selector, item_selector])
+            )
+            if html is None:
+                yield state_response(
+                    "", f"Pagination container not found: {container_selector}"
+                )
+                return
+            if not html:
+                yield state_response("", "No items found in the pagination container")
+                return
+            yield state_response(html)
+
+            for index in range(1, max_pages):
+                if stop_condition and await page.evaluate(stop_condition):
+                    break
+                advanced = await self._advance_page(
+                    page, next_action, container_selector, state_timeout
+                )
+                if advanced is None:
+                    # Nothing to click, or the JS reported there is no next page
+                    break
+                if not advanced:
+                    yield state_response(
+                        "",
+                        f"Pagination container did not change within {state_timeout}ms",
+                    )
+                    break
+                if config.wait_for == "quiescent":
+                    await self.wait_for_quiescence(
+                        page,
+                        network_tracker,
+                        idle_time=config.quiescence_idle_time,
+                        timeout=config.quiescence_timeout,
+                    )
+                elif config.wait_for:
+                    await self.smart_wait(page, config.wait_for, timeout=config.page_timeout)
+
+                html = state_html(
+                    await page.evaluate(state_js, [container_selector, item_selector])
+                )
+                if html is None:
+                    yield state_response(
+                        "", f"Pagination container not found: {container_selector}"
+                    )
+                    break
+                if not html:
+                    # The container only shows items seen before
+                    break
+                self.logger.debug(
+                    message="Captured pagination state {index} of {url}",
+                    tag="PAGINATE",
+                    params={"index": index + 1, "url": url},
+                )
+                yield state_response(html)
+        finally:
+            if network_tracker is not None:
+                for event, handler in network_tracker.listeners:
+                    page.remove_listener(event, handler)
+            if owns_session:
+                await self.browser_manager.kill_session(session_id)
+            elif page is not None:
+                self.browser_manager.release_session(session_id)
+
+    async def _advance_page(
+        self, page: Page, next_action: str, container_selector: Optional[str], timeout: int
+    ) -> Optional[bool]:
+        """
+        Run a pagination action and wait for the container to change.
+
+        Returns:
+            bool or None: True once the container changed, False if it did not change
+                          within the timeout, None if there was nothing to click or the
+                          JS returned false
+        """
+        if next_action.startswith("js:"):
+            if await page.evaluate(next_action[3:].strip()) is False:
+                return None
+        else:
+            selector = next_action[4:].strip() if next_action.startswith("css:") else next_action
+            control = await page.query_selector(selector)
+            if (
+                control is None
+                or not await control.is_visible()
+                or not await control.is_enabled()
+            ):
+                return None
+            await control.click()
+
+        try:
+            await page.wait_for_function(
+                """(selector) => {
+                    const container = selector ? document.querySelector(selector) : document.body;
+                    return !!container && container.innerHTML !== window.__crawl4aiPaginationState;
+                }""",
+                arg=container_selector,
+                polling=100,
+                timeout=timeout,
+            )
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
+    async def _fetch_non_html(
+        self, url: str, config: CrawlerRunConfig
+    ) -> Optional[AsyncCrawlResponse]:
+        """
+        Fetch a URL without the browser and process it directly if it is not HTML.
+
+        How it works:
+        1. URLs whose path ends in an HTML extension (.html, .php, ...) go straight to
+           the browser, and so do URLs under a host and directory where an earlier probe
+           found HTML, unless their extension is one of a non-HTML type (.json, .pdf, ...).
+        2. A HEAD request classifies the response from its Content-Type. HTML and
+           unknown types go to the browser without their body ever being requested.
+        3. Otherwise, or if the server rejects HEAD, a streamed GET is classified from
+           its Content-Type and first bytes (see sniff_kind). HTML is dropped after the
+           first chunk.
+        4. Other types are downloaded, up to DIRECT_FETCH_MAX_SIZE, and turned into
+           markdown text and items by their processor. PDFs are parsed in a worker process.
+
+        The fast path is skipped when the browser context carries state the request
+        would miss: cookies, storage_state or a persistent profile.
+
+        Args:
+            url (str): The URL to fetch
+            config (CrawlerRunConfig): The crawler configuration
+
+        Returns:
+            AsyncCrawlResponse or None: The processed response, or None if the browser has
+                                        to crawl the URL.
+        """
+        if (
+            config.session_id
+            or config.screenshot
+            or config.pdf
+            or config.proxy_config
+            or self.browser_config.proxy
+            or self.browser_config.proxy_config
+            or self.browser_config.cookies
+            or self.browser_config.storage_state
+            or self.browser_config.use_managed_browser
+            or is_html_path(url)
+        ):
+            return None
+        prefix = path_prefix(url)
+        if prefix in self._html_prefixes and not is_non_html_path(url):
+            self._html_prefixes.move_to_end(prefix)
+            return None
+
+        headers = dict(self.browser_config.headers)
+        user_agent = config.user_agent or self.browser_config.user_agent
+        if user_agent:
+            headers["User-Agent"] = user_agent
+
+        try:
+            async with httpx.AsyncClient(
+                headers=headers,
+                follow_redirects=True,
+                timeout=config.page_timeout / 1000,
+                verify=not self.browser_config.ignore_https_errors,
+            ) as client:
+                response = await client.head(url)
+                # Servers that do not implement HEAD answer 405 or 501, GET tells instead
+                if response.status_code not in (405, 501):
+                    if response.status_code >= 400:
+                        return None
+                    content_type = response.headers.get("content-type")
+                    media_type = (content_type or "").split(";")[0].strip().lower()
+                    if media_type not in GENERIC_MEDIA_TYPES:
+                        kind = sniff_kind(content_type, b"")
+                        if kind == "html":
+                            self._remember_prefix(prefix, html=True)
+                        if kind in (None, "html") or (kind == "pdf" and not is_pdf_supported()):
+                            return None
+                    length = response.headers.get("content-length", "")
+                    if length.isdigit() and int(length) > DIRECT_FETCH_MAX_SIZE:
+                        return None
+
+                async with client.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        return None
+                    chunks = response.aiter_bytes()
+                    try:
+                        head = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        head = b""
+                    kind = sniff_kind(response.headers.get("content-type"), head)
+                    self._remember_prefix(prefix, html=kind == "html")
+                    if kind in (None, "html") or (kind == "pdf" and not is_pdf_supported()):
+                        return None
+
+                    body = bytearray(head)
+                    async for chunk in chunks:
+                        body.extend(chunk)
+                        if len(body) > DIRECT_FETCH_MAX_SIZE:
+                            return None
+
+                    encoding = response.encoding or "utf-8"
+                    text, items = await process_content(kind, bytes(body), encoding)
+        except Exception as e:
+            self.logger.debug(
+                message="Direct fetch of {url} failed, using the browser: {error}",
+                tag="FETCH",
+                params={"url": url, "error": str(e)},
+            )
+            return None
+
+        self.logger.debug(
+            message="Processed {url} as {kind} without the browser ({size} bytes)",
+            tag="FETCH",
+            params={"url": url, "kind": kind, "size": len(body)},
+        )
+        return AsyncCrawlResponse(
+            # The raw document for text formats, PDFs have no readable source
+            html=(
+                "<html><body></body></html>"
+                if kind == "pdf"
+                else bytes(body).decode(encoding, errors="replace")
+            ),
+            response_headers=dict(response.headers),
+            status_code=response.status_code,
+            redirected_url=str(response.url),
+            get_delayed_content=None,
+            text=text or "",
+            extracted_items=items,
+        )
+
+    def _remember_prefix(self, prefix: tuple, html: bool):
+        """Record whether a probe under a host and directory prefix found an HTML page."""
+        if not html:
+            self._html_prefixes.pop(prefix, None)
+            return
+        self._html_prefixes[prefix] = None
+        self._html_prefixes.move_to_end(prefix)
+        while len(self._html_prefixes) > DIRECT_FETCH_PREFIX_CACHE_SIZE:
+            self._html_prefixes.popitem(last=False)
+
     async def _crawl_web(
         self, url: str, config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
@@ -1282,17 +3405,25 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Get page for session
         page, context = await self.browser_manager.get_page(crawlerRunConfig=config)
 
-        # Add default cookie
-        await context.add_cookies(
-            [{"name": "cookiesEnabled", "value": "true", "url": url}]
-        )
+        try:
+            # Add default cookie and navigator overrides, each installed once per context
+            await add_cookies_once(context, [default_cookie(url)])
+            if config.override_navigator or config.simulate_user or config.magic:
+                await add_init_script_once(context, "navigator_overrider")
 
-        # Handle navigator overrides
-        if config.override_navigator or config.simulate_user or config.magic:
-            await context.add_init_script(load_js_script("navigator_overrider"))
+            # Call hook after page creation
+            await self.execute_hook(
+                "on_page_context_created", page, context=context, config=config
+            )
+        except Exception:
+            if config.session_id:
+                self.browser_manager.release_session(config.session_id)
+            else:
+                await self.browser_manager.release_page(page, context)
+            raise
 
-        # Call hook after page creation
-        await self.execute_hook("on_page_context_created", page, context=context, config=config)
+        # Listeners attached for this crawl only, detached before the page is released
+        page_listeners = []
 
         # Set up console logging if requested
         if config.log_console:
@@ -1313,23 +3444,49 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"msg": msg.text},
                     )
 
-            page.on("console", log_consol)
-            page.on("pageerror", lambda e: log_consol(e, "error"))
+            page_listeners.append(("console", log_consol))
+            page_listeners.append(("pageerror", lambda e: log_consol(e, "error")))
 
-        try:
-            # Get SSL certificate information if requested and URL is HTTPS
-            ssl_cert = None
-            if config.fetch_ssl_certificate:
-                ssl_cert = SSLCertificate.from_url(url)
+        # A crashed renderer leaves the page unusable, it must not go back to a page pool
+        page_crashed = False
+
+        def on_crash(_):
+            nonlocal page_crashed
+            page_crashed = True
+
+        page_listeners.append(("crash", on_crash))
 
-            # Set up download handling
-            if self.browser_config.accept_downloads:
-                page.on(
+        # Track in-flight requests for quiescence detection
+        network_tracker = None
+        if config.wait_for == "quiescent":
+            network_tracker = NetworkActivityTracker()
+            page_listeners.extend(network_tracker.listeners)
+
+        # Record request timings for performance diagnosis
+        network_timing = None
+        if config.capture_network_timing:
+            network_timing = NetworkTimingRecorder()
+            page_listeners.extend(network_timing.listeners)
+
+        # Set up download handling
+        if self.browser_config.accept_downloads:
+            page_listeners.append(
+                (
                     "download",
                     lambda download: asyncio.create_task(
                         self._handle_download(download)
                     ),
                 )
+            )
+
+        for event, handler in page_listeners:
+            page.on(event, handler)
+
+        ssl_task = None
+        try:
+            # Get SSL certificate information if requested, while the page loads
+            if config.fetch_ssl_certificate:
+                ssl_task = asyncio.ensure_future(SSLCertificate.afrom_url(url))
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -1353,6 +3510,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 except Error as e:
                     raise RuntimeError(f"Failed on navigating ACS-GOTO:\n{str(e)}")
 
+                if network_timing:
+                    network_timing.mark("navigation")
+
                 await self.execute_hook(
                     "after_goto", page, context=context, url=url, response=response, config=config
                 )
@@ -1451,7 +3611,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 config.wait_for_images or config.adjust_viewport_to_content
             ):
                 await page.wait_for_load_state("domcontentloaded")
-                await asyncio.sleep(0.1)
+                # Quiescence detection waits for late content below, no need to pad here
+                if config.wait_for != "quiescent":
+                    await asyncio.sleep(0.1)
 
                 # Check for image loading with improved error handling
                 images_loaded = await self.csp_compliant_wait(
@@ -1504,9 +3666,17 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"error": str(e)},
                     )
 
-            # Handle full page scanning
-            if config.scan_full_page:
-                await self._handle_full_page_scan(page, config.scroll_delay)
+            # Handle full page scanning. Harvesting scrolls the page itself.
+            harvested_items = None
+            if config.harvest_schema:
+                harvested_items = await self._harvest_items(page, config, context)
+            elif config.scan_full_page:
+                await self._handle_full_page_scan(
+                    page,
+                    config.scroll_delay,
+                    max_steps=config.max_scroll_steps,
+                    timeout=config.page_timeout,
+                )
 
             # Execute JavaScript if provided
             # if config.js_code:
@@ -1542,7 +3712,19 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if not config.wait_for and config.css_selector and False:
                 config.wait_for = f"css:{config.css_selector}"
 
-            if config.wait_for:
+            if config.wait_for == "quiescent":
+                if not await self.wait_for_quiescence(
+                    page,
+                    network_tracker,
+                    idle_time=config.quiescence_idle_time,
+                    timeout=config.quiescence_timeout,
+                ):
+                    self.logger.warning(
+                        message="Page did not become quiescent within {timeout}s",
+                        tag="SCRAPE",
+                        params={"timeout": config.quiescence_timeout},
+                    )
+            elif config.wait_for:
                 try:
                     await self.smart_wait(
                         page, config.wait_for, timeout=config.page_timeout
@@ -1550,6 +3732,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 except Exception as e:
                     raise RuntimeError(f"Wait condition failed: {str(e)}")
 
+            if network_timing:
+                # Everything after navigation up to here: body visibility, scrolling, JS, waits
+                network_timing.mark("wait")
+
             # Update image dimensions if needed
             if not self.browser_config.text_mode:
                 update_image_dimensions_js = load_js_script("update_image_dimensions")
@@ -1566,47 +3752,130 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                         params={"error": str(e)},
                     )
 
-            # Process iframes if needed
-            if config.process_iframes:
-                page = await self.process_iframes(page)
+            # Capture iframes if needed. A DOM snapshot inlines same-process frames itself.
+            iframe_contents = None
+            if config.process_iframes and config.capture_mode != "snapshot":
+                iframe_contents = await self.process_iframes(page, timeout=config.iframe_timeout)
 
             # Pre-content retrieval hooks and delay
             await self.execute_hook("before_retrieve_html", page, context=context, config=config)
-            if config.delay_before_return_html:
-                await asyncio.sleep(config.delay_before_return_html)
+            delay_before_return_html = config.delay_before_return_html
+            if delay_before_return_html is None:
+                # A quiescent page has no late content left to pad for
+                delay_before_return_html = (
+                    0 if config.wait_for == "quiescent" else DELAY_BEFORE_RETURN_HTML
+                )
+            if delay_before_return_html:
+                await asyncio.sleep(delay_before_return_html)
 
             # Handle overlay removal
             if config.remove_overlay_elements:
                 await self.remove_overlay_elements(page)
 
             # Get final HTML content
-            html = await page.content()
+            # Run a JSON CSS schema in the page, Python extracts from the HTML if it cannot
+            extracted_items = harvested_items
+            extraction_strategy = config.extraction_strategy
+            if extracted_items is None and getattr(extraction_strategy, "in_browser", False):
+                extracted_items = await self._extract_in_browser(page, extraction_strategy)
+            # Text output builds its markdown in the page, from the rendered DOM
+            text = None
+            if config.output_mode == "text":
+                text = await self.capture_text(page, config)
+            skip_html = (
+                harvested_items is not None
+                or text is not None
+                or (extracted_items is not None and not extraction_strategy.return_html)
+            )
+
+            # Results without the full page HTML are not cached under the URL
+            cacheable = not skip_html
+            html = None
+            if skip_html:
+                # The extracted items or text are the content, the document is never serialized
+                html = "<html><body></body></html>"
+            elif config.capture_mode == "snapshot":
+                html = await self.capture_dom_snapshot(
+                    page,
+                    exclude_hidden=config.exclude_hidden_elements,
+                    inline_iframes=config.process_iframes,
+                )
+            elif config.capture_mode == "pruned":
+                html = await self.capture_pruned_html(page, config)
+                # Pruned HTML depends on this config's selectors, other crawls need the full page
+                cacheable = cacheable and html is None
+            if html is None:
+                html = await page.content()
+            if iframe_contents and not skip_html:
+                html = merge_iframe_contents(html, iframe_contents)
             await self.execute_hook(
                 "before_return_html", page=page, html=html, context=context, config=config
             )
 
+            if network_timing:
+                network_timing.mark("extraction")
+
+            blocked_requests = self.browser_manager.pop_blocked_requests(page, context)
+            if blocked_requests:
+                self.logger.debug(
+                    message="Blocked {count} requests for {url}",
+                    tag="BLOCK",
+                    params={"count": blocked_requests, "url": url},
+                )
+
             # Handle PDF and screenshot generation
             start_export_time = time.perf_counter()
             pdf_data = None
             screenshot_data = None
 
+            pdf_artifact = None
             if config.pdf:
                 pdf_data = await self.export_pdf(page)
+                if config.store_artifacts:
+                    pdf_artifact = await artifact_store.put(pdf_data, "application/pdf")
+                    pdf_data = None
 
+            screenshot_path = None
+            screenshot_artifact = None
             if config.screenshot:
                 if config.screenshot_wait_for:
                     await asyncio.sleep(config.screenshot_wait_for)
-                screenshot_data = await self.take_screenshot(
-                    page, screenshot_height_threshold=config.screenshot_height_threshold
+                screenshot = await self.capture_screenshot(
+                    page,
+                    screenshot_height_threshold=config.screenshot_height_threshold,
+                    image_format=config.screenshot_format,
+                    quality=config.screenshot_quality,
+                    max_dimension=config.screenshot_max_dimension,
                 )
+                if config.store_artifacts:
+                    screenshot_artifact = await artifact_store.put(
+                        screenshot, f"image/{config.screenshot_format}"
+                    )
+                elif config.screenshot_dir:
+                    screenshot_path = await asyncio.to_thread(
+                        self._save_screenshot,
+                        screenshot,
+                        config.screenshot_dir,
+                        config.screenshot_format,
+                    )
+                else:
+                    screenshot_data = await asyncio.to_thread(
+                        lambda: base64.b64encode(screenshot).decode("utf-8")
+                    )
 
-            if screenshot_data or pdf_data:
+            if config.screenshot or config.pdf:
                 self.logger.info(
                     message="Exporting PDF and taking screenshot took {duration:.2f}s",
                     tag="EXPORT",
                     params={"duration": time.perf_counter() - start_export_time},
                 )
 
+            downloaded_artifacts = None
+            if config.store_artifacts and self._downloaded_files:
+                downloaded_artifacts = [
+                    await artifact_store.put_file(path) for path in self._downloaded_files
+                ]
+
             # Define delayed content getter
             async def get_delayed_content(delay: float = 5.0) -> str:
                 self.logger.info(
@@ -1617,6 +3886,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await asyncio.sleep(delay)
                 return await page.content()
 
+            ssl_cert = await ssl_task if ssl_task else None
+
+            network_timing_summary = None
+            if network_timing:
+                network_timing.mark("export")
+                network_timing_summary = await network_timing.summarize()
+
             # Return complete response
             return AsyncCrawlResponse(
                 html=html,
@@ -1630,73 +3906,216 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     self._downloaded_files if self._downloaded_files else None
                 ),
                 redirected_url=redirected_url,
+                blocked_requests=blocked_requests,
+                screenshot_path=screenshot_path,
+                screenshot_artifact=screenshot_artifact,
+                pdf_artifact=pdf_artifact,
+                downloaded_artifacts=downloaded_artifacts,
+                network_timing=network_timing_summary,
+                extracted_items=extracted_items,
+                text=text,
+                cacheable=cacheable,
             )
 
         except Exception as e:
+            # Tell crashes apart from ordinary failures by the state of the page and
+            # browser, so that crawl only retries the former
+            browser = context.browser
+            if page_crashed or (browser is not None and not browser.is_connected()):
+                raise BrowserCrashError(f"Browser crashed while crawling {url}: {e}") from e
             raise e
 
         finally:
-            # If no session_id is given we should close the page
+            if ssl_task and not ssl_task.done():
+                ssl_task.cancel()
+
+            # Listeners belong to this crawl, session pages must not accumulate them
+            for event, handler in page_listeners:
+                page.remove_listener(event, handler)
+
+            # If no session_id is given we should release the page
             if not config.session_id:
-                await page.close()
+                await self.browser_manager.release_page(
+                    page,
+                    context,
+                    reusable=not (config.adjust_viewport_to_content or page_crashed),
+                )
+            else:
+                self.browser_manager.release_session(config.session_id)
 
-    async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
+    async def _handle_full_page_scan(
+        self,
+        page: Page,
+        scroll_delay: float = 0.1,
+        max_steps: int = 0,
+        timeout: float = PAGE_TIMEOUT,
+    ):
         """
         Helper method to handle full page scanning.
 
         How it works:
-        1. Get the viewport height.
-        2. Scroll to the bottom of the page.
-        3. Get the total height of the page.
-        4. Scroll back to the top of the page.
-        5. Scroll to the bottom of the page again.
-        6. Continue scrolling until the bottom of the page is reached.
+        1. Inject a scan routine that runs entirely inside the page, in one evaluate.
+        2. It scrolls down one viewport at a time, yielding two animation frames per step
+           so that lazy loaders can react.
+        3. At the bottom it waits up to scroll_delay (via a ResizeObserver) for infinite
+           scroll content to grow the page, and keeps scrolling if it did.
+        4. It stops at the bottom, after max_steps steps or when the timeout expires, and
+           leaves the page scrolled to the bottom.
 
         Args:
             page (Page): The Playwright page object
-            scroll_delay (float): The delay between page scrolls
-
+            scroll_delay (float): Seconds to wait at the bottom for the page to grow
+            max_steps (int): Maximum number of viewport scrolls, 0 for no limit
+            timeout (float): Maximum time for the whole scan, in milliseconds
         """
         try:
-            viewport_height = page.viewport_size.get(
-                "height", self.browser_config.viewport_height
+            scan_js = "(args) => ({})(args, ({})())".format(
+                load_js_script("full_page_scan"), load_js_script("scroll_helpers")
+            )
+            result = await page.evaluate(
+                scan_js,
+                {
+                    "scrollDelay": int(scroll_delay * 1000),
+                    "maxSteps": max_steps,
+                    "timeout": timeout,
+                },
+            )
+            self.logger.debug(
+                message="Scanned page in {steps} steps | Height: {height}px | Growths: {growths}",
+                tag="PAGE_SCAN",
+                params=result,
+            )
+            if result["timedOut"]:
+                self.logger.warning(
+                    message="Full page scan stopped after {timeout}ms",
+                    tag="PAGE_SCAN",
+                    params={"timeout": timeout},
+                )
+        except Exception as e:
+            self.logger.warning(
+                message="Failed to perform full page scan: {error}",
+                tag="PAGE_SCAN",
+                params={"error": str(e)},
             )
-            current_position = viewport_height
 
-            # await page.evaluate(f"window.scrollTo(0, {current_position})")
-            await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
-            # await self.csp_scroll_to(page, 0, current_position)
-            # await asyncio.sleep(scroll_delay)
+    async def _harvest_items(
+        self, page: Page, config: CrawlerRunConfig, context: BrowserContext = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scroll through an infinite or virtualized feed and harvest its items on the way.
 
-            # total_height = await page.evaluate("document.documentElement.scrollHeight")
-            dimensions = await self.get_page_dimensions(page)
-            total_height = dimensions["height"]
+        How it works:
+        1. Runs the harvest routine in the page for up to HARVEST_BATCH_STEPS viewport scrolls.
+           After every scroll it extracts the items matching config.harvest_schema.
+        2. Items are deduplicated in the page, so each run only returns new ones. They are
+           passed to the on_items_harvested hook as they arrive.
+        3. Runs again until the page stops growing, max_harvested_items or max_scroll_steps
+           is reached, or page_timeout expires.
+
+        Args:
+            page (Page): The Playwright page object
+            config (CrawlerRunConfig): The crawler configuration holding the schema and limits
+            context (BrowserContext): The browser context of the page, passed to the hook
+
+        Returns:
+            List[Dict[str, Any]]: The harvested items, in the order they were found
+        """
+        harvest_js = "(args) => ({})(args, {}, ({})())".format(
+            load_js_script("harvest_items"),
+            load_js_script("json_css_extract"),
+            load_js_script("scroll_helpers"),
+        )
+        deadline = time.monotonic() + config.page_timeout / 1000
+        items = []
+        steps = 0
+        try:
+            while True:
+                remaining = (deadline - time.monotonic()) * 1000
+                if remaining <= 0:
+                    self.logger.warning(
+                        message="Harvesting stopped after {timeout}ms",
+                        tag="PAGE_SCAN",
+                        params={"timeout": config.page_timeout},
+                    )
+                    break
+                max_steps = HARVEST_BATCH_STEPS
+                if config.max_scroll_steps:
+                    max_steps = min(max_steps, config.max_scroll_steps - steps)
+                batch = await page.evaluate(
+                    harvest_js,
+                    {
+                        "schema": config.harvest_schema,
+                        "maxSteps": max_steps,
+                        "scrollDelay": int(config.scroll_delay * 1000),
+                        "timeout": remaining,
+                        "reset": steps == 0 and not items,
+                    },
+                )
+                steps += batch["steps"]
+
+                new_items = batch["items"]
+                if config.max_harvested_items:
+                    new_items = new_items[: config.max_harvested_items - len(items)]
+                if new_items:
+                    items.extend(new_items)
+                    await self.execute_hook(
+                        "on_items_harvested", page, items=new_items, context=context, config=config
+                    )
+
+                if (
+                    batch["done"]
+                    or (config.max_harvested_items and len(items) >= config.max_harvested_items)
+                    or (config.max_scroll_steps and steps >= config.max_scroll_steps)
+                ):
+                    break
+        except Exception as e:
+            self.logger.warning(
+                message="Failed to harvest items: {error}",
+                tag="PAGE_SCAN",
+                params={"error": str(e)},
+            )
 
-            while current_position < total_height:
-                current_position = min(current_position + viewport_height, total_height)
-                await self.safe_scroll(page, 0, current_position, delay=scroll_delay)
-                # await page.evaluate(f"window.scrollTo(0, {current_position})")
-                # await asyncio.sleep(scroll_delay)
+        self.logger.debug(
+            message="Harvested {count} items in {steps} steps",
+            tag="PAGE_SCAN",
+            params={"count": len(items), "steps": steps},
+        )
+        return items
 
-                # new_height = await page.evaluate("document.documentElement.scrollHeight")
-                dimensions = await self.get_page_dimensions(page)
-                new_height = dimensions["height"]
+    async def _extract_in_browser(
+        self, page: Page, extraction_strategy: ExtractionStrategy
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run a JsonCssExtractionStrategy schema inside the page.
 
-                if new_height > total_height:
-                    total_height = new_height
+        Only the extracted items cross over to Python, instead of the whole HTML that
+        BeautifulSoup would then parse and select from.
 
-            # await page.evaluate("window.scrollTo(0, 0)")
-            await self.safe_scroll(page, 0, 0)
+        Args:
+            page (Page): The Playwright page object
+            extraction_strategy (ExtractionStrategy): A strategy with in_browser set
 
+        Returns:
+            List[Dict[str, Any]]: The extracted items, or None if the schema cannot run in
+                                  the page and Python has to extract them from the HTML
+        """
+        if not extraction_strategy.can_run_in_browser():
+            self.logger.debug(
+                message="Schema cannot run in the page, extracting in Python",
+                tag="EXTRACT",
+            )
+            return None
+        try:
+            return await page.evaluate(
+                load_js_script("json_css_extract"), extraction_strategy.schema
+            )
         except Exception as e:
             self.logger.warning(
-                message="Failed to perform full page scan: {error}",
-                tag="PAGE_SCAN",
+                message="In-page extraction failed, extracting in Python: {error}",
+                tag="EXTRACT",
                 params={"error": str(e)},
             )
-        else:
-            # await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await self.safe_scroll(page, 0, total_height)
+            return None
 
     async def _handle_download(self, download):
         """
@@ -1800,20 +4219,132 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
         Args:
             page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+            kwargs: Additional keyword arguments passed to capture_screenshot
 
         Returns:
             str: The base64-encoded screenshot data
         """
-        need_scroll = await self.page_need_scroll(page)
+        screenshot = await self.capture_screenshot(page, **kwargs)
+        return await asyncio.to_thread(
+            lambda: base64.b64encode(screenshot).decode("utf-8")
+        )
 
-        if not need_scroll:
-            # Page is short enough, just take a screenshot
-            return await self.take_screenshot_naive(page)
-        else:
-            # Page is too long, try to take a full-page screenshot
-            return await self.take_screenshot_scroller(page, **kwargs)
-            # return await self.take_screenshot_from_pdf(await self.export_pdf(page))
+    async def capture_screenshot(
+        self,
+        page: Page,
+        screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        image_format: str = "png",
+        quality: int = 80,
+        max_dimension: int = 0,
+        **kwargs,
+    ) -> bytes:
+        """
+        Capture a full-page screenshot as encoded image bytes.
+
+        How it works:
+        1. On Chromium, capture the page with CDP Page.captureScreenshot and
+           captureBeyondViewport, directly in the requested format, without resizing the
+           viewport or scrolling. Pages taller than screenshot_height_threshold are
+           captured as several clips.
+        2. Elsewhere, fall back to Playwright's full-page screenshot.
+        3. Stitching, downscaling and re-encoding, when needed, run in a worker thread.
+
+        Args:
+            page (Page): The Playwright page object
+            screenshot_height_threshold (int): Maximum height in pixels of a single capture
+            image_format (str): "png", "jpeg" or "webp"
+            quality (int): Quality from 0 to 100 for JPEG and WebP
+            max_dimension (int): Downscale so that neither side exceeds this many pixels,
+                                 0 for no limit
+
+        Returns:
+            bytes: The encoded image
+        """
+        try:
+            segments = await self._capture_beyond_viewport(
+                page, image_format, quality, screenshot_height_threshold
+            )
+            if segments is None:
+                options = {"full_page": True, "type": "png"}
+                if image_format == "jpeg":
+                    options.update(type="jpeg", quality=quality)
+                segments = [await page.screenshot(**options)]
+            return await asyncio.to_thread(
+                encode_screenshot, segments, image_format, quality, max_dimension
+            )
+        except Exception as e:
+            error_message = f"Failed to take screenshot: {str(e)}"
+            self.logger.error(
+                message="Screenshot failed: {error}",
+                tag="ERROR",
+                params={"error": error_message},
+            )
+
+            # Generate an error image
+            img = Image.new("RGB", (800, 600), color="black")
+            draw = ImageDraw.Draw(img)
+            font = ImageFont.load_default()
+            draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
+
+            buffered = BytesIO()
+            img.save(buffered, format=SCREENSHOT_FORMATS[image_format], quality=quality)
+            return buffered.getvalue()
+
+    @staticmethod
+    def _save_screenshot(screenshot: bytes, directory: str, image_format: str) -> str:
+        """Write a screenshot under a content-derived name and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        extension = "jpg" if image_format == "jpeg" else image_format
+        name = hashlib.sha256(screenshot).hexdigest()[:32]
+        path = os.path.join(directory, f"{name}.{extension}")
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(screenshot)
+        return path
+
+    async def _capture_beyond_viewport(
+        self, page: Page, image_format: str, quality: int, segment_height: int
+    ) -> Optional[List[bytes]]:
+        """
+        Capture the whole page with CDP, in clips of at most segment_height pixels.
+
+        Returns:
+            List[bytes] or None: The captured clips, or None if CDP is not available
+        """
+        try:
+            cdp = await page.context.new_cdp_session(page)
+        except Exception:
+            return None
+
+        try:
+            metrics = await cdp.send("Page.getLayoutMetrics")
+            content = metrics.get("cssContentSize") or metrics["contentSize"]
+            width = max(1, math.ceil(content["width"]))
+            height = max(1, math.ceil(content["height"]))
+
+            segments = []
+            for y in range(0, height, segment_height):
+                params = {
+                    "format": image_format,
+                    "captureBeyondViewport": True,
+                    "clip": {
+                        "x": 0,
+                        "y": y,
+                        "width": width,
+                        "height": min(segment_height, height - y),
+                        "scale": 1,
+                    },
+                }
+                if image_format != "png":
+                    params["quality"] = quality
+                result = await cdp.send("Page.captureScreenshot", params)
+                segments.append(await asyncio.to_thread(base64.b64decode, result["data"]))
+            return segments
+        finally:
+            try:
+                await cdp.detach()
+            except Exception:
+                pass
 
     async def take_screenshot_from_pdf(self, pdf_data: bytes) -> str:
         """
@@ -1,4 +1,5 @@
 import os
+import base64
 from pathlib import Path
 import aiosqlite
 import asyncio
@@ -8,6 +9,7 @@ import logging
 import json  # Added for serialization/deserialization
 from .utils import ensure_content_dirs, generate_content_hash
 from .models import CrawlResult, MarkdownGenerationResult
+from .artifact_store import artifact_store, ArtifactHandle, guess_image_type
 import aiofiles
 from .version_manager import VersionManager
 from .async_logger import AsyncLogger
@@ -18,6 +20,9 @@ from .utils import get_error_context, create_box_message
 # logger = logging.getLogger(__name__)
 # logger.setLevel(logging.INFO)
 
+# Prefix of column values that hold an artifact handle rather than a content hash
+ARTIFACT_PREFIX = "artifact:"
+
 base_directory = DB_PATH = os.path.join(
     os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai"
 )
@@ -55,6 +60,7 @@ class AsyncDatabaseManager:
 
             # Always ensure base table exists
             await self.ainit_db()
+            await self.update_db_schema()
 
             # Verify the table exists
             async with aiosqlite.connect(self.db_path, timeout=30.0) as db:
@@ -240,7 +246,8 @@ class AsyncDatabaseManager:
                     metadata TEXT DEFAULT "{}",
                     screenshot TEXT DEFAULT "",
                     response_headers TEXT DEFAULT "{}",
-                    downloaded_files TEXT DEFAULT "{}"  -- New column added
+                    downloaded_files TEXT DEFAULT "{}",  -- New column added
+                    pdf TEXT DEFAULT ""
                 )
             """
             )
@@ -261,6 +268,7 @@ class AsyncDatabaseManager:
                 "screenshot",
                 "response_headers",
                 "downloaded_files",
+                "pdf",
             ]
 
             for column in new_columns:
@@ -300,15 +308,28 @@ class AsyncDatabaseManager:
                 # Create dict from row data
                 row_dict = dict(zip(columns, row))
 
+                # Screenshots and PDFs stored as artifacts are only referenced here,
+                # their content is loaded lazily through the handle
+                for field in ("screenshot", "pdf"):
+                    value = row_dict.pop(field, None) or ""
+                    if value.startswith(ARTIFACT_PREFIX):
+                        row_dict[f"{field}_artifact"] = ArtifactHandle.model_validate_json(
+                            value[len(ARTIFACT_PREFIX) :]
+                        )
+                    elif field == "screenshot":
+                        row_dict[field] = value
+
                 # Load content from files using stored hashes
                 content_fields = {
                     "html": row_dict["html"],
                     "cleaned_html": row_dict["cleaned_html"],
                     "markdown": row_dict["markdown"],
                     "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
                 }
+                if row_dict.get("screenshot"):
+                    # Legacy rows keep base64 screenshots as text files
+                    content_fields["screenshot"] = row_dict["screenshot"]
+                    content_fields["screenshots"] = row_dict["screenshot"]
 
                 for field, hash_value in content_fields.items():
                     if hash_value:
@@ -380,7 +401,6 @@ class AsyncDatabaseManager:
             "cleaned_html": (result.cleaned_html or "", "cleaned"),
             "markdown": None,
             "extracted_content": (result.extracted_content or "", "extracted"),
-            "screenshot": (result.screenshot or "", "screenshots"),
         }
 
         try:
@@ -419,15 +439,30 @@ class AsyncDatabaseManager:
         for field, (content, content_type) in content_map.items():
             content_hashes[field] = await self._store_content(content, content_type)
 
+        # Screenshots and PDFs go to the binary artifact store instead of base64 text files
+        screenshot_artifact = result.screenshot_artifact
+        if screenshot_artifact is None and result.screenshot:
+            screenshot = await asyncio.to_thread(base64.b64decode, result.screenshot)
+            screenshot_artifact = await artifact_store.put(
+                screenshot, guess_image_type(screenshot)
+            )
+        pdf_artifact = result.pdf_artifact
+        if pdf_artifact is None and result.pdf:
+            pdf_artifact = await artifact_store.put(result.pdf, "application/pdf")
+        for field, artifact in (("screenshot", screenshot_artifact), ("pdf", pdf_artifact)):
+            content_hashes[field] = (
+                ARTIFACT_PREFIX + artifact.model_dump_json() if artifact else ""
+            )
+
         async def _cache(db):
             await db.execute(
                 """
                 INSERT INTO crawled_data (
                     url, html, cleaned_html, markdown,
                     extracted_content, success, media, links, metadata,
-                    screenshot, response_headers, downloaded_files
+                    screenshot, response_headers, downloaded_files, pdf
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(url) DO UPDATE SET
                     html = excluded.html,
                     cleaned_html = excluded.cleaned_html,
@@ -439,7 +474,8 @@ class AsyncDatabaseManager:
                     metadata = excluded.metadata,
                     screenshot = excluded.screenshot,
                     response_headers = excluded.response_headers,
-                    downloaded_files = excluded.downloaded_files
+                    downloaded_files = excluded.downloaded_files,
+                    pdf = excluded.pdf
             """,
                 (
                     result.url,
@@ -454,6 +490,7 @@ class AsyncDatabaseManager:
                     content_hashes["screenshot"],
                     json.dumps(result.response_headers or {}),
                     json.dumps(result.downloaded_files or []),
+                    content_hashes["pdf"],
                 ),
             )
 
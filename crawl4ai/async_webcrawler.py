@@ -101,6 +101,7 @@ class AsyncWebCrawler:
             awarmup(): Perform warmup sequence.
             arun_many(): Run the crawler for multiple sources.
             aprocess_html(): Process HTML content.
+            aprocess_text(): Build a result from text built in the page (output_mode="text").
 
     Typical Usage:
         async with AsyncWebCrawler() as crawler:
@@ -243,16 +244,41 @@ class AsyncWebCrawler:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    async def awarmup(self):
+    async def awarmup(
+        self,
+        configs: Optional[List[CrawlerRunConfig]] = None,
+        pages_per_context: int = 1,
+    ):
         """
         Initialize the crawler with warm-up sequence.
 
         This method:
         1. Logs initialization info
-        2. Sets up browser configuration
+        2. Pre-creates the browser contexts for the given crawler configs and pre-opens
+           pages in them, so the first crawls skip context creation and setup
         3. Marks the crawler as ready
+
+        Args:
+            configs (List[CrawlerRunConfig]): Configs the upcoming crawls will use. If None,
+                                              no contexts are pre-created.
+            pages_per_context (int): Number of pages to pre-open in each context. They are
+                                     kept for reuse when BrowserConfig.page_pool_size > 0.
         """
-        self.logger.info(f"Crawl4AI {crawl4ai_version}", tag="INIT")
+        if not self.ready:
+            self.logger.info(f"Crawl4AI {crawl4ai_version}", tag="INIT")
+
+        if configs and hasattr(self.crawler_strategy, "warmup"):
+            start_time = time.perf_counter()
+            await self.crawler_strategy.warmup(configs, pages_per_context)
+            self.logger.info(
+                message="Warmed up {count} context(s) | Time: {timing}",
+                tag="INIT",
+                params={
+                    "count": len(configs),
+                    "timing": f"{time.perf_counter() - start_time:.2f}s",
+                },
+            )
+
         self.ready = True
 
     @asynccontextmanager
@@ -384,8 +410,10 @@ class AsyncWebCrawler:
                 extracted_content = None
                 start_time = time.perf_counter()
 
-                # Try to get cached result if appropriate
-                if cache_context.should_read():
+                # Try to get cached result if appropriate. Text and harvested items are built
+                # in the page and never cached, a cached full page is not what those runs ask for.
+                builds_in_page = config.output_mode == "text" or config.harvest_schema is not None
+                if cache_context.should_read() and not builds_in_page:
                     cached_result = await async_db_manager.aget_cached_url(url)
 
                 if cached_result:
@@ -398,6 +426,15 @@ class AsyncWebCrawler:
                         if not extracted_content or extracted_content == "[]"
                         else extracted_content
                     )
+                    # Cached screenshots and PDFs are artifacts, only load them when asked for
+                    if not config.store_artifacts:
+                        if config.screenshot and cached_result.screenshot_artifact:
+                            cached_result.screenshot = (
+                                await cached_result.screenshot_artifact.read_base64()
+                            )
+                        if config.pdf and cached_result.pdf_artifact:
+                            cached_result.pdf = await cached_result.pdf_artifact.read()
+
                     # If screenshot is requested but its not in cache, then set cache_result to None
                     screenshot_data = cached_result.screenshot
                     pdf_data = cached_result.pdf
@@ -438,6 +475,12 @@ class AsyncWebCrawler:
 
                     html = sanitize_input_encode(async_response.html)
                     screenshot_data = async_response.screenshot
+                    if async_response.extracted_items is not None:
+                        # Items harvested while scrolling or extracted in the page replace
+                        # the extraction strategy
+                        extracted_content = json.dumps(
+                            async_response.extracted_items, indent=4, default=str, ensure_ascii=False
+                        )
                     pdf_data = async_response.pdf_data
 
                     t2 = time.perf_counter()
@@ -448,18 +491,29 @@ class AsyncWebCrawler:
                         tag="FETCH",
                     )
 
-                    # Process the HTML content
-                    crawl_result : CrawlResult = await self.aprocess_html(
-                        url=url,
-                        html=html,
-                        extracted_content=extracted_content,
-                        config=config,  # Pass the config object instead of individual parameters
-                        screenshot=screenshot_data,
-                        pdf_data=pdf_data,
-                        verbose=config.verbose,
-                        is_raw_html=True if url.startswith("raw:") else False,
-                        **kwargs,
-                    )
+                    # Process the HTML content, or the text built in the page
+                    if async_response.text is not None:
+                        crawl_result: CrawlResult = await self.aprocess_text(
+                            url=url,
+                            text=async_response.text,
+                            html=html,
+                            extracted_content=extracted_content,
+                            config=config,
+                            screenshot=screenshot_data,
+                            pdf_data=pdf_data,
+                        )
+                    else:
+                        crawl_result : CrawlResult = await self.aprocess_html(
+                            url=url,
+                            html=html,
+                            extracted_content=extracted_content,
+                            config=config,  # Pass the config object instead of individual parameters
+                            screenshot=screenshot_data,
+                            pdf_data=pdf_data,
+                            verbose=config.verbose,
+                            is_raw_html=True if url.startswith("raw:") else False,
+                            **kwargs,
+                        )
 
                     crawl_result.status_code = async_response.status_code
                     crawl_result.redirected_url = async_response.redirected_url or url
@@ -468,6 +522,12 @@ class AsyncWebCrawler:
                     crawl_result.ssl_certificate = (
                         async_response.ssl_certificate
                     )  # Add SSL certificate
+                    crawl_result.blocked_requests = async_response.blocked_requests
+                    crawl_result.screenshot_path = async_response.screenshot_path
+                    crawl_result.screenshot_artifact = async_response.screenshot_artifact
+                    crawl_result.pdf_artifact = async_response.pdf_artifact
+                    crawl_result.downloaded_artifacts = async_response.downloaded_artifacts
+                    crawl_result.network_timing = async_response.network_timing
 
                     # # Check and set values from async_response to crawl_result
                     # try:
@@ -506,8 +566,13 @@ class AsyncWebCrawler:
                         },
                     )
 
-                    # Update cache if appropriate
-                    if cache_context.should_write() and not bool(cached_result):
+                    # Update cache if appropriate. Text or items built in the page stand in
+                    # for the document and must not be served to a later crawl of the URL.
+                    if (
+                        cache_context.should_write()
+                        and not bool(cached_result)
+                        and async_response.cacheable
+                    ):
                         await async_db_manager.acache_url(crawl_result)
 
                     return crawl_result
@@ -714,6 +779,73 @@ class AsyncWebCrawler:
             error_message="",
         )
 
+    async def aprocess_text(
+        self,
+        url: str,
+        text: str,
+        html: str,
+        extracted_content: str,
+        config: CrawlerRunConfig,
+        screenshot: str,
+        pdf_data: str,
+    ) -> CrawlResult:
+        """
+        Build a result from the markdown text of output_mode="text". Scraping and markdown
+        generation are skipped, the text is markdown already.
+
+        Args:
+            url: The URL being processed
+            text: Block-structured markdown text built in the page
+            html: The HTML returned alongside, an empty document in text mode
+            extracted_content: Previously extracted content (if any)
+            config: Configuration object controlling processing behavior
+            screenshot: Screenshot data (if any)
+            pdf_data: PDF data (if any)
+
+        Returns:
+            CrawlResult: Result holding the markdown and extracted content
+        """
+        markdown_result = MarkdownGenerationResult(
+            raw_markdown=text, markdown_with_citations=text, references_markdown=""
+        )
+
+        if (
+            not bool(extracted_content)
+            and config.extraction_strategy
+            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
+        ):
+            if config.extraction_strategy.input_format == "html":
+                self.logger.warning(
+                    message="HTML extraction is not available with text output, skipping it",
+                    tag="EXTRACT",
+                    params={"url": url},
+                )
+            else:
+                t1 = time.perf_counter()
+                sections = config.chunking_strategy.chunk(text)
+                extracted_content = config.extraction_strategy.run(url, sections)
+                extracted_content = json.dumps(
+                    extracted_content, indent=4, default=str, ensure_ascii=False
+                )
+                self.logger.info(
+                    message="Completed for {url:.50}... | Time: {timing}s",
+                    tag="EXTRACT",
+                    params={"url": url, "timing": time.perf_counter() - t1},
+                )
+
+        return CrawlResult(
+            url=url,
+            html=html,
+            cleaned_html="",
+            markdown_v2=markdown_result,
+            markdown=text,
+            screenshot=screenshot or None,
+            pdf=pdf_data or None,
+            extracted_content=extracted_content,
+            success=True,
+            error_message="",
+        )
+
     async def arun_many(
         self,
         urls: List[str],
@@ -807,7 +939,91 @@ class AsyncWebCrawler:
             return result_transformer()
         else:
             _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
-            return [transform_result(res) for res in _results]    
+            return [transform_result(res) for res in _results]
+
+    async def arun_paginated(
+        self,
+        url: str,
+        next_action: str,
+        item_selector: Optional[str] = None,
+        container_selector: Optional[str] = None,
+        config: Optional[CrawlerRunConfig] = None,
+        max_pages: int = 10,
+        stop_condition: Optional[str] = None,
+    ) -> RunManyReturn:
+        """
+        Crawls the states of a paginated listing or SPA on a single live page. The URL is
+        loaded once, then next_action is run in the page for every following state, instead
+        of navigating and reloading the whole page each time.
+
+        Args:
+        url: The URL of the first page of the listing
+        next_action: CSS selector of the "next" control, or JS code prefixed with "js:"
+        item_selector: CSS selector of the items. Only new items are kept in each result.
+        container_selector: CSS selector of the element holding the items
+        config: Configuration object controlling crawl behavior for every state
+        max_pages: Maximum number of states to crawl
+        stop_condition: JS expression that ends the pagination when truthy
+
+        Returns:
+        Union[List[CrawlResult], AsyncGenerator[CrawlResult, None]]:
+            Either a list of results, one per state, or an async generator yielding them
+
+        Examples:
+
+        async for result in await crawler.arun_paginated(
+            url="https://example.com/products",
+            next_action="a.next-page",
+            item_selector=".product",
+            container_selector="#product-list",
+            config=CrawlerRunConfig(stream=True),
+        ):
+            print(f"{len(result.markdown)} chars")
+        """
+        config = config or CrawlerRunConfig()
+        if not hasattr(self.crawler_strategy, "paginate"):
+            raise ValueError(
+                f"{type(self.crawler_strategy).__name__} does not support pagination"
+            )
+
+        async def results():
+            async for async_response in self.crawler_strategy.paginate(
+                url,
+                config=config,
+                next_action=next_action,
+                item_selector=item_selector,
+                container_selector=container_selector,
+                max_pages=max_pages,
+                stop_condition=stop_condition,
+            ):
+                page_url = async_response.redirected_url or url
+                html = sanitize_input_encode(async_response.html)
+                # States after the first one are not stored, they cannot be reloaded from a URL
+                crawl_result: CrawlResult = await self.aprocess_html(
+                    url=page_url,
+                    html=html,
+                    extracted_content=None,
+                    config=config,
+                    screenshot=None,
+                    pdf_data=None,
+                    verbose=config.verbose,
+                )
+                crawl_result.status_code = async_response.status_code
+                crawl_result.redirected_url = page_url
+                crawl_result.response_headers = async_response.response_headers
+                crawl_result.network_timing = async_response.network_timing
+                crawl_result.error_message = async_response.error_message
+                crawl_result.success = (
+                    async_response.error_message is None
+                    and async_response.status_code is not None
+                    and async_response.status_code < 400
+                )
+                crawl_result.session_id = config.session_id
+                yield crawl_result
+
+        if config.stream:
+            return results()
+        return [result async for result in results()]
 
     async def aclear_cache(self):
         """Clear the cache database."""
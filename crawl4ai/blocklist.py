@@ -0,0 +1,459 @@
+"""Ad and tracker blocklists for browser contexts."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+
+# Characters that make up a token in a URL; everything else separates tokens
+_TOKEN_RE = re.compile(r"[a-z0-9%]+")
+_IP_RE = re.compile(r"^(?:\d{1,3}(?:\.\d{1,3}){3}|[0-9a-f:]+:[0-9a-f:]*)$")
+_DOMAIN_RE = re.compile(r"^(?:[a-z0-9_](?:[a-z0-9_-]*[a-z0-9_])?\.)+[a-z0-9-]{2,}$")
+
+# Hosts that hosts-format lists map to themselves and that must never be blocked
+_HOSTS_IGNORED = {
+    "localhost",
+    "localhost.localdomain",
+    "local",
+    "broadcasthost",
+    "ip6-localhost",
+    "ip6-loopback",
+    "0.0.0.0",
+}
+
+# Adblock Plus resource type options mapped to Playwright resource types
+_RESOURCE_TYPE_OPTIONS = {
+    "script": {"script"},
+    "image": {"image"},
+    "stylesheet": {"stylesheet"},
+    "css": {"stylesheet"},
+    "font": {"font"},
+    "media": {"media"},
+    "xmlhttprequest": {"xhr", "fetch"},
+    "xhr": {"xhr", "fetch"},
+    "subdocument": {"document"},
+    "frame": {"document"},
+    "websocket": {"websocket"},
+    "ping": {"ping"},
+    "object": {"other"},
+    "other": {"other", "texttrack", "eventsource", "manifest"},
+}
+
+# Options that only change how a rule applies, not whether a request is blocked
+_NEUTRAL_OPTIONS = {"important", "match-case"}
+
+
+def _host_matches(host: str, domains: Set[str]) -> bool:
+    """Check whether host or one of its parent domains is in domains."""
+    while host:
+        if host in domains:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
+class DomainTrie:
+    """
+    A trie over reversed domain labels.
+
+    A domain added to the trie matches itself and all of its subdomains, so a lookup
+    costs one dictionary step per label of the host, however many domains are stored.
+    """
+
+    _END = None
+
+    def __init__(self):
+        self._root: Dict = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, domain: str):
+        node = self._root
+        for label in reversed(domain.lower().strip(".").split(".")):
+            node = node.setdefault(label, {})
+        if self._END not in node:
+            node[self._END] = True
+            self._size += 1
+
+    def match(self, host: str) -> bool:
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+class _PatternRule:
+    """A compiled URL pattern rule together with its options."""
+
+    __slots__ = (
+        "regex",
+        "resource_types",
+        "excluded_types",
+        "third_party",
+        "include_domains",
+        "exclude_domains",
+    )
+
+    def __init__(self, regex):
+        self.regex = regex
+        self.resource_types: Set[str] = set()
+        self.excluded_types: Set[str] = set()
+        self.third_party: Optional[bool] = None
+        self.include_domains: Set[str] = set()
+        self.exclude_domains: Set[str] = set()
+
+    def applies(
+        self,
+        resource_type: Optional[str],
+        third_party: Optional[bool],
+        page_host: Optional[str],
+    ) -> bool:
+        if self.resource_types and resource_type not in self.resource_types:
+            return False
+        if resource_type in self.excluded_types:
+            return False
+        # Unknown third-partiness never satisfies a rule restricted by it
+        if self.third_party is not None and third_party != self.third_party:
+            return False
+        if self.include_domains and not (
+            page_host and _host_matches(page_host, self.include_domains)
+        ):
+            return False
+        if self.exclude_domains and page_host and _host_matches(
+            page_host, self.exclude_domains
+        ):
+            return False
+        return True
+
+
+class _RuleSet:
+    """
+    Block or exception rules: plain domains in a DomainTrie, URL patterns indexed by
+    one of their tokens so that a URL is only tested against rules sharing a token
+    with it. Patterns without a usable token are tested against every URL.
+    """
+
+    def __init__(self):
+        self.domains = DomainTrie()
+        self.by_token: Dict[str, List[_PatternRule]] = {}
+        self.generic: List[_PatternRule] = []
+
+    def __len__(self) -> int:
+        return (
+            len(self.domains)
+            + sum(len(rules) for rules in self.by_token.values())
+            + len(self.generic)
+        )
+
+    def add_pattern(self, rule: _PatternRule, token: Optional[str]):
+        if token:
+            self.by_token.setdefault(token, []).append(rule)
+        else:
+            self.generic.append(rule)
+
+    def match(
+        self,
+        url: str,
+        host: str,
+        tokens: Iterable[str],
+        resource_type: Optional[str],
+        third_party: Optional[bool],
+        page_host: Optional[str],
+    ) -> bool:
+        if self.domains.match(host):
+            return True
+        for token in tokens:
+            for rule in self.by_token.get(token, ()):
+                if rule.regex.search(url) and rule.applies(
+                    resource_type, third_party, page_host
+                ):
+                    return True
+        for rule in self.generic:
+            if rule.regex.search(url) and rule.applies(
+                resource_type, third_party, page_host
+            ):
+                return True
+        return False
+
+
+class Blocklist:
+    """
+    A compiled set of ad and tracker blocking rules.
+
+    Rules are loaded from hosts files (``0.0.0.0 ads.example.com`` or bare domains)
+    and Adblock Plus / EasyList filter lists. Network rules of the filter list syntax
+    are supported: ``||domain^`` anchors, ``|`` start/end anchors, ``*`` wildcards,
+    ``^`` separators, ``@@`` exceptions, and the resource type, ``third-party`` and
+    ``domain=`` options. Cosmetic (element hiding) rules and rules with options that
+    cannot be honoured at the network level (e.g. ``redirect``, ``csp``) are skipped.
+
+    Attributes:
+        rule_count (int): Number of blocking rules loaded.
+        exception_count (int): Number of exception rules loaded.
+
+        Methods:
+            from_files(paths): Creates a Blocklist from hosts and filter list files.
+            load_file(path): Adds the rules of a file.
+            add_rule(line): Adds a single rule.
+            should_block(url, resource_type, third_party, page_url): Checks a request.
+    """
+
+    def __init__(self, rules: Optional[Iterable[str]] = None):
+        self._block = _RuleSet()
+        self._allow = _RuleSet()
+        for line in rules or ():
+            self.add_rule(line)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> "Blocklist":
+        """
+        Create a Blocklist from local hosts files and filter lists.
+
+        Args:
+            paths (Iterable[str]): Paths of the files to load.
+
+        Returns:
+            Blocklist: The compiled blocklist.
+        """
+        blocklist = cls()
+        for path in paths:
+            blocklist.load_file(path)
+        return blocklist
+
+    @property
+    def rule_count(self) -> int:
+        return len(self._block)
+
+    @property
+    def exception_count(self) -> int:
+        return len(self._allow)
+
+    def load_file(self, path: str):
+        """
+        Add all rules of a hosts file or filter list.
+
+        Args:
+            path (str): Path of the file to load.
+        """
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
+                self.add_rule(line)
+
+    def add_rule(self, line: str):
+        """
+        Add a single hosts entry or filter rule. Comments, cosmetic rules and
+        unsupported rules are ignored.
+
+        Args:
+            line (str): The rule as it appears in the list.
+        """
+        line = line.strip()
+        if not line or line[0] in "![" or line.startswith("# "):
+            return
+        if "##" in line or "#@#" in line or "#?#" in line or "#$#" in line:
+            return
+        if line.startswith("#"):
+            return
+
+        # Hosts format: "<ip> <domain> [<domain> ...]" or a bare domain
+        fields = line.split("#", 1)[0].split()
+        if len(fields) > 1 and _IP_RE.match(fields[0]):
+            for domain in fields[1:]:
+                domain = domain.lower()
+                if domain not in _HOSTS_IGNORED and _DOMAIN_RE.match(domain):
+                    self._block.domains.add(domain)
+            return
+        if len(fields) == 1 and _DOMAIN_RE.match(line.lower()):
+            self._block.domains.add(line.lower())
+            return
+
+        self._add_filter_rule(line)
+
+    def _add_filter_rule(self, line: str):
+        rules = self._block
+        if line.startswith("@@"):
+            rules = self._allow
+            line = line[2:]
+
+        pattern, options = line, ""
+        dollar = line.rfind("$")
+        # The options of a /regex/ rule follow its closing slash, a "$" inside the
+        # regex is an end anchor
+        if dollar != -1 and (
+            self._is_regex(line[:dollar]) or not self._is_regex(line)
+        ):
+            pattern, options = line[:dollar], line[dollar + 1 :]
+        if not self._is_regex(pattern):
+            # Regexes keep their case, "\D" and "\d" mean different things
+            pattern = pattern.lower()
+
+        rule_options = self._parse_options(options)
+        if rule_options is None:
+            return
+
+        domain_anchor = pattern.startswith("||")
+        start_anchor = not domain_anchor and pattern.startswith("|")
+        if domain_anchor:
+            pattern = pattern[2:]
+        elif start_anchor:
+            pattern = pattern[1:]
+        end_anchor = pattern.endswith("|")
+        if end_anchor:
+            pattern = pattern[:-1]
+        if not pattern or pattern == "*":
+            return
+
+        # Plain "||domain^" rules go to the domain trie
+        if domain_anchor and not options and not end_anchor:
+            domain = pattern[:-1] if pattern.endswith("^") else pattern
+            if _DOMAIN_RE.match(domain):
+                rules.domains.add(domain)
+                return
+
+        try:
+            rule = _PatternRule(
+                self._compile_pattern(pattern, domain_anchor, start_anchor, end_anchor)
+            )
+        except re.error:
+            return
+        (
+            rule.resource_types,
+            rule.excluded_types,
+            rule.third_party,
+            rule.include_domains,
+            rule.exclude_domains,
+        ) = rule_options
+        rules.add_pattern(
+            rule, self._pattern_token(pattern, domain_anchor or start_anchor, end_anchor)
+        )
+
+    @staticmethod
+    def _is_regex(pattern: str) -> bool:
+        return pattern.startswith("/") and pattern.endswith("/") and len(pattern) > 2
+
+    @staticmethod
+    def _parse_options(options: str):
+        """
+        Parse the "$" options of a filter rule.
+
+        Returns:
+            tuple or None: (resource_types, excluded_types, third_party, include_domains,
+                           exclude_domains), or None if the rule must be skipped.
+        """
+        resource_types: Set[str] = set()
+        excluded_types: Set[str] = set()
+        third_party = None
+        include_domains: Set[str] = set()
+        exclude_domains: Set[str] = set()
+
+        for option in filter(None, options.lower().split(",")):
+            negated = option.startswith("~")
+            name = option.lstrip("~")
+            if name in _RESOURCE_TYPE_OPTIONS:
+                target = excluded_types if negated else resource_types
+                target |= _RESOURCE_TYPE_OPTIONS[name]
+            elif name in ("third-party", "3p"):
+                third_party = not negated
+            elif name in ("first-party", "1p"):
+                third_party = negated
+            elif name.startswith("domain="):
+                for domain in name[len("domain=") :].split("|"):
+                    if domain.startswith("~"):
+                        exclude_domains.add(domain[1:])
+                    elif domain:
+                        include_domains.add(domain)
+            elif name not in _NEUTRAL_OPTIONS:
+                return None
+
+        return resource_types, excluded_types, third_party, include_domains, exclude_domains
+
+    @staticmethod
+    def _compile_pattern(
+        pattern: str, domain_anchor: bool, start_anchor: bool, end_anchor: bool
+    ):
+        if Blocklist._is_regex(pattern):
+            return re.compile(pattern[1:-1], re.IGNORECASE)
+
+        parts = []
+        for char in pattern:
+            if char == "*":
+                parts.append(".*")
+            elif char == "^":
+                parts.append(r"(?:[^\w.%-]|$)")
+            else:
+                parts.append(re.escape(char))
+
+        if domain_anchor:
+            prefix = r"^[a-z][a-z0-9+.-]*://(?:[^/?#]*\.)?"
+        elif start_anchor:
+            prefix = "^"
+        else:
+            prefix = ""
+        return re.compile(prefix + "".join(parts) + ("$" if end_anchor else ""))
+
+    @staticmethod
+    def _pattern_token(
+        pattern: str, start_anchored: bool, end_anchored: bool
+    ) -> Optional[str]:
+        """
+        Pick the longest token of a pattern that is guaranteed to appear as a whole
+        token in every URL the pattern matches, i.e. one not touching a wildcard or
+        an unanchored end of the pattern.
+        """
+        if pattern.startswith("/") and pattern.endswith("/"):
+            return None
+
+        best = None
+        for match in _TOKEN_RE.finditer(pattern):
+            start, end = match.span()
+            if start == 0 and not start_anchored:
+                continue
+            if end == len(pattern) and not end_anchored:
+                continue
+            if start > 0 and pattern[start - 1] == "*":
+                continue
+            if end < len(pattern) and pattern[end] == "*":
+                continue
+            token = match.group()
+            if best is None or len(token) > len(best):
+                best = token
+        return best
+
+    def should_block(
+        self,
+        url: str,
+        resource_type: Optional[str] = None,
+        third_party: Optional[bool] = None,
+        page_url: Optional[str] = None,
+    ) -> bool:
+        """
+        Check whether a request is blocked by the list.
+
+        Args:
+            url (str): URL of the request.
+            resource_type (str or None): Playwright resource type of the request.
+            third_party (bool or None): Whether the request leaves the page's site.
+                                        None skips rules restricted by this option
+                                        (third-party or first-party).
+            page_url (str or None): URL of the page that issued the request, used by
+                                    rules restricted with "domain=".
+
+        Returns:
+            bool: True if a blocking rule matches and no exception rule does.
+        """
+        url = url.lower()
+        host = (urlsplit(url).hostname or "").rstrip(".")
+        page_host = (urlsplit(page_url).hostname or "").lower() if page_url else None
+        tokens = set(_TOKEN_RE.findall(url))
+
+        if not self._block.match(url, host, tokens, resource_type, third_party, page_host):
+            return False
+        return not self._allow.match(
+            url, host, tokens, resource_type, third_party, page_host
+        )
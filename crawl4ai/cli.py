@@ -1,6 +1,8 @@
 import click
 import sys
+import time
 import asyncio
+from statistics import median
 from typing import List
 from .docs_manager import DocsManager
 from .async_logger import AsyncLogger
@@ -119,5 +121,129 @@ def list():
         sys.exit(1)
 
 
+async def benchmark_startup(
+    url: str, runs: int = 3, pages_per_context: int = 1
+) -> List[List[str]]:
+    """
+    Measure the time-to-first-result of a freshly started crawler, cold (the first crawl
+    creates its context and page) against warm (awarmup pre-creates them first).
+
+    Returns:
+        List[List[str]]: One table row per mode with median startup, warm-up, first
+                         result and total times in seconds.
+    """
+    from .async_webcrawler import AsyncWebCrawler
+    from .async_configs import BrowserConfig, CrawlerRunConfig
+    from .cache_context import CacheMode
+
+    crawler_config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    timings = {"cold": [], "warm": []}
+
+    for _ in range(runs):
+        for mode, samples in timings.items():
+            browser_config = BrowserConfig(
+                verbose=False, page_pool_size=pages_per_context
+            )
+            start = time.perf_counter()
+            crawler = AsyncWebCrawler(config=browser_config)
+            await crawler.start()
+            started = time.perf_counter()
+            if mode == "warm":
+                await crawler.awarmup(
+                    configs=[crawler_config], pages_per_context=pages_per_context
+                )
+            warmed = time.perf_counter()
+            result = await crawler.arun(url=url, config=crawler_config)
+            done = time.perf_counter()
+            await crawler.close()
+            if not result.success:
+                raise RuntimeError(f"Crawl failed: {result.error_message}")
+            samples.append((started - start, warmed - started, done - warmed, done - start))
+
+    return [
+        [mode] + [f"{median(column):.3f}" for column in zip(*samples)]
+        for mode, samples in timings.items()
+    ]
+
+
+async def benchmark_output_modes(urls: List[str], runs: int = 3) -> List[List[str]]:
+    """
+    Compare the default pipeline (output_mode="full") with output_mode="text" on the same
+    pages, crawled alternately by one warm crawler so both modes see the same conditions.
+
+    Returns:
+        List[List[str]]: One table row per mode with median and mean crawl times in
+                         seconds, and the median markdown length in characters.
+    """
+    from .async_webcrawler import AsyncWebCrawler
+    from .async_configs import BrowserConfig, CrawlerRunConfig
+    from .cache_context import CacheMode
+
+    timings = {"full": [], "text": []}
+    sizes = {"full": [], "text": []}
+
+    crawler = AsyncWebCrawler(config=BrowserConfig(verbose=False))
+    await crawler.start()
+    try:
+        for _ in range(runs):
+            for url in urls:
+                for mode in timings:
+                    crawler_config = CrawlerRunConfig(
+                        cache_mode=CacheMode.BYPASS, output_mode=mode, verbose=False
+                    )
+                    start = time.perf_counter()
+                    result = await crawler.arun(url=url, config=crawler_config)
+                    elapsed = time.perf_counter() - start
+                    if not result.success:
+                        raise RuntimeError(f"Crawl of {url} failed: {result.error_message}")
+                    timings[mode].append(elapsed)
+                    sizes[mode].append(len(result.markdown or ""))
+    finally:
+        await crawler.close()
+
+    return [
+        [
+            mode,
+            f"{median(timings[mode]):.3f}",
+            f"{sum(timings[mode]) / len(timings[mode]):.3f}",
+            f"{median(sizes[mode]):.0f}",
+        ]
+        for mode in timings
+    ]
+
+
+@cli.group()
+def benchmark():
+    """Performance benchmarks"""
+    pass
+
+
+@benchmark.command()
+@click.argument("url")
+@click.option("--runs", "-n", default=3, help="Number of cold and warm runs")
+@click.option("--pages", "-p", default=1, help="Pages to pre-open when warm")
+def startup(url: str, runs: int, pages: int):
+    """Compare cold and warm time-to-first-result"""
+    try:
+        rows = asyncio.run(benchmark_startup(url, runs, pages))
+        print_table(["Mode", "Startup (s)", "Warm-up (s)", "First result (s)", "Total (s)"], rows)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@benchmark.command("output")
+@click.argument("urls", nargs=-1, required=True)
+@click.option("--runs", "-n", default=3, help="Number of runs per URL and mode")
+def output_modes(urls: tuple, runs: int):
+    """Compare the default pipeline with text output mode"""
+    try:
+        rows = asyncio.run(benchmark_output_modes(list(urls), runs))
+        print_table(["Mode", "Median (s)", "Mean (s)", "Markdown (chars)"], rows)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
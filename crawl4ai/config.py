@@ -83,4 +83,16 @@ URL_LOG_SHORTEN_LENGTH = 30
 SHOW_DEPRECATION_WARNINGS = True
 SCREENSHOT_HEIGHT_TRESHOLD = 10000
 PAGE_TIMEOUT = 60000
+IFRAME_TIMEOUT = 10000  # milliseconds shared by all iframes of a page to finish loading
 DOWNLOAD_PAGE_TIMEOUT = 60000
+DELAY_BEFORE_RETURN_HTML = 0.1  # seconds waited before the HTML is captured, unless wait_for="quiescent"
+BROWSER_MEMORY_CHECK_INTERVAL = 30  # seconds between memory checks of a pooled browser
+LONG_POLL_REQUEST_THRESHOLD = 5  # seconds after which an unfinished request no longer counts as network activity
+NETWORK_TIMING_TOP_REQUESTS = 10  # slowest and failed requests listed in a network timing summary
+HARVEST_BATCH_STEPS = 10  # viewport scrolls per in-page harvest run before its items are sent back
+DIRECT_FETCH_MAX_SIZE = 50 * 1024 * 1024  # bytes of a non-HTML response processed without the browser
+DIRECT_FETCH_PREFIX_CACHE_SIZE = 1024  # host and directory prefixes remembered as serving HTML
+SSL_CERTIFICATE_CACHE_TTL = 3600  # seconds a fetched SSL certificate is reused for the same host
+SSL_CERTIFICATE_CACHE_SIZE = 1024  # hosts kept in the SSL certificate cache
+ASSET_CACHE_MAX_SIZE = 512 * 1024 * 1024  # bytes of static subresources kept in the shared asset cache
+ASSET_CACHE_VARY_SIZE = 4096  # URLs whose Vary header names the asset cache keeps in memory
@@ -0,0 +1,268 @@
+"""Processors for non-HTML responses (JSON, XML and feeds, CSV, plain text, PDF) fetched without a browser."""
+
+import io
+import os
+import csv
+import json
+import asyncio
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from lxml import etree
+from lxml import html as lhtml
+
+HTML_MEDIA_TYPES = {"text/html", "application/xhtml+xml"}
+# Types that say nothing about the content, the body has to be sniffed
+GENERIC_MEDIA_TYPES = {"", "application/octet-stream", "binary/octet-stream", "application/unknown"}
+# Path extensions of documents that are served as HTML
+HTML_EXTENSIONS = {".html", ".htm", ".xhtml", ".shtml", ".php", ".asp", ".aspx", ".jsp", ".cfm"}
+# Path extensions of documents that are usually not served as HTML
+NON_HTML_EXTENSIONS = {".json", ".xml", ".rss", ".atom", ".csv", ".txt", ".md", ".pdf"}
+MEDIA_TYPE_KINDS = {
+    "application/json": "json",
+    "text/json": "json",
+    "application/xml": "xml",
+    "text/xml": "xml",
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "text/plain": "text",
+    "text/markdown": "text",
+    "application/pdf": "pdf",
+}
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+
+def sniff_kind(content_type: Optional[str], head: bytes) -> Optional[str]:
+    """
+    Classify a response from its Content-Type header and its first bytes.
+
+    Declared types win, except for missing, generic or plain text types, which are
+    checked against the start of the body: servers often send PDFs as
+    application/octet-stream and HTML as text/plain.
+
+    Args:
+        content_type (str): The Content-Type header, if any.
+        head (bytes): The first bytes of the body.
+
+    Returns:
+        str or None: "html", "json", "xml", "csv", "text" or "pdf", or None if the type
+                     is unknown and the page should be rendered by the browser.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in HTML_MEDIA_TYPES:
+        return "html"
+    if media_type.endswith("+json"):
+        return "json"
+    if media_type.endswith("+xml"):
+        return "xml"
+    kind = MEDIA_TYPE_KINDS.get(media_type)
+    if kind and kind != "text":
+        return kind
+
+    start = head.lstrip(b"\xef\xbb\xbf \t\r\n")[:512].lower()
+    if start.startswith(b"%pdf-"):
+        return "pdf"
+    if start.startswith((b"<!doctype html", b"<html")) or b"<html" in start:
+        return "html"
+    if start.startswith((b"<?xml", b"<rss", b"<feed")):
+        return "xml"
+    return kind
+
+
+def is_html_path(url: str) -> bool:
+    """Whether the path of a URL ends in an extension of HTML documents."""
+    path = urlsplit(url).path.lower()
+    return os.path.splitext(path)[1] in HTML_EXTENSIONS
+
+
+def is_non_html_path(url: str) -> bool:
+    """Whether the path of a URL ends in an extension of documents that are not HTML."""
+    path = urlsplit(url).path.lower()
+    return os.path.splitext(path)[1] in NON_HTML_EXTENSIONS
+
+
+def path_prefix(url: str) -> Tuple[str, str]:
+    """The host and directory of a URL. Pages under one prefix are usually served alike."""
+    parts = urlsplit(url)
+    return parts.netloc.lower(), parts.path.rsplit("/", 1)[0]
+
+
+def is_pdf_supported() -> bool:
+    """Whether the optional PDF text extraction dependency (pypdf) is installed."""
+    return importlib.util.find_spec("pypdf") is not None
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """
+    Extract the text of a PDF, one section per page. Parsing is CPU-bound, so this runs
+    in a worker process.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    pages = []
+    for number, page in enumerate(reader.pages, 1):
+        text = (page.extract_text() or "").strip()
+        if text:
+            pages.append(f"## Page {number}\n\n{text}")
+    return "\n\n".join(pages)
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2))
+    return _pdf_executor
+
+
+def _local_name(element) -> str:
+    return etree.QName(element).localname if isinstance(element.tag, str) else ""
+
+
+def _child_text(element, name: str) -> Optional[str]:
+    for child in element:
+        if _local_name(child) == name:
+            return (child.text or "").strip() or None
+    return None
+
+
+def _atom_link(entry) -> Optional[str]:
+    links = [child for child in entry if _local_name(child) == "link"]
+    for link in links:
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href")
+    return links[0].get("href") if links else None
+
+
+def _html_to_text(value: Optional[str]) -> Optional[str]:
+    """Feed descriptions often hold escaped HTML"""
+    if not value or "<" not in value:
+        return value
+    try:
+        return lhtml.fromstring(value).text_content().strip()
+    except (etree.ParserError, ValueError):
+        return value
+
+
+def process_json(body: bytes, encoding: str) -> Tuple[str, Any]:
+    """Pass JSON through: the parsed document is the extracted content."""
+    text = body.decode(encoding, errors="replace")
+    return f"```json\n{text.strip()}\n```", json.loads(text)
+
+
+def process_xml(body: bytes, encoding: str) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+    """Parse RSS and Atom feeds into items, other XML documents into their text."""
+    parser = etree.XMLParser(resolve_entities=False, no_network=True, recover=True, huge_tree=True)
+    root = etree.fromstring(body, parser)
+    if root is None:
+        return body.decode(encoding, errors="replace"), None
+
+    kind = _local_name(root)
+    if kind in ("rss", "RDF"):
+        channel = next((child for child in root if _local_name(child) == "channel"), root)
+        title = _child_text(channel, "title")
+        # RSS 1.0 keeps its items next to the channel, RSS 2.0 inside it
+        entries = [el for el in root.iter() if _local_name(el) == "item"]
+        items = [
+            {
+                "title": _child_text(entry, "title"),
+                "link": _child_text(entry, "link"),
+                "description": _html_to_text(_child_text(entry, "description")),
+                "published": _child_text(entry, "pubDate") or _child_text(entry, "date"),
+                "id": _child_text(entry, "guid"),
+            }
+            for entry in entries
+        ]
+    elif kind == "feed":
+        title = _child_text(root, "title")
+        items = [
+            {
+                "title": _child_text(entry, "title"),
+                "link": _atom_link(entry),
+                "description": _html_to_text(
+                    _child_text(entry, "summary") or _child_text(entry, "content")
+                ),
+                "published": _child_text(entry, "published") or _child_text(entry, "updated"),
+                "id": _child_text(entry, "id"),
+            }
+            for entry in root
+            if _local_name(entry) == "entry"
+        ]
+    else:
+        text = "\n".join(t.strip() for t in root.itertext() if t.strip())
+        return text, None
+
+    items = [{k: v for k, v in item.items() if v is not None} for item in items]
+    blocks = [f"# {title}"] if title else []
+    for item in items:
+        heading = item.get("title") or item.get("link") or ""
+        if item.get("link") and item.get("title"):
+            heading = f"[{item['title']}]({item['link']})"
+        blocks.append(f"## {heading}")
+        if item.get("description"):
+            blocks.append(item["description"])
+    return "\n\n".join(blocks), items
+
+
+def process_csv(body: bytes, encoding: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """Parse CSV rows into items and a markdown table."""
+    text = body.decode(encoding, errors="replace").lstrip("\ufeff")
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t|")
+    except csv.Error:
+        dialect = csv.excel
+    rows = list(csv.reader(io.StringIO(text), dialect))
+    if not rows:
+        return "", []
+
+    header, records = rows[0], rows[1:]
+    items = [dict(zip(header, record)) for record in records]
+
+    def table_row(cells):
+        return "| " + " | ".join(cell.replace("|", "\\|").strip() for cell in cells) + " |"
+
+    lines = [table_row(header), "| " + " | ".join("---" for _ in header) + " |"]
+    lines.extend(table_row(record) for record in records)
+    return "\n".join(lines), items
+
+
+def process_text(body: bytes, encoding: str) -> Tuple[str, None]:
+    """Plain text and markdown are already what the result holds."""
+    return body.decode(encoding, errors="replace"), None
+
+
+async def process_pdf(body: bytes, encoding: str) -> Tuple[str, None]:
+    """Extract the text of a PDF in a worker process."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pdf_executor(), extract_pdf_text, body), None
+
+
+PROCESSORS = {
+    "json": process_json,
+    "xml": process_xml,
+    "csv": process_csv,
+    "text": process_text,
+}
+
+
+async def process_content(kind: str, body: bytes, encoding: str = "utf-8") -> Tuple[str, Any]:
+    """
+    Turn a non-HTML response into markdown text and, where the format has them,
+    structured items.
+
+    Args:
+        kind (str): The kind returned by sniff_kind.
+        body (bytes): The response body.
+        encoding (str): The text encoding of the response.
+
+    Returns:
+        Tuple[str, Any]: The markdown text, and the items (JSON document, feed entries,
+                         CSV rows) or None.
+    """
+    if kind == "pdf":
+        return await process_pdf(body, encoding)
+    # Parsing large documents is CPU work, keep it off the event loop
+    return await asyncio.to_thread(PROCESSORS[kind], body, encoding)
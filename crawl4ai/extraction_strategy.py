@@ -1136,11 +1136,21 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
     2. Selects elements using CSS selectors defined in the schema.
     3. Extracts field data and applies transformations as defined.
 
+    The schema can also be run inside the page by the crawler (in_browser=True), which
+    then only transfers the extracted JSON instead of parsing the HTML in Python. Schemas
+    the page cannot run (computed fields, Python-only regex syntax) and failures in the
+    page fall back to the Python extraction.
+
     Attributes:
         schema (Dict[str, Any]): The schema defining the extraction rules.
         verbose (bool): Enables verbose logging for debugging purposes.
+        in_browser (bool): Whether the crawler runs the schema in the page.
+        return_html (bool): With in_browser, whether the page HTML is still captured for
+                            markdown, links and media. False skips serializing it, and the
+                            crawl result is not cached.
 
     Methods:
+        can_run_in_browser(): Whether the schema can be evaluated in the page.
         _parse_html(html_content): Parses HTML content into a BeautifulSoup object.
         _get_base_elements(parsed_html, selector): Selects base elements using a CSS selector.
         _get_elements(element, selector): Selects child elements using a CSS selector.
@@ -1149,9 +1159,41 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         _get_element_attribute(element, attribute): Retrieves an attribute value from a BeautifulSoup element.
     """
 
-    def __init__(self, schema: Dict[str, Any], **kwargs):
+    # Regex syntax of Python's re module that JavaScript does not understand
+    PYTHON_ONLY_REGEX = (
+        "(?P", "(?#", "\\A", "\\Z", "(?a", "(?i", "(?L", "(?m", "(?s", "(?u", "(?x"
+    )
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        in_browser: bool = False,
+        return_html: bool = True,
+        **kwargs,
+    ):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
+        self.in_browser = in_browser
+        self.return_html = return_html
+
+    def can_run_in_browser(self) -> bool:
+        """Whether every field of the schema has an in-page equivalent"""
+
+        def supported(fields) -> bool:
+            for field in fields:
+                if field.get("type") == "computed":
+                    return False
+                if field.get("type") == "regex" and any(
+                    token in field.get("pattern", "") for token in self.PYTHON_ONLY_REGEX
+                ):
+                    return False
+                if not supported(field.get("fields", [])):
+                    return False
+            return True
+
+        return supported(self.schema.get("baseFields", [])) and supported(
+            self.schema.get("fields", [])
+        )
 
     def _parse_html(self, html_content: str):
         return BeautifulSoup(html_content, "html.parser")
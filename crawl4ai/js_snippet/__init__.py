@@ -1,7 +1,10 @@
 import os
+from functools import lru_cache
 
 
 # Create a function get name of a js script, then load from the CURRENT folder of this script and return its content as string, make sure its error free
+# Scripts are read from disk once and then served from memory
+@lru_cache(maxsize=None)
 def load_js_script(script_name):
     # Get the path of the current script
     current_script_path = os.path.dirname(os.path.realpath(__file__))
@@ -0,0 +1,18 @@
+() => {
+    // Install a MutationObserver once per document, then report how long the DOM
+    // has been idle, in seconds. Attribute changes are ignored so that animations
+    // and carousels do not keep the page "busy" forever.
+    let state = window.__crawl4aiQuiescence;
+    if (!state) {
+        state = window.__crawl4aiQuiescence = { lastMutation: performance.now() };
+        const observer = new MutationObserver(() => {
+            state.lastMutation = performance.now();
+        });
+        observer.observe(document.documentElement || document, {
+            childList: true,
+            subtree: true,
+            characterData: true,
+        });
+    }
+    return (performance.now() - state.lastMutation) / 1000;
+}
@@ -0,0 +1,35 @@
+async ({ scrollDelay, maxSteps, timeout }, scroll) => {
+    // Scroll through the whole page in a single evaluate. Each step moves one viewport
+    // down and yields a couple of frames so lazy loaders (IntersectionObserver, scroll
+    // handlers) can react. Only at the bottom do we wait, up to scrollDelay, for
+    // infinite-scroll content to grow the page before scrolling on. scroll holds the
+    // helpers of scroll_helpers.
+    const { root, pageHeight, nextFrame, waitForGrowth } = scroll;
+    const viewportHeight = window.innerHeight || root.clientHeight;
+    const deadline = Date.now() + timeout;
+
+    let position = 0;
+    let steps = 0;
+    let growths = 0;
+    while (true) {
+        const height = pageHeight();
+        const remaining = deadline - Date.now();
+        if (remaining <= 0) break;
+
+        if (position + viewportHeight >= height) {
+            if (!(await waitForGrowth(height, Math.min(scrollDelay, remaining)))) break;
+            growths++;
+            continue;
+        }
+        if (maxSteps && steps >= maxSteps) break;
+
+        position += viewportHeight;
+        window.scrollTo(0, position);
+        steps++;
+        await nextFrame();
+        await nextFrame();
+    }
+
+    window.scrollTo(0, pageHeight());
+    return { steps, growths, height: pageHeight(), timedOut: Date.now() >= deadline };
+}
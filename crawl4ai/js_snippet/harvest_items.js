@@ -0,0 +1,53 @@
+async ({ schema, maxSteps, scrollDelay, timeout, reset }, extractItems, scroll) => {
+    // Scroll like full_page_scan, but extract the items of the schema after every step
+    // with extractItems, the json_css_extract routine. Virtualized lists recycle their
+    // rows, so items must be read while they are in the DOM. The state lives on window
+    // so that consecutive runs continue where the last one stopped, and each run only
+    // returns items it has not returned before. scroll holds the helpers of scroll_helpers.
+    if (reset || !window.__crawl4aiHarvest) {
+        window.__crawl4aiHarvest = { seen: new Set(), position: 0 };
+    }
+    const state = window.__crawl4aiHarvest;
+    const { root, pageHeight, nextFrame, waitForGrowth } = scroll;
+    const viewportHeight = window.innerHeight || root.clientHeight;
+    const deadline = Date.now() + timeout;
+
+    const items = [];
+    const harvest = () => {
+        for (const item of extractItems(schema)) {
+            const key = JSON.stringify(item);
+            if (state.seen.has(key)) continue;
+            state.seen.add(key);
+            items.push(item);
+        }
+    };
+
+    harvest();
+    let steps = 0;
+    let growths = 0;
+    let done = false;
+    while (steps < maxSteps) {
+        const height = pageHeight();
+        const remaining = deadline - Date.now();
+        if (remaining <= 0) break;
+
+        if (state.position + viewportHeight >= height) {
+            if (!(await waitForGrowth(height, Math.min(scrollDelay, remaining)))) {
+                done = true;
+                break;
+            }
+            growths++;
+            harvest();
+            continue;
+        }
+
+        state.position += viewportHeight;
+        window.scrollTo(0, state.position);
+        steps++;
+        await nextFrame();
+        await nextFrame();
+        harvest();
+    }
+
+    return { items, steps, growths, done, seen: state.seen.size };
+}
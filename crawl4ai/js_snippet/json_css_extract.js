@@ -0,0 +1,105 @@
+(schema, root) => {
+    // In-page counterpart of JsonCssExtractionStrategy: runs the schema against the live
+    // DOM and returns only the extracted items. Field semantics follow the Python
+    // implementation, computed fields are left to Python.
+    root = root || document;
+
+    // Same as BeautifulSoup's get_text(strip=True)
+    const textOf = (element) => {
+        const parts = [];
+        const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const text = walker.currentNode.nodeValue.trim();
+            if (text) parts.push(text);
+        }
+        return parts.join("");
+    };
+
+    const regexes = new Map();
+    const regexOf = (pattern) => {
+        if (!regexes.has(pattern)) regexes.set(pattern, new RegExp(pattern));
+        return regexes.get(pattern);
+    };
+
+    const transform = (value, name) => {
+        if (typeof value !== "string") return value;
+        if (name === "lowercase") return value.toLowerCase();
+        if (name === "uppercase") return value.toUpperCase();
+        if (name === "strip") return value.trim();
+        return value;
+    };
+
+    const isSet = (value) => value !== null && value !== undefined;
+    const orDefault = (value, field) => (isSet(value) ? value : isSet(field.default) ? field.default : null);
+
+    const singleField = (element, field) => {
+        const selected = field.selector ? element.querySelector(field.selector) : element;
+        if (!selected) return orDefault(null, field);
+        let value = null;
+        if (field.type === "text") {
+            value = textOf(selected);
+        } else if (field.type === "attribute") {
+            value = selected.getAttribute(field.attribute);
+        } else if (field.type === "html") {
+            value = selected.outerHTML;
+        } else if (field.type === "regex") {
+            const match = regexOf(field.pattern).exec(textOf(selected));
+            value = match ? match[1] : null;
+        }
+        if (field.transform) value = transform(value, field.transform);
+        return orDefault(value, field);
+    };
+
+    const listItem = (element, fields) => {
+        const item = {};
+        for (const field of fields) {
+            const value = singleField(element, field);
+            if (isSet(value)) item[field.name] = value;
+        }
+        return item;
+    };
+
+    const fieldValue = (element, field) => {
+        try {
+            if (field.type === "nested") {
+                const nested = element.querySelector(field.selector);
+                return nested ? extractItem(nested, field.fields) : {};
+            }
+            if (field.type === "list") {
+                return Array.from(element.querySelectorAll(field.selector), (el) =>
+                    listItem(el, field.fields)
+                );
+            }
+            if (field.type === "nested_list") {
+                return Array.from(element.querySelectorAll(field.selector), (el) =>
+                    extractItem(el, field.fields)
+                );
+            }
+            return singleField(element, field);
+        } catch (e) {
+            return orDefault(null, field);
+        }
+    };
+
+    const extractItem = (element, fields) => {
+        const item = {};
+        for (const field of fields) {
+            if (field.type === "computed") continue;
+            const value = fieldValue(element, field);
+            if (isSet(value)) item[field.name] = value;
+        }
+        return item;
+    };
+
+    const items = [];
+    for (const element of root.querySelectorAll(schema.baseSelector)) {
+        const item = {};
+        for (const field of schema.baseFields || []) {
+            const value = singleField(element, field);
+            if (isSet(value)) item[field.name] = value;
+        }
+        Object.assign(item, extractItem(element, schema.fields || []));
+        if (Object.keys(item).length) items.push(item);
+    }
+    return items;
+}
@@ -0,0 +1,15 @@
+([containerSelector, itemSelector]) => {
+    // Capture the container of a paginated listing and its items, and remember the
+    // container's content so that the next state can be told apart from this one.
+    const container = containerSelector
+        ? document.querySelector(containerSelector)
+        : document.body;
+    if (!container) return null;
+    window.__crawl4aiPaginationState = container.innerHTML;
+    return {
+        html: container.outerHTML,
+        items: itemSelector
+            ? Array.from(container.querySelectorAll(itemSelector), (item) => item.outerHTML)
+            : null,
+    };
+}
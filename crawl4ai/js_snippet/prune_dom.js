@@ -0,0 +1,47 @@
+({ excludedTags, excludedSelector, cssSelector, removeForms }) => {
+    // Serialize a pruned copy of the document: everything the scraping strategy would
+    // throw away is dropped here, so far less HTML crosses over to Python. The live DOM
+    // is left untouched, session pages keep working for the next crawl.
+    const clone = document.documentElement.cloneNode(true);
+    const body = clone.querySelector("body") || clone;
+    const remove = (elements) => {
+        for (const element of elements) element.remove();
+    };
+
+    for (const tag of excludedTags || []) remove(clone.querySelectorAll(tag));
+    if (excludedSelector) remove(clone.querySelectorAll(excludedSelector));
+
+    // Keep the selected elements in place, with their ancestors, so that the scraping
+    // strategy's css_selector still finds them
+    if (cssSelector) {
+        const selected = new Set(clone.querySelectorAll(cssSelector));
+        if (selected.size) {
+            const ancestors = new Set();
+            for (const element of selected) {
+                for (let node = element.parentNode; node && node !== body; node = node.parentNode) {
+                    ancestors.add(node);
+                }
+            }
+            const prune = (parent) => {
+                for (const child of Array.from(parent.childNodes)) {
+                    if (selected.has(child)) continue;
+                    if (ancestors.has(child)) prune(child);
+                    else child.remove();
+                }
+            };
+            prune(body);
+        }
+    }
+
+    // The head keeps its meta and link tags, metadata is read from them
+    remove(clone.querySelectorAll("script, style, noscript"));
+    remove(body.querySelectorAll("link, meta"));
+    if (removeForms) remove(body.querySelectorAll("form"));
+
+    for (const img of body.querySelectorAll('img[src^="data:image/"]')) {
+        if (img.getAttribute("src").includes(";base64,")) img.setAttribute("src", "");
+    }
+
+    const doctype = document.doctype ? `<!DOCTYPE ${document.doctype.name}>` : "";
+    return doctype + clone.outerHTML;
+}
@@ -0,0 +1,37 @@
+() => {
+    // Helpers shared by the in-page scrolling routines, full_page_scan and harvest_items.
+    // Called once per evaluate, the routines receive the returned object as an argument.
+    const root = document.scrollingElement || document.documentElement;
+    const pageHeight = () =>
+        Math.max(root.scrollHeight, document.body ? document.body.scrollHeight : 0);
+
+    const nextFrame = () =>
+        new Promise((resolve) => {
+            // requestAnimationFrame does not fire in hidden pages
+            const timer = setTimeout(resolve, 100);
+            requestAnimationFrame(() => {
+                clearTimeout(timer);
+                resolve();
+            });
+        });
+
+    // Resolves to whether the page grew beyond height within wait milliseconds
+    const waitForGrowth = (height, wait) =>
+        new Promise((resolve) => {
+            let observer = null;
+            const finish = () => {
+                if (observer) observer.disconnect();
+                clearTimeout(timer);
+                resolve(pageHeight() > height);
+            };
+            const timer = setTimeout(finish, wait);
+            if (window.ResizeObserver) {
+                observer = new ResizeObserver(() => {
+                    if (pageHeight() > height) finish();
+                });
+                observer.observe(document.body || root);
+            }
+        });
+
+    return { root, pageHeight, nextFrame, waitForGrowth };
+}
@@ -0,0 +1,150 @@
+({ rootSelector, excludedTags, excludedSelector }) => {
+    // Walk the rendered DOM and produce block-structured markdown text: headings,
+    // paragraphs, lists, tables, code blocks and quotes. Layout decides what is hidden
+    // and what is a block, so no HTML has to be serialized and converted in Python.
+    const SKIPPED = new Set([
+        "SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE", "SVG", "CANVAS", "IFRAME", "OBJECT",
+        "HEAD", "META", "LINK",
+        ...(excludedTags || []).map((tag) => tag.toUpperCase()),
+    ]);
+
+    let blocks = [];
+    let inline = [];
+    let listDepth = 0;
+
+    const indent = (depth) => "  ".repeat(depth);
+    const flush = () => {
+        const text = inline
+            .join("")
+            .replace(/[ \t\u00a0]+/g, " ")
+            .replace(/ *\n */g, "\n")
+            .trim();
+        if (text) blocks.push(text);
+        inline = [];
+    };
+
+    // Blocks of a subtree, without disturbing the ones being collected
+    const blocksOf = (node) => {
+        const saved = [blocks, inline];
+        blocks = [];
+        inline = [];
+        for (const child of node.childNodes) walk(child);
+        flush();
+        const result = blocks;
+        [blocks, inline] = saved;
+        return result;
+    };
+
+    const isShown = (element) =>
+        element.checkVisibility
+            ? element.checkVisibility({ visibilityProperty: true })
+            : getComputedStyle(element).display !== "none";
+
+    const list = (element) => {
+        const ordered = element.tagName === "OL";
+        const pad = indent(listDepth + 1);
+        const lines = [];
+        let index = Number(element.getAttribute("start")) || 1;
+        listDepth++;
+        for (const item of element.children) {
+            if (item.tagName !== "LI" || !isShown(item)) continue;
+            const [first = "", ...rest] = blocksOf(item);
+            const marker = ordered ? `${index++}. ` : "- ";
+            lines.push(indent(listDepth - 1) + marker + first.replace(/\n/g, "\n" + pad));
+            for (const part of rest) {
+                lines.push(
+                    part
+                        .split("\n")
+                        .map((line) => (line.startsWith(pad) ? line : pad + line))
+                        .join("\n")
+                );
+            }
+        }
+        listDepth--;
+        if (lines.length) blocks.push(lines.join("\n"));
+    };
+
+    const table = (element) => {
+        const rows = [];
+        for (const row of element.rows) {
+            if (!isShown(row)) continue;
+            const cells = Array.from(row.cells, (cell) =>
+                blocksOf(cell).join(" ").replace(/\n/g, " ").replace(/\|/g, "\\|")
+            );
+            if (cells.some(Boolean)) rows.push(`| ${cells.join(" | ")} |`);
+            // The first row is the header
+            if (rows.length === 1 && cells.some(Boolean)) {
+                rows.push(`| ${cells.map(() => "---").join(" | ")} |`);
+            }
+        }
+        if (rows.length) blocks.push(rows.join("\n"));
+    };
+
+    const walk = (node) => {
+        if (node.nodeType === Node.TEXT_NODE) {
+            inline.push(node.nodeValue.replace(/\s+/g, " "));
+            return;
+        }
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+
+        const tag = node.tagName.toUpperCase();
+        if (SKIPPED.has(tag) || !isShown(node)) return;
+        if (excludedSelector && node.matches(excludedSelector)) return;
+
+        if (tag === "BR") {
+            inline.push("\n");
+            return;
+        }
+        const heading = /^H([1-6])$/.exec(tag);
+        if (heading) {
+            flush();
+            const text = blocksOf(node).join(" ").replace(/\n/g, " ");
+            if (text) blocks.push("#".repeat(Number(heading[1])) + " " + text);
+            return;
+        }
+        if (tag === "UL" || tag === "OL") {
+            flush();
+            list(node);
+            return;
+        }
+        if (tag === "TABLE") {
+            flush();
+            table(node);
+            return;
+        }
+        if (tag === "PRE") {
+            flush();
+            const code = node.innerText.replace(/\n+$/, "");
+            if (code.trim()) blocks.push("```\n" + code + "\n```");
+            return;
+        }
+        if (tag === "BLOCKQUOTE") {
+            flush();
+            const quoted = blocksOf(node)
+                .map((block) => block.replace(/^/gm, "> "))
+                .join("\n>\n");
+            if (quoted) blocks.push(quoted);
+            return;
+        }
+        if (tag === "HR") {
+            flush();
+            blocks.push("---");
+            return;
+        }
+
+        const display = getComputedStyle(node).display;
+        const isBlock = !display.startsWith("inline") && display !== "contents";
+        if (isBlock) flush();
+        for (const child of node.childNodes) walk(child);
+        if (isBlock) flush();
+    };
+
+    let roots = rootSelector
+        ? Array.from(document.querySelectorAll(rootSelector))
+        : [document.body || document.documentElement];
+    // Nested matches are part of their outer match already
+    roots = roots.filter((root) => !roots.some((other) => other !== root && other.contains(root)));
+    for (const root of roots) walk(root);
+    flush();
+    return blocks.join("\n\n");
+}
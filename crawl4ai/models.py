@@ -3,6 +3,7 @@ from typing import List, Dict, Optional, Callable, Awaitable, Union, Any
 from enum import Enum
 from dataclasses import dataclass
 from .ssl_certificate import SSLCertificate
+from .artifact_store import ArtifactHandle
 from datetime import datetime
 from datetime import timedelta
 
@@ -118,6 +119,12 @@ class CrawlResult(BaseModel):
     ssl_certificate: Optional[SSLCertificate] = None
     dispatch_result: Optional[DispatchResult] = None
     redirected_url: Optional[str] = None
+    blocked_requests: Optional[int] = None
+    screenshot_path: Optional[str] = None
+    screenshot_artifact: Optional[ArtifactHandle] = None
+    pdf_artifact: Optional[ArtifactHandle] = None
+    downloaded_artifacts: Optional[List[ArtifactHandle]] = None
+    network_timing: Optional[Dict[str, Any]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -133,6 +140,18 @@ class AsyncCrawlResponse(BaseModel):
     downloaded_files: Optional[List[str]] = None
     ssl_certificate: Optional[SSLCertificate] = None
     redirected_url: Optional[str] = None
+    blocked_requests: Optional[int] = None
+    screenshot_path: Optional[str] = None
+    screenshot_artifact: Optional[ArtifactHandle] = None
+    pdf_artifact: Optional[ArtifactHandle] = None
+    downloaded_artifacts: Optional[List[ArtifactHandle]] = None
+    network_timing: Optional[Dict[str, Any]] = None
+    extracted_items: Optional[Any] = None
+    text: Optional[str] = None
+    # False when html is not the full page, such results must not be cached under the URL
+    cacheable: bool = True
+    # Set when the crawl produced a response but failed, e.g. a pagination state
+    error_message: Optional[str] = None
 
     class Config:
         arbitrary_types_allowed = True
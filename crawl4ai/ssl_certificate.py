@@ -1,13 +1,16 @@
 """SSL Certificate class for handling certificate operations."""
 
 import ssl
+import time
 import socket
 import base64
 import json
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import OpenSSL.crypto
 from pathlib import Path
+from .config import SSL_CERTIFICATE_CACHE_TTL, SSL_CERTIFICATE_CACHE_SIZE
 
 
 class SSLCertificate:
@@ -19,6 +22,7 @@ class SSLCertificate:
 
         Methods:
             from_url(url: str, timeout: int = 10) -> Optional['SSLCertificate']: Create SSLCertificate instance from a URL.
+            afrom_url(url: str, timeout: int = 10, cache_ttl: float = 3600) -> Optional['SSLCertificate']: Async, cached from_url.
             from_file(file_path: str) -> Optional['SSLCertificate']: Create SSLCertificate instance from a file.
             from_binary(binary_data: bytes) -> Optional['SSLCertificate']: Create SSLCertificate instance from binary data.
             export_as_pem() -> str: Export the certificate as PEM format.
@@ -27,6 +31,12 @@ class SSLCertificate:
             export_as_text() -> str: Export the certificate as text format.
     """
 
+    # Fetched certificates by (hostname, port), with their expiry time
+    _cache: Dict[Tuple[str, int], Tuple[float, "SSLCertificate"]] = {}
+    # Handshakes in flight by (hostname, port)
+    _pending: Dict[Tuple[str, int], "asyncio.Task"] = {}
+    _context: Optional[ssl.SSLContext] = None
+
     def __init__(self, cert_info: Dict[str, Any]):
         self._cert_info = self._decode_cert_data(cert_info)
 
@@ -43,40 +53,142 @@ class SSLCertificate:
             Optional[SSLCertificate]: SSLCertificate instance if successful, None otherwise.
         """
         try:
-            hostname = urlparse(url).netloc
-            if ":" in hostname:
-                hostname = hostname.split(":")[0]
-
-            context = ssl.create_default_context()
-            with socket.create_connection((hostname, 443), timeout=timeout) as sock:
+            hostname, port = SSLCertificate._host_and_port(url)
+            context = SSLCertificate._ssl_context()
+            with socket.create_connection((hostname, port), timeout=timeout) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert_binary = ssock.getpeercert(binary_form=True)
-                    x509 = OpenSSL.crypto.load_certificate(
-                        OpenSSL.crypto.FILETYPE_ASN1, cert_binary
-                    )
-
-                    cert_info = {
-                        "subject": dict(x509.get_subject().get_components()),
-                        "issuer": dict(x509.get_issuer().get_components()),
-                        "version": x509.get_version(),
-                        "serial_number": hex(x509.get_serial_number()),
-                        "not_before": x509.get_notBefore(),
-                        "not_after": x509.get_notAfter(),
-                        "fingerprint": x509.digest("sha256").hex(),
-                        "signature_algorithm": x509.get_signature_algorithm(),
-                        "raw_cert": base64.b64encode(cert_binary),
-                    }
-
-                    # Add extensions
-                    extensions = []
-                    for i in range(x509.get_extension_count()):
-                        ext = x509.get_extension(i)
-                        extensions.append(
-                            {"name": ext.get_short_name(), "value": str(ext)}
-                        )
-                    cert_info["extensions"] = extensions
-
-                    return SSLCertificate(cert_info)
+                    return SSLCertificate.from_binary(ssock.getpeercert(binary_form=True))
+
+        except Exception:
+            return None
+
+    @staticmethod
+    async def afrom_url(
+        url: str, timeout: int = 10, cache_ttl: float = SSL_CERTIFICATE_CACHE_TTL
+    ) -> Optional["SSLCertificate"]:
+        """
+        Create SSLCertificate instance from a URL without blocking the event loop.
+
+        Certificates are cached per host and port for cache_ttl seconds, and concurrent
+        calls for the same host share one TLS handshake. Failures are not cached.
+
+        Args:
+            url (str): URL of the website.
+            timeout (int): Timeout for the connection and handshake (default: 10).
+            cache_ttl (float): Seconds to reuse a fetched certificate, 0 disables the cache
+                               (default: SSL_CERTIFICATE_CACHE_TTL).
+
+        Returns:
+            Optional[SSLCertificate]: SSLCertificate instance if successful, None otherwise.
+        """
+        try:
+            key = SSLCertificate._host_and_port(url)
+        except Exception:
+            return None
+
+        now = time.monotonic()
+        cached = SSLCertificate._cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        loop = asyncio.get_running_loop()
+        pending = SSLCertificate._pending.get(key)
+        if pending is None or pending.get_loop() is not loop:
+            pending = loop.create_task(SSLCertificate._fetch(*key, timeout))
+            SSLCertificate._pending[key] = pending
+            pending.add_done_callback(
+                lambda task: SSLCertificate._pending.pop(key, None)
+                if SSLCertificate._pending.get(key) is task
+                else None
+            )
+        cert = await asyncio.shield(pending)
+
+        if cert is not None and cache_ttl > 0:
+            cache = SSLCertificate._cache
+            cache.pop(key, None)
+            if len(cache) >= SSL_CERTIFICATE_CACHE_SIZE:
+                for expired in [k for k, v in cache.items() if v[0] <= now]:
+                    del cache[expired]
+                # Entries are kept in insertion order, drop the oldest ones
+                while len(cache) >= SSL_CERTIFICATE_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = (time.monotonic() + cache_ttl, cert)
+        return cert
+
+    @staticmethod
+    async def _fetch(hostname: str, port: int, timeout: int) -> Optional["SSLCertificate"]:
+        """Perform a TLS handshake with asyncio streams and read the peer certificate."""
+        writer = None
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    hostname,
+                    port,
+                    ssl=SSLCertificate._ssl_context(),
+                    server_hostname=hostname,
+                ),
+                timeout=timeout,
+            )
+            ssl_object = writer.get_extra_info("ssl_object")
+            return SSLCertificate.from_binary(ssl_object.getpeercert(binary_form=True))
+        except Exception:
+            return None
+        finally:
+            if writer is not None:
+                writer.close()
+
+    @staticmethod
+    def _host_and_port(url: str) -> Tuple[str, int]:
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            raise ValueError(f"No hostname in URL: {url}")
+        return parsed.hostname, parsed.port or 443
+
+    @staticmethod
+    def _ssl_context() -> ssl.SSLContext:
+        # Loading the CA bundle is slow, build the default context once
+        if SSLCertificate._context is None:
+            SSLCertificate._context = ssl.create_default_context()
+        return SSLCertificate._context
+
+    @staticmethod
+    def from_binary(binary_data: bytes) -> Optional["SSLCertificate"]:
+        """
+        Create SSLCertificate instance from a DER-encoded certificate.
+
+        Args:
+            binary_data (bytes): The certificate in DER format.
+
+        Returns:
+            Optional[SSLCertificate]: SSLCertificate instance if successful, None otherwise.
+        """
+        try:
+            x509 = OpenSSL.crypto.load_certificate(
+                OpenSSL.crypto.FILETYPE_ASN1, binary_data
+            )
+
+            cert_info = {
+                "subject": dict(x509.get_subject().get_components()),
+                "issuer": dict(x509.get_issuer().get_components()),
+                "version": x509.get_version(),
+                "serial_number": hex(x509.get_serial_number()),
+                "not_before": x509.get_notBefore(),
+                "not_after": x509.get_notAfter(),
+                "fingerprint": x509.digest("sha256").hex(),
+                "signature_algorithm": x509.get_signature_algorithm(),
+                "raw_cert": base64.b64encode(binary_data),
+            }
+
+            # Add extensions
+            extensions = []
+            for i in range(x509.get_extension_count()):
+                ext = x509.get_extension(i)
+                extensions.append(
+                    {"name": ext.get_short_name(), "value": str(ext)}
+                )
+            cert_info["extensions"] = extensions
+
+            return SSLCertificate(cert_info)
 
         except Exception:
             return None
@@ -1695,6 +1695,206 @@ def fast_format_html(html_string):
     return "\n".join(formatted)
 
 
+# Elements without a closing tag, and elements whose text is not HTML-escaped
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+RAW_TEXT_ELEMENTS = {"script", "style"}
+# Elements that are never rendered but still carry data worth keeping
+UNRENDERED_ELEMENTS = {"script", "style", "noscript", "template", "link", "meta"}
+
+
+def dom_snapshot_to_html(snapshot, exclude_hidden=False, inline_iframes=True):
+    """
+    Serialize the result of the CDP DOMSnapshot.captureSnapshot command to HTML.
+
+    How it works:
+    1. Rebuilds the child lists of each captured document from the flat parent indices.
+    2. Walks the main document iteratively (deep DOMs do not hit the recursion limit),
+       flattening open shadow roots into their hosts and skipping pseudo-elements,
+       comments and user-agent shadow roots.
+    3. If inline_iframes is set, replaces each iframe with a captured document by a div
+       holding the frame's body, like merge_iframe_contents.
+    4. If exclude_hidden is set, drops elements in the body that have no node in the
+       layout tree in their whole subtree, i.e. that are not rendered at all.
+
+    Args:
+        snapshot (dict): The captureSnapshot result, with "documents" and "strings".
+        exclude_hidden (bool): Whether to drop elements that are not rendered.
+        inline_iframes (bool): Whether to inline the content of captured iframes.
+
+    Returns:
+        str: The HTML of the main document.
+    """
+    strings = snapshot["strings"]
+    documents = snapshot["documents"]
+
+    def string(index):
+        return strings[index] if index >= 0 else ""
+
+    def prepare(document):
+        nodes = document["nodes"]
+        parents = nodes["parentIndex"]
+        children = [[] for _ in parents]
+        for index, parent in enumerate(parents):
+            if parent >= 0:
+                children[parent].append(index)
+
+        skipped = set(nodes.get("pseudoType", {}).get("index", []))
+        shadow_roots = nodes.get("shadowRootType", {})
+        for index, value in zip(shadow_roots.get("index", []), shadow_roots.get("value", [])):
+            if string(value) == "user-agent":
+                skipped.add(index)
+
+        content_documents = nodes.get("contentDocumentIndex", {})
+        frames = dict(
+            zip(content_documents.get("index", []), content_documents.get("value", []))
+        )
+
+        rendered = None
+        if exclude_hidden:
+            rendered = [False] * len(parents)
+            for index in document["layout"]["nodeIndex"]:
+                rendered[index] = True
+            # Nodes come in document order, so children always follow their parent
+            for index in range(len(parents) - 1, 0, -1):
+                if rendered[index] and parents[index] >= 0:
+                    rendered[parents[index]] = True
+
+        return nodes, children, skipped, frames, rendered
+
+    prepared = {}
+
+    def get_document(index):
+        if index not in prepared:
+            prepared[index] = prepare(documents[index])
+        return prepared[index]
+
+    output = []
+    iframe_count = 0
+    # Stack items are closing tags (str) or (document, node, parent tag, in body)
+    stack = [(0, 0, "", False)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            output.append(item)
+            continue
+
+        doc_index, index, parent_name, in_body = item
+        nodes, children, skipped, frames, rendered = get_document(doc_index)
+        if index in skipped:
+            continue
+        node_type = nodes["nodeType"][index]
+
+        if node_type == 3:
+            text = string(nodes["nodeValue"][index])
+            output.append(text if parent_name in RAW_TEXT_ELEMENTS else html.escape(text, quote=False))
+            continue
+        if node_type == 10:
+            output.append(f"<!DOCTYPE {string(nodes['nodeName'][index]).lower()}>")
+            continue
+        if node_type in (9, 11):
+            stack.extend(
+                (doc_index, child, parent_name, in_body)
+                for child in reversed(children[index])
+            )
+            continue
+        if node_type != 1:
+            continue
+
+        name = string(nodes["nodeName"][index]).lower()
+        if (
+            rendered is not None
+            and in_body
+            and not rendered[index]
+            and name not in UNRENDERED_ELEMENTS
+        ):
+            continue
+
+        if inline_iframes and index in frames:
+            frame_doc = frames[index]
+            frame_nodes = get_document(frame_doc)[0]
+            body = next(
+                (
+                    i
+                    for i, node_name in enumerate(frame_nodes["nodeName"])
+                    if string(node_name) == "BODY"
+                ),
+                None,
+            )
+            if body is not None:
+                output.append(f'<div class="extracted-iframe-content-{iframe_count}">')
+                iframe_count += 1
+                stack.append("</div>")
+                stack.extend(
+                    (frame_doc, child, "body", True)
+                    for child in reversed(get_document(frame_doc)[1][body])
+                )
+                continue
+
+        attributes = nodes["attributes"][index]
+        attrs = "".join(
+            f' {string(attributes[i])}="{html.escape(string(attributes[i + 1]))}"'
+            for i in range(0, len(attributes) - 1, 2)
+        )
+        output.append(f"<{name}{attrs}>")
+        if name in VOID_ELEMENTS:
+            continue
+
+        stack.append(f"</{name}>")
+        child_in_body = in_body or name == "body"
+        stack.extend(
+            (doc_index, child, name, child_in_body)
+            for child in reversed(children[index])
+        )
+
+    return "".join(output)
+
+
+# Attribute set on iframe elements by AsyncPlaywrightCrawlerStrategy.process_iframes
+IFRAME_MARKER_ATTRIBUTE = "data-crawl4ai-iframe"
+# An iframe element carrying the marker. Quoted attribute values may contain ">".
+IFRAME_MARKER_PATTERN = re.compile(
+    r"<iframe\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*?\s"
+    + IFRAME_MARKER_ATTRIBUTE
+    + r"=[\"']?(\d+)[\"']?(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?</iframe\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def merge_iframe_contents(html_content, frame_contents):
+    """
+    Replace marked iframe elements in an HTML document by the content of their frames.
+
+    Each marked iframe becomes a div with the class "extracted-iframe-content-{index}"
+    holding the body of the frame. Frames nested in frames are merged recursively, and
+    iframes whose content was not captured are left as they are.
+
+    Args:
+        html_content (str): The HTML of the main document.
+        frame_contents (Dict[int, str]): The body HTML of each captured frame, by marker index.
+
+    Returns:
+        str: The HTML with the frame contents merged in.
+    """
+    if not frame_contents:
+        return html_content
+
+    def merge(content, ancestors):
+        def replace(match):
+            index = int(match.group(1))
+            # A frame cannot contain itself, guard against reused marker indices
+            if index not in frame_contents or index in ancestors:
+                return match.group(0)
+            body = merge(frame_contents[index], ancestors | {index})
+            return f'<div class="extracted-iframe-content-{index}">{body}</div>'
+
+        return IFRAME_MARKER_PATTERN.sub(replace, content)
+
+    return merge(html_content, frozenset())
+
+
 def normalize_url(href, base_url):
     """Normalize URLs to ensure consistent format"""
     from urllib.parse import urljoin, urlparse
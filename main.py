@@ -1,4 +1,4 @@
-import asyncio, os
+import asyncio, os, re
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,6 +17,8 @@ import logging
 from enum import Enum
 from dataclasses import dataclass
 from crawl4ai import AsyncWebCrawler, CrawlResult, CacheMode, ExtractionOptions
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.artifact_store import artifact_store
 from crawl4ai.config import MIN_WORD_THRESHOLD
 from crawl4ai.extraction_strategy import ExtractionStrategy
 
@@ -54,15 +56,21 @@ class TaskManager:
 class CrawlerService:
     def __init__(self):
         self.task_manager = TaskManager()
-        self.crawler = AsyncWebCrawler()
+        self.crawler = AsyncWebCrawler(
+            config=BrowserConfig(page_pool_size=int(os.getenv("CRAWL4AI_PAGE_POOL_SIZE", "4")))
+        )
 
     async def start(self):
-        """Initialize any required resources"""
-        pass
+        """Launch the shared browser and warm up its context and pages"""
+        await self.crawler.start()
+        await self.crawler.awarmup(
+            configs=[CrawlerRunConfig(cache_mode=CacheMode.MEMORY)],
+            pages_per_context=self.crawler.browser_config.page_pool_size,
+        )
 
     async def stop(self):
         """Cleanup resources"""
-        pass
+        await self.crawler.close()
 
     async def submit_task(self, request: 'CrawlRequest') -> str:
         task_info = self.task_manager.create_task()
@@ -73,35 +81,27 @@ class CrawlerService:
         try:
             task_info.status = TaskStatus.PROCESSING
             try:
-                async with AsyncWebCrawler(
-                    config={
-                        "timeout": 20,  # Shorter timeout
-                        "javascript": True,  # Enable JavaScript
-                        "wait_until": "networkidle",  # Wait for network to be idle
-                        "cache_mode": CacheMode.MEMORY,  # Use memory caching
-                        "max_retries": 2  # Limit retries
-                    }
-                ) as crawler:
-                    try:
-                        result = await asyncio.wait_for(
-                            crawler.arun(
-                                url=request.url,
-                                strategy=ExtractionStrategy(request.strategy),
-                                word_count_threshold=request.word_count_threshold
-                            ),
-                            timeout=20.0
-                        )
-                        
-                        if not result or (isinstance(result, list) and len(result) == 0):
-                            raise Exception("No content extracted from the page")
-                            
-                        task_info.result = result
-                        task_info.status = TaskStatus.COMPLETED
-                        
-                    except asyncio.TimeoutError:
-                        task_info.status = TaskStatus.FAILED
-                        task_info.error = "Crawling timeout: Page took too long to load or process"
+                # Reuse the warmed-up crawler instead of launching a browser per task
+                try:
+                    result = await asyncio.wait_for(
+                        self.crawler.arun(
+                            url=request.url,
+                            strategy=ExtractionStrategy(request.strategy),
+                            word_count_threshold=request.word_count_threshold
+                        ),
+                        timeout=20.0
+                    )
+                    
+                    if not result or (isinstance(result, list) and len(result) == 0):
+                        raise Exception("No content extracted from the page")
                         
+                    task_info.result = result
+                    task_info.status = TaskStatus.COMPLETED
+                    
+                except asyncio.TimeoutError:
+                    task_info.status = TaskStatus.FAILED
+                    task_info.error = "Crawling timeout: Page took too long to load or process"
+                    
             except Exception as e:
                 task_info.status = TaskStatus.FAILED
                 task_info.error = f"Crawler error: {str(e)}"
@@ -205,6 +205,18 @@ async def get_task_status(task_id: str, response: Response):
     
     return response_data
 
+@app.get("/artifacts/{digest}", dependencies=[secure_endpoint()] if CRAWL4AI_API_TOKEN else [])
+async def get_artifact(digest: str, media_type: str = "application/octet-stream"):
+    """Stream a stored screenshot, PDF or download by the digest of its ArtifactHandle"""
+    if not re.fullmatch(r"[0-9a-f]{64}", digest) or not re.fullmatch(r"[\w.+-]+/[\w.+-]+", media_type):
+        raise HTTPException(status_code=400, detail="Invalid artifact request")
+    handle = artifact_store.get(digest)
+    if not handle:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+    # Compressed artifacts are gzip files, serve them as is and let the client inflate
+    headers = {"Content-Encoding": "gzip"} if handle.compressed else None
+    return FileResponse(handle.path, media_type=media_type, headers=headers)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=11235)
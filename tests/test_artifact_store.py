@@ -0,0 +1,34 @@
+import asyncio
+import os
+
+from crawl4ai.artifact_store import ArtifactStore
+
+
+def test_root_is_created_on_first_put(tmp_path):
+    root = tmp_path / "artifacts"
+    store = ArtifactStore(root=str(root))
+    assert not root.exists()
+    assert store.get("0" * 64) is None
+
+    handle = asyncio.run(store.put(b"%PDF-1.4 body", media_type="application/pdf"))
+    assert os.path.isfile(handle.path)
+    assert handle.compressed
+    assert asyncio.run(handle.read()) == b"%PDF-1.4 body"
+
+
+def test_streamed_put_matches_bytes_put(tmp_path):
+    store = ArtifactStore(root=str(tmp_path / "artifacts"))
+
+    async def chunks():
+        yield b"first "
+        yield b"second"
+
+    async def run():
+        streamed = await store.put(chunks(), media_type="image/png")
+        buffered = await store.put(b"first second", media_type="image/png")
+        return streamed, buffered
+
+    streamed, buffered = asyncio.run(run())
+    assert streamed.digest == buffered.digest
+    assert streamed.path == buffered.path
+    assert store.get(streamed.digest).size == len(b"first second")
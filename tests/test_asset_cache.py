@@ -0,0 +1,94 @@
+import asyncio
+
+from crawl4ai import asset_cache
+from crawl4ai.asset_cache import MAX_HEURISTIC_TTL, AssetCache, freshness_lifetime
+
+HEADERS = {"cache-control": "max-age=600", "content-type": "text/css"}
+
+
+def test_store_then_lookup(tmp_path):
+    cache = AssetCache(root=str(tmp_path))
+
+    async def run():
+        stored = await cache.store("https://cdn.test/a.css", {}, 200, HEADERS, b"body{}")
+        return stored, await cache.lookup("https://cdn.test/a.css", {})
+
+    stored, cached = asyncio.run(run())
+    assert stored
+    status, headers, body = cached
+    assert (status, body) == (200, b"body{}")
+    assert headers["content-type"] == "text/css"
+
+
+def test_vary_names_are_bounded_and_reloaded_from_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache, "ASSET_CACHE_VARY_SIZE", 2)
+    cache = AssetCache(root=str(tmp_path))
+    urls = [f"https://cdn.test/{name}.css" for name in "abc"]
+
+    async def run():
+        for url in urls:
+            await cache.store(url, {}, 200, HEADERS, b"body{}")
+        assert list(cache._vary) == urls[1:]
+        return await cache.lookup(urls[0], {})
+
+    assert asyncio.run(run()) is not None
+    assert list(cache._vary) == [urls[2], urls[0]]
+
+
+def test_freshness_lifetime_prefers_s_maxage_and_deducts_age():
+    headers = {"cache-control": "public, max-age=60, s-maxage=300", "age": "100"}
+    assert freshness_lifetime(headers) == 200
+
+
+def test_freshness_lifetime_from_expires_and_last_modified():
+    date = "Sun, 18 Oct 2026 12:00:00 GMT"
+    expires = {"date": date, "expires": "Sun, 18 Oct 2026 12:10:00 GMT"}
+    assert freshness_lifetime(expires) == 600
+    assert freshness_lifetime({"date": date, "expires": "0"}) == 0
+
+    # 10% of the time since the last modification, capped at a day
+    modified = {"date": date, "last-modified": "Sun, 18 Oct 2026 11:00:00 GMT"}
+    assert freshness_lifetime(modified) == 360
+    old = {"date": date, "last-modified": "Sun, 18 Oct 2020 12:00:00 GMT"}
+    assert freshness_lifetime(old) == MAX_HEURISTIC_TTL
+    assert freshness_lifetime({}) == 0
+
+
+def test_store_refuses_what_a_shared_cache_must_not_keep(tmp_path):
+    cache = AssetCache(root=str(tmp_path))
+    url = "https://cdn.test/a.js"
+    refused = [
+        ({}, 404, HEADERS),
+        ({"authorization": "Bearer x"}, 200, HEADERS),
+        ({}, 200, {**HEADERS, "set-cookie": "id=1"}),
+        ({}, 200, {"cache-control": "private, max-age=600"}),
+        ({}, 200, {"cache-control": "no-store"}),
+        ({}, 200, {**HEADERS, "vary": "*"}),
+        ({}, 200, {"content-type": "text/css"}),
+    ]
+
+    async def run():
+        return [
+            await cache.store(url, request_headers, status, headers, b"x")
+            for request_headers, status, headers in refused
+        ]
+
+    assert asyncio.run(run()) == [False] * len(refused)
+    assert cache.stats["stored"] == 0
+
+
+def test_vary_selects_the_variant(tmp_path):
+    cache = AssetCache(root=str(tmp_path))
+    url = "https://cdn.test/font.woff2"
+    headers = {**HEADERS, "vary": "Accept-Encoding"}
+
+    async def run():
+        await cache.store(url, {"accept-encoding": "br"}, 200, headers, b"brotli")
+        return (
+            await cache.lookup(url, {"accept-encoding": "br"}),
+            await cache.lookup(url, {"accept-encoding": "gzip"}),
+        )
+
+    matching, other = asyncio.run(run())
+    assert matching[2] == b"brotli"
+    assert other is None
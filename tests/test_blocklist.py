@@ -0,0 +1,86 @@
+from crawl4ai.blocklist import Blocklist, DomainTrie
+
+
+def test_domain_trie_matches_subdomains():
+    trie = DomainTrie()
+    trie.add("ads.example.com")
+    assert trie.match("ads.example.com")
+    assert trie.match("cdn.ads.example.com")
+    assert not trie.match("example.com")
+    assert not trie.match("badads.example.com")
+
+
+def test_hosts_entries():
+    blocklist = Blocklist(["0.0.0.0 tracker.test", "127.0.0.1 localhost", "# comment"])
+    assert blocklist.should_block("https://tracker.test/pixel.gif")
+    assert blocklist.should_block("https://www.tracker.test/")
+    assert not blocklist.should_block("http://localhost/")
+
+
+def test_domain_anchor_and_exception():
+    blocklist = Blocklist(["||ads.example.com^", "@@||ads.example.com/allowed/*"])
+    assert blocklist.should_block("https://ads.example.com/banner.js")
+    assert not blocklist.should_block("https://ads.example.com/allowed/ok.js")
+    assert not blocklist.should_block("https://example.com/")
+
+
+def test_wildcard_and_separator():
+    blocklist = Blocklist(["/banner/*/img^"])
+    assert blocklist.should_block("https://example.com/banner/foo/img?x=1")
+    assert not blocklist.should_block("https://example.com/banner/foo/imgs")
+
+
+def test_resource_type_options():
+    blocklist = Blocklist(["||cdn.test^$script", "/track.$~image"])
+    assert blocklist.should_block("https://cdn.test/a.js", resource_type="script")
+    assert not blocklist.should_block("https://cdn.test/a.png", resource_type="image")
+    assert blocklist.should_block("https://x.test/track.js", resource_type="script")
+    assert not blocklist.should_block("https://x.test/track.gif", resource_type="image")
+
+
+def test_domain_option():
+    blocklist = Blocklist(["/widget.js$domain=news.test|~sports.news.test"])
+    url = "https://cdn.test/widget.js"
+    assert blocklist.should_block(url, page_url="https://news.test/")
+    assert not blocklist.should_block(url, page_url="https://sports.news.test/")
+    assert not blocklist.should_block(url, page_url="https://other.test/")
+
+
+def test_unsupported_options_and_cosmetic_rules_are_skipped():
+    blocklist = Blocklist(["||ads.test^$redirect=noop.js", "example.com##.ad"])
+    assert blocklist.rule_count == 0
+
+
+def test_regex_rule_keeps_escape_case():
+    # \D must stay "not a digit", lowercasing would turn it into \d
+    blocklist = Blocklist([r"/\/ad\D+\.js/"])
+    assert blocklist.should_block("https://example.com/adbanner.js")
+    assert not blocklist.should_block("https://example.com/ad123.js")
+
+
+def test_regex_rule_is_case_insensitive():
+    blocklist = Blocklist([r"/\/[A-Z]+-tracker\.js/"])
+    assert blocklist.should_block("https://example.com/Site-Tracker.js")
+
+
+def test_regex_rule_options_are_split_off():
+    blocklist = Blocklist([r"/\/pixel\d+\.gif/$image,third-party"])
+    url = "https://cdn.test/pixel42.gif"
+    assert blocklist.should_block(url, resource_type="image", third_party=True)
+    assert not blocklist.should_block(url, resource_type="script", third_party=True)
+    assert not blocklist.should_block(url, resource_type="image", third_party=False)
+
+
+def test_regex_rule_end_anchor_is_not_an_option():
+    blocklist = Blocklist([r"/\.gif$/"])
+    assert blocklist.should_block("https://example.com/a.gif")
+    assert not blocklist.should_block("https://example.com/a.gif?x=1")
+
+
+def test_unknown_third_party_skips_restricted_rules():
+    blocklist = Blocklist(["||tracker.test/collect$third-party", "/firstonly.$first-party"])
+    assert blocklist.should_block("https://tracker.test/collect", third_party=True)
+    assert not blocklist.should_block("https://tracker.test/collect", third_party=False)
+    assert not blocklist.should_block("https://tracker.test/collect", third_party=None)
+    assert blocklist.should_block("https://x.test/firstonly.js", third_party=False)
+    assert not blocklist.should_block("https://x.test/firstonly.js", third_party=None)
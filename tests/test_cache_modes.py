@@ -0,0 +1,80 @@
+import asyncio
+
+from crawl4ai import async_webcrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.models import AsyncCrawlResponse
+
+URL = "https://example.com/article"
+PAGE = "<html><body><h1>Title</h1><p>Full page body</p></body></html>"
+
+
+class FakeStrategy(AsyncCrawlerStrategy):
+    """Answers like the Playwright strategy would for full and text output."""
+
+    def __init__(self):
+        self.calls = []
+        self.logger = None
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.calls.append(config.output_mode)
+        if config.output_mode == "text":
+            return AsyncCrawlResponse(
+                html="<html><body></body></html>",
+                response_headers={},
+                status_code=200,
+                text="# Title\n\nText mode body",
+                cacheable=False,
+            )
+        return AsyncCrawlResponse(html=PAGE, response_headers={}, status_code=200)
+
+
+class MemoryCache:
+    def __init__(self):
+        self.results = {}
+
+    async def aget_cached_url(self, url):
+        return self.results.get(url)
+
+    async def acache_url(self, result):
+        self.results[result.url] = result
+
+
+def crawl_twice(tmp_path, monkeypatch, first_mode, second_mode):
+    cache = MemoryCache()
+    monkeypatch.setattr(async_webcrawler, "async_db_manager", cache)
+    strategy = FakeStrategy()
+    crawler = AsyncWebCrawler(crawler_strategy=strategy, base_directory=str(tmp_path))
+
+    async def run():
+        results = []
+        for mode in (first_mode, second_mode):
+            config = CrawlerRunConfig(output_mode=mode, cache_mode=CacheMode.ENABLED)
+            results.append(await crawler.arun(URL, config=config))
+        return results
+
+    return asyncio.run(run()), strategy, cache
+
+
+def test_text_after_full_ignores_cached_page(tmp_path, monkeypatch):
+    (full, text), strategy, cache = crawl_twice(tmp_path, monkeypatch, "full", "text")
+    assert strategy.calls == ["full", "text"]
+    assert "Full page body" in full.markdown
+    assert text.markdown == "# Title\n\nText mode body"
+    assert cache.results[URL].html == PAGE
+
+
+def test_full_after_text_is_not_served_text(tmp_path, monkeypatch):
+    (text, full), strategy, cache = crawl_twice(tmp_path, monkeypatch, "text", "full")
+    assert strategy.calls == ["text", "full"]
+    assert text.markdown == "# Title\n\nText mode body"
+    assert "Full page body" in full.markdown
+    assert cache.results[URL].html == PAGE
+
+
+def test_full_after_full_reads_cache(tmp_path, monkeypatch):
+    (_, second), strategy, _ = crawl_twice(tmp_path, monkeypatch, "full", "full")
+    assert strategy.calls == ["full"]
+    assert "Full page body" in second.html
@@ -0,0 +1,87 @@
+import asyncio
+
+from crawl4ai.content_processors import (
+    is_html_path,
+    process_content,
+    process_csv,
+    process_xml,
+    sniff_kind,
+)
+
+
+def test_sniff_kind_trusts_declared_types():
+    assert sniff_kind("text/html; charset=utf-8", b"") == "html"
+    assert sniff_kind("application/ld+json", b"") == "json"
+    assert sniff_kind("application/atom+xml", b"") == "xml"
+    assert sniff_kind("text/csv", b"") == "csv"
+    assert sniff_kind("application/pdf", b"") == "pdf"
+
+
+def test_sniff_kind_checks_generic_types_against_the_body():
+    assert sniff_kind("application/octet-stream", b"%PDF-1.7\n") == "pdf"
+    assert sniff_kind("text/plain", b"\xef\xbb\xbf  <!DOCTYPE html><html>") == "html"
+    assert sniff_kind(None, b"<?xml version='1.0'?><rss/>") == "xml"
+    assert sniff_kind("text/plain", b"just some words") == "text"
+    assert sniff_kind(None, b"\x00\x01binary") is None
+
+
+def test_is_html_path():
+    assert is_html_path("https://example.com/index.PHP?page=2")
+    assert not is_html_path("https://example.com/data.json")
+    assert not is_html_path("https://example.com/articles/")
+
+
+def test_process_rss_feed():
+    body = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>News</title>
+      <item><title>First</title><link>https://news.test/1</link>
+        <description>&lt;p&gt;Hello &lt;b&gt;world&lt;/b&gt;&lt;/p&gt;</description></item>
+      <item><title>Second</title><guid>2</guid></item>
+    </channel></rss>"""
+    text, items = process_xml(body, "utf-8")
+    assert items == [
+        {"title": "First", "link": "https://news.test/1", "description": "Hello world"},
+        {"title": "Second", "id": "2"},
+    ]
+    assert text.startswith("# News")
+    assert "## [First](https://news.test/1)" in text
+
+
+def test_process_atom_feed():
+    body = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>Blog</title>
+      <entry><title>Post</title><link rel="alternate" href="https://blog.test/post"/>
+        <summary>Short</summary><updated>2026-10-18T00:00:00Z</updated></entry>
+    </feed>"""
+    _, items = process_xml(body, "utf-8")
+    assert items == [
+        {
+            "title": "Post",
+            "link": "https://blog.test/post",
+            "description": "Short",
+            "published": "2026-10-18T00:00:00Z",
+        }
+    ]
+
+
+def test_process_plain_xml_returns_text():
+    text, items = process_xml(b"<doc><a>one</a><b>two</b></doc>", "utf-8")
+    assert (text, items) == ("one\ntwo", None)
+
+
+def test_process_csv_sniffs_the_delimiter():
+    body = "\ufeffname;price\nTea|Pot;3\nCup;1\n".encode("utf-8")
+    text, items = process_csv(body, "utf-8")
+    assert items == [{"name": "Tea|Pot", "price": "3"}, {"name": "Cup", "price": "1"}]
+    assert text.splitlines() == [
+        "| name | price |",
+        "| --- | --- |",
+        "| Tea\\|Pot | 3 |",
+        "| Cup | 1 |",
+    ]
+    assert process_csv(b"", "utf-8") == ("", [])
+
+
+def test_process_content_json():
+    text, items = asyncio.run(process_content("json", b'{"a": [1, 2]}'))
+    assert items == {"a": [1, 2]}
+    assert text.startswith("```json")
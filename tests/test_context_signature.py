@@ -0,0 +1,153 @@
+import asyncio
+
+from crawl4ai.async_configs import (
+    BrowserConfig,
+    CrawlerRunConfig,
+    CONTEXT_SIGNATURE_FIELDS,
+)
+from crawl4ai.async_crawler_strategy import BrowserManager
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+
+def make_manager(**browser_kwargs):
+    """A BrowserManager whose contexts are stubs, no browser is launched."""
+    manager = BrowserManager(BrowserConfig(**browser_kwargs))
+    created = []
+
+    async def create_browser_context(crawlerRunConfig=None):
+        context = FakeContext()
+        created.append(context)
+        return context
+
+    async def setup_context(context, crawlerRunConfig=None, is_default=False):
+        pass
+
+    manager.create_browser_context = create_browser_context
+    manager.setup_context = setup_context
+    return manager, created
+
+
+def test_non_context_fields_share_signature():
+    base = CrawlerRunConfig()
+    variants = [
+        CrawlerRunConfig(word_count_threshold=50),
+        CrawlerRunConfig(screenshot=True),
+        CrawlerRunConfig(markdown_generator=DefaultMarkdownGenerator()),
+        CrawlerRunConfig(word_count_threshold=1, screenshot=True, pdf=True),
+    ]
+    for config in variants:
+        assert config.context_signature() == base.context_signature()
+
+
+def test_context_fields_change_signature():
+    base = CrawlerRunConfig()
+    assert CrawlerRunConfig(magic=True).context_signature() != base.context_signature()
+    assert (
+        CrawlerRunConfig(proxy_config={"server": "http://proxy:8080"}).context_signature()
+        != base.context_signature()
+    )
+
+
+def test_assigning_signature_field_invalidates_memo():
+    for name in CONTEXT_SIGNATURE_FIELDS:
+        config = CrawlerRunConfig()
+        before = config.context_signature()
+        setattr(config, name, "changed")
+        assert config.context_signature() != before, name
+
+
+def test_assigning_other_field_keeps_memo():
+    config = CrawlerRunConfig()
+    before = config.context_signature()
+    config.word_count_threshold = 100
+    config.screenshot = True
+    assert config.__dict__["_context_signature"] == before
+    assert config.context_signature() == before
+
+
+def test_get_page_reuses_context_for_equivalent_configs():
+    async def run():
+        manager, created = make_manager()
+        configs = [
+            CrawlerRunConfig(),
+            CrawlerRunConfig(word_count_threshold=50),
+            CrawlerRunConfig(screenshot=True),
+            CrawlerRunConfig(markdown_generator=DefaultMarkdownGenerator()),
+        ]
+        contexts = []
+        for config in configs:
+            page, context = await manager.get_page(config)
+            contexts.append(context)
+            await manager.release_page(page, context)
+
+        assert len(created) == 1
+        assert all(context is created[0] for context in contexts)
+        assert manager.context_stats["created"] == 1
+        assert manager.context_stats["hits"] == len(configs) - 1
+
+        page, context = await manager.get_page(CrawlerRunConfig(magic=True))
+        assert context is not created[0]
+        assert len(created) == 2
+
+    asyncio.run(run())
+
+
+def test_idle_context_is_closed_after_ttl_without_further_crawls():
+    async def run():
+        manager, created = make_manager(context_ttl=0.05)
+        page, context = await manager.get_page(CrawlerRunConfig())
+        await asyncio.sleep(0.1)
+        assert not context.closed  # still in use
+
+        await manager.release_page(page, context)
+        await asyncio.sleep(0.2)
+        assert context.closed
+        assert manager.contexts_by_config == {}
+        assert manager.context_stats["expired"] == 1
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_max_sessions_skips_sessions_in_use():
+    async def run():
+        manager, _ = make_manager(max_sessions=2)
+        busy, _ = await manager.get_page(CrawlerRunConfig(session_id="busy"))
+        await manager.get_page(CrawlerRunConfig(session_id="idle"))
+        manager.release_session("idle")
+
+        await manager.get_page(CrawlerRunConfig(session_id="new"))
+        assert list(manager.sessions) == ["busy", "new"]
+        assert manager.sessions["busy"][1] is busy
+
+        # Every session is in use, so the next one waits for a release
+        waiter = asyncio.create_task(
+            manager.get_page(CrawlerRunConfig(session_id="third"))
+        )
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        manager.release_session("busy")
+        await asyncio.wait_for(waiter, timeout=1)
+        assert list(manager.sessions) == ["new", "third"]
+        await manager.close()
+
+    asyncio.run(run())
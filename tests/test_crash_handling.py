@@ -0,0 +1,59 @@
+import time
+
+from playwright.async_api import Error
+
+from crawl4ai import async_crawler_strategy
+from crawl4ai.async_crawler_strategy import (
+    TARGET_CLOSED_MESSAGE,
+    BrowserCrashError,
+    CrashCircuitBreaker,
+    is_browser_crash,
+)
+
+
+def target_closed_error():
+    if async_crawler_strategy.TargetClosedError is not None:
+        return async_crawler_strategy.TargetClosedError()
+    return Error(TARGET_CLOSED_MESSAGE)
+
+
+def test_breaker_opens_after_max_crashes_in_window():
+    breaker = CrashCircuitBreaker(max_crashes=2, window=0.1)
+    breaker.record()
+    assert not breaker.is_open
+    breaker.record()
+    assert breaker.is_open
+    assert breaker.recent == 2
+
+    time.sleep(0.15)
+    assert not breaker.is_open
+    assert breaker.recent == 0
+    assert breaker.total == 2
+
+
+def test_breaker_without_limit_never_opens():
+    breaker = CrashCircuitBreaker(max_crashes=0, window=60)
+    for _ in range(10):
+        breaker.record()
+    assert not breaker.is_open
+
+
+def test_crash_errors_are_recognised():
+    assert is_browser_crash(BrowserCrashError("renderer gone"))
+    assert is_browser_crash(target_closed_error())
+
+
+def test_crash_is_found_in_the_cause_chain():
+    try:
+        try:
+            raise target_closed_error()
+        except Exception as e:
+            raise RuntimeError("Failed on navigating ACS-GOTO") from e
+    except RuntimeError as wrapped:
+        assert is_browser_crash(wrapped)
+
+
+def test_messages_alone_do_not_count_as_crashes():
+    assert not is_browser_crash(RuntimeError(TARGET_CLOSED_MESSAGE))
+    assert not is_browser_crash(Error("Timeout 30000ms exceeded"))
+    assert not is_browser_crash(ValueError("page crashed"))
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.async_logger import AsyncLogger
+
+BODIES = {
+    "/docs/a": ("text/html", b"<html><body>a</body></html>"),
+    "/docs/b": ("text/html", b"<html><body>b</body></html>"),
+    "/docs/data.json": ("application/json", b'{"items": [1, 2]}'),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+
+    def _respond(self, send_body):
+        self.requests.append((self.command, self.path))
+        content_type, body = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_html_prefix_skips_later_probes(server):
+    strategy = AsyncPlaywrightCrawlerStrategy(
+        browser_config=BrowserConfig(), logger=AsyncLogger(verbose=False)
+    )
+    config = CrawlerRunConfig(direct_fetch_non_html=True)
+
+    async def run():
+        first = await strategy._fetch_non_html(f"{server}/docs/a", config)
+        second = await strategy._fetch_non_html(f"{server}/docs/b", config)
+        data = await strategy._fetch_non_html(f"{server}/docs/data.json", config)
+        return first, second, data
+
+    first, second, data = asyncio.run(run())
+    assert first is None and second is None
+    assert data is not None and data.extracted_items is not None
+    # /docs/b is not probed, the JSON URL is despite sharing the prefix
+    assert Handler.requests == [
+        ("HEAD", "/docs/a"),
+        ("HEAD", "/docs/data.json"),
+        ("GET", "/docs/data.json"),
+    ]
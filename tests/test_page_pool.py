@@ -0,0 +1,74 @@
+import asyncio
+
+from crawl4ai.async_crawler_strategy import PagePool
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+        self.routes = ["**/*.png"]
+        self.viewport_size = {"width": 800, "height": 600}
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, script):
+        pass
+
+    async def goto(self, url):
+        pass
+
+    async def unroute_all(self, behavior=None):
+        self.routes = []
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+    async def set_viewport_size(self, viewport):
+        self.viewport_size = viewport
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+
+def test_released_page_is_reused_without_routes():
+    async def run():
+        pool = PagePool(FakeContext(), max_size=2, max_uses=10)
+        page = await pool.acquire()
+        await pool.release(page)
+        assert page.routes == []
+        assert await pool.acquire() is page
+        assert pool.stats == {"hits": 1, "misses": 1, "recycled": 0}
+
+    asyncio.run(run())
+
+
+def test_pages_are_recycled_after_max_uses():
+    async def run():
+        pool = PagePool(FakeContext(), max_size=2, max_uses=2)
+        page = await pool.acquire()
+        await pool.release(page)
+        assert await pool.acquire() is page
+        await pool.release(page)
+        assert page.closed
+        assert await pool.acquire() is not page
+        assert pool.stats == {"hits": 1, "misses": 2, "recycled": 1}
+
+    asyncio.run(run())
+
+
+def test_shared_stats():
+    async def run():
+        stats = {"hits": 0, "misses": 0, "recycled": 0}
+        first = PagePool(FakeContext(), stats=stats)
+        second = PagePool(FakeContext(), stats=stats)
+        await first.acquire()
+        await second.acquire()
+        assert stats["misses"] == 2
+
+    asyncio.run(run())
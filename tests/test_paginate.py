@@ -0,0 +1,80 @@
+import asyncio
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.models import AsyncCrawlResponse
+
+
+class FakePaginatingStrategy(AsyncCrawlerStrategy):
+    """Yields canned pagination states instead of driving a browser."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.logger = None
+
+    async def crawl(self, url, **kwargs):
+        raise NotImplementedError
+
+    async def paginate(self, url, config, **kwargs):
+        for response in self.responses:
+            yield response
+
+
+def state(html, status_code=200, error_message=None):
+    return AsyncCrawlResponse(
+        html=f"<html><body>{html}</body></html>",
+        response_headers={},
+        status_code=status_code,
+        redirected_url="https://example.com/list",
+        error_message=error_message,
+    )
+
+
+def run_paginated(tmp_path, responses):
+    crawler = AsyncWebCrawler(
+        crawler_strategy=FakePaginatingStrategy(responses), base_directory=str(tmp_path)
+    )
+    return asyncio.run(
+        crawler.arun_paginated(
+            "https://example.com/list",
+            next_action="a.next",
+            item_selector=".item",
+            config=CrawlerRunConfig(),
+        )
+    )
+
+
+def test_states_with_items_succeed(tmp_path):
+    results = run_paginated(
+        tmp_path,
+        [state("<div class='item'>One</div>"), state("<div class='item'>Two</div>")],
+    )
+    assert [result.success for result in results] == [True, True]
+    assert all(result.error_message is None for result in results)
+
+
+def test_missing_container_is_a_failure(tmp_path):
+    results = run_paginated(
+        tmp_path,
+        [state("", error_message="Pagination container not found: #list")],
+    )
+    assert len(results) == 1
+    assert results[0].success is False
+    assert "not found" in results[0].error_message
+
+
+def test_unchanged_container_fails_only_that_state(tmp_path):
+    results = run_paginated(
+        tmp_path,
+        [
+            state("<div class='item'>One</div>"),
+            state("", error_message="Pagination container did not change within 10000ms"),
+        ],
+    )
+    assert [result.success for result in results] == [True, False]
+
+
+def test_error_status_is_a_failure(tmp_path):
+    results = run_paginated(tmp_path, [state("<div class='item'>One</div>", status_code=503)])
+    assert results[0].success is False